@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict, deque
+from contextlib import asynccontextmanager
 from enum import Enum
 from threading import Lock
 from time import time
@@ -9,15 +10,18 @@ from typing import Any, Dict, List, Optional
 
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src import config
+from src import ml_engine
 from src import static_pipeline
 from src.auto_fix import AutoFixer
 from src.ml_engine import get_model_status
 from src.quality_analyzer import CodeQualityAnalyzer
+from src.serialization import dumps_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,6 +52,26 @@ def _get_max_code_size() -> int:
     return config.get_max_code_size()
 
 
+def _analysis_budget() -> Optional[static_pipeline.AnalysisBudget]:
+    """Per-request analysis limits from the environment; None when none are set.
+
+    Read once at startup (``_ANALYSIS_BUDGET``), so a malformed or negative
+    value stops the server from starting instead of failing every request.
+    """
+    budget = static_pipeline.AnalysisBudget(
+        max_seconds=config.get_analysis_time_budget(),
+        stage_seconds=config.get_analysis_stage_budget(),
+        max_nodes=config.get_analysis_node_budget(),
+    )
+    if budget == static_pipeline.AnalysisBudget():
+        return None
+    return budget
+
+
+_ANALYSIS_BUDGET = _analysis_budget()
+_MODEL_RELOAD_INTERVAL = config.get_model_reload_interval()
+
+
 def _get_rate_limit_per_minute() -> int:
     return config.get_rate_limit_per_minute()
 
@@ -76,6 +100,15 @@ def _raise_api_error(status_code: int, error_code: str, message: str) -> None:
     )
 
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Encode a payload that already matches its response model in one pass.
+
+    Multi-error results can carry thousands of issue dicts; copying them through
+    a pydantic model only to serialize them again doubles the work.
+    """
+    return Response(content=dumps_json(payload), media_type="application/json")
+
+
 def _validate_code_payload(code: str, field_name: str = "code") -> None:
     max_size = _get_max_code_size()
     if not code or not code.strip():
@@ -279,8 +312,8 @@ def _verify_fix_result(
     filename: str | None,
     expected_original_error: str | None = None,
 ) -> "FixVerificationSummary":
-    original_result = static_pipeline.analyze_source(original_code, filename, language).to_single_result()
-    result_result = static_pipeline.analyze_source(fixed_code, filename, language).to_single_result()
+    original_result = static_pipeline.analyze_source(original_code, filename, language, budget=_ANALYSIS_BUDGET).to_single_result()
+    result_result = static_pipeline.analyze_source(fixed_code, filename, language, budget=_ANALYSIS_BUDGET).to_single_result()
     original_error = expected_original_error or original_result["predicted_error"]
     result_error = result_result["predicted_error"]
     status = _resolve_verification_status(original_error, result_error)
@@ -296,7 +329,20 @@ def _verify_fix_result(
     )
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    interval = _MODEL_RELOAD_INTERVAL
+    if interval:
+        ml_engine.start_model_watcher(interval)
+        logger.info("Watching %s for new model bundles every %ss", ml_engine.MODEL_DIR, interval)
+    try:
+        yield
+    finally:
+        ml_engine.stop_model_watcher()
+
+
 app = FastAPI(
+    lifespan=_lifespan,
     title="OmniSyntax API",
     description="AI-powered multi-language syntax error detection and auto-fix API",
     version=_API_VERSION,
@@ -366,6 +412,21 @@ class AutoFixRequest(BaseModel):
         return _normalize_fix_type(value)
 
 
+class AnalyzeRequest(CodeCheckRequest):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "code": "def test()\n    pass",
+                "filename": "test.py",
+                "language": "Python",
+                "include_fix_preview": True,
+            }
+        }
+    )
+
+    include_fix_preview: bool = Field(False, description="Also return line-level patch previews for the detected issues")
+
+
 class QualityCheckRequest(BaseModel):
     model_config = ConfigDict(
         json_schema_extra={
@@ -434,6 +495,7 @@ class ErrorResponse(BaseModel):
     has_errors: bool
     degraded_mode: bool = False
     warnings: List[str] = Field(default_factory=list)
+    truncated: Optional[Dict[str, Any]] = None
 
 
 class FixVerificationSummary(BaseModel):
@@ -469,6 +531,19 @@ class QualityResponse(BaseModel):
     suggestions: List[str]
 
 
+class FixPreviewLine(BaseModel):
+    line: int
+    kind: str
+    replacement: str
+    original: Optional[str] = None
+
+
+class AnalyzeResponse(BaseModel):
+    error_detection: ErrorResponse
+    quality: Optional[QualityResponse] = None
+    fix_preview: Optional[List[FixPreviewLine]] = None
+
+
 class HealthResponse(BaseModel):
     status: str
     version: str
@@ -492,6 +567,12 @@ class ReadinessResponse(BaseModel):
     reason: Optional[str] = None
 
 
+class ModelReloadResponse(BaseModel):
+    reloaded: bool
+    version: Optional[int] = None
+    error: Optional[str] = None
+
+
 class CapabilitiesResponse(BaseModel):
     status: str
     ml_model_loaded: bool
@@ -572,6 +653,28 @@ async def health_check():
     }
 
 
+async def reload_model(http_request: Request):
+    _enforce_api_auth(http_request)
+    _enforce_rate_limit(http_request, "admin")
+    # Loading and smoke-testing run off the event loop; requests keep being served by the current bundle.
+    result = await run_in_threadpool(ml_engine.reload_model_bundle)
+    if not result["reloaded"]:
+        _raise_api_error(409, "MODEL_RELOAD_REJECTED", result["error"])
+    return result
+
+
+# A reload re-hashes and loads the whole bundle, so it is never open to anonymous callers:
+# without API keys the route does not exist (the MODEL_RELOAD_INTERVAL_SECONDS watcher still works).
+if config.get_api_auth_mode() == "api_key":
+    app.add_api_route(
+        "/admin/reload-model",
+        reload_model,
+        methods=["POST"],
+        response_model=ModelReloadResponse,
+        tags=["Admin"],
+    )
+
+
 @app.post("/check", response_model=ErrorResponse, tags=["Error Detection"])
 async def check_code(http_request: Request, request: CodeCheckRequest):
     _enforce_api_auth(http_request)
@@ -580,16 +683,19 @@ async def check_code(http_request: Request, request: CodeCheckRequest):
 
     try:
         language = request.language.value if request.language else None
-        result = static_pipeline.analyze_source(request.code, request.filename, language).to_single_result()
-        return ErrorResponse(
-            language=result["language"],
-            predicted_error=result["predicted_error"],
-            confidence=result["confidence"],
-            tutor=result["tutor"],
-            rule_based_issues=result.get("rule_based_issues", []),
-            has_errors=result["predicted_error"] != "NoError",
-            degraded_mode=result.get("degraded_mode", False),
-            warnings=result.get("warnings", []),
+        result = static_pipeline.analyze_source(request.code, request.filename, language, budget=_ANALYSIS_BUDGET).to_single_result()
+        return _json_response(
+            {
+                "language": result["language"],
+                "predicted_error": result["predicted_error"],
+                "confidence": result["confidence"],
+                "tutor": result["tutor"],
+                "rule_based_issues": result["rule_based_issues"],
+                "has_errors": result["predicted_error"] != "NoError",
+                "degraded_mode": result["degraded_mode"],
+                "warnings": result["warnings"],
+                "truncated": result["truncated"],
+            }
         )
     except HTTPException:
         raise
@@ -687,6 +793,54 @@ async def analyze_quality(http_request: Request, request: QualityCheckRequest):
         _raise_api_error(500, "INTERNAL_ERROR", "Unexpected error while analyzing quality")
 
 
+@app.post("/analyze", response_model=AnalyzeResponse, tags=["Combined"])
+async def analyze_code(http_request: Request, request: AnalyzeRequest):
+    _enforce_api_auth(http_request)
+    _enforce_rate_limit(http_request, "analyze")
+    _validate_code_payload(request.code)
+
+    try:
+        language = request.language.value if request.language else None
+        result = static_pipeline.analyze_submission(
+            request.code,
+            request.filename,
+            language,
+            fix_preview=request.include_fix_preview,
+            budget=_ANALYSIS_BUDGET,
+        )
+        detection = result["detection"]
+        quality = result["quality"]
+        return _json_response(
+            {
+                "error_detection": {
+                    "language": detection["language"],
+                    "predicted_error": detection["predicted_error"],
+                    "confidence": detection["confidence"],
+                    "tutor": detection["tutor"],
+                    "rule_based_issues": detection["rule_based_issues"],
+                    "has_errors": detection["predicted_error"] != "NoError",
+                    "degraded_mode": detection["degraded_mode"],
+                    "warnings": detection["warnings"],
+                    "truncated": detection["truncated"],
+                },
+                "quality": {
+                    "line_counts": quality["line_counts"],
+                    "complexity": quality["complexity"],
+                    "comment_ratio": quality["comment_ratio"],
+                    "avg_line_length": quality["avg_line_length"],
+                    "quality_score": quality["quality_score"],
+                    "suggestions": quality["suggestions"],
+                } if quality is not None else None,
+                "fix_preview": result["fix_preview"],
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception:  # noqa: BLE001
+        logger.exception("Unhandled exception in /analyze")
+        _raise_api_error(500, "INTERNAL_ERROR", "Unexpected error while analyzing code")
+
+
 @app.post("/check-and-fix", response_model=CheckAndFixResponse, tags=["Combined"])
 async def check_and_fix(http_request: Request, request: CodeCheckRequest):
     _enforce_api_auth(http_request)
@@ -695,7 +849,7 @@ async def check_and_fix(http_request: Request, request: CodeCheckRequest):
 
     try:
         language = request.language.value if request.language else None
-        error_result = static_pipeline.analyze_source(request.code, request.filename, language).to_single_result()
+        error_result = static_pipeline.analyze_source(request.code, request.filename, language, budget=_ANALYSIS_BUDGET).to_single_result()
         fix_response = None
         if error_result["predicted_error"] != "NoError":
             fixer = AutoFixer()
@@ -762,6 +916,7 @@ async def check_and_fix(http_request: Request, request: CodeCheckRequest):
                 has_errors=error_result["predicted_error"] != "NoError",
                 degraded_mode=error_result.get("degraded_mode", False),
                 warnings=error_result.get("warnings", []),
+                truncated=error_result.get("truncated"),
             ),
             auto_fix=fix_response,
             has_errors=error_result["predicted_error"] != "NoError",
@@ -5,49 +5,80 @@
 
 import sys
 import io
-
-# Fix Unicode encoding on Windows (emojis crash with cp1252)
-if sys.stdout.encoding != 'utf-8':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+import json
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Dict, List, Optional, TextIO
 
 from src import static_pipeline
 from src.auto_fix import AutoFixer
 from src.quality_analyzer import CodeQualityAnalyzer
 
 
-def print_usage():
-    print("Usage:")
-    print("  python cli.py <path_to_code_file> [OPTIONS]")
-    print("\nOptions:")
-    print("  --all-errors     Show all detected errors (default: first error only)")
-    print("\nExample:")
-    print("  python cli.py test.java")
-    print("  python cli.py test.py --all-errors")
+@dataclass
+class CliResult:
+    """One CLI run: exit code, the structured results and the report text it printed."""
+    exit_code: int
+    output: str
+    file_path: Optional[str] = None
+    language: Optional[str] = None
+    predicted_error: Optional[str] = None
+    detection: Optional[Dict[str, Any]] = None
+    fix: Optional[Dict[str, Any]] = None
+    quality: Optional[Dict[str, Any]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def print_usage(out: Optional[TextIO] = None):
+    out = out or sys.stdout
+    print("Usage:", file=out)
+    print("  python cli.py <path_to_code_file> [OPTIONS]", file=out)
+    print("  python cli.py --serve", file=out)
+    print("\nOptions:", file=out)
+    print("  --all-errors     Show all detected errors (default: first error only)", file=out)
+    print("  --serve          Persistent worker: one JSON request per stdin line, one JSON result per stdout line", file=out)
+    print("\nExample:", file=out)
+    print("  python cli.py test.java", file=out)
+    print("  python cli.py test.py --all-errors", file=out)
+
+
+def run_cli(args: List[str], code: Optional[str] = None) -> CliResult:
+    """
+    Run the CLI in-process on ``args`` (without the program name).
+
+    When ``code`` is given it is analyzed in place of reading the file, and
+    the path argument only names it (its extension still drives language
+    detection). Nothing is printed; the report is returned in ``output``.
+    """
+    buffer = io.StringIO()
+    write = partial(print, file=buffer)
 
-def main():
     # --------------------------------------------------------
     # 1. Argument Check
     # --------------------------------------------------------
-    if len(sys.argv) < 2:
-        print_usage()
-        sys.exit(1)
+    if len(args) < 1:
+        print_usage(buffer)
+        return CliResult(exit_code=1, output=buffer.getvalue())
 
-    file_path = sys.argv[1]
-    show_all_errors = "--all-errors" in sys.argv
+    file_path = args[0]
+    show_all_errors = "--all-errors" in args
     
     # --------------------------------------------------------
     # 2. Read Code File
     # --------------------------------------------------------
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            code = f.read()
+        if code is None:
+            with open(file_path, "r", encoding="utf-8") as f:
+                code = f.read()
     except FileNotFoundError:
-        print(f"âŒ File not found: {file_path}")
-        sys.exit(1)
+        write(f"âŒ File not found: {file_path}")
+        return CliResult(exit_code=1, output=buffer.getvalue(), file_path=file_path)
     except Exception as e:
-        print(f"âŒ Error reading file: {e}")
-        sys.exit(1)
+        write(f"âŒ Error reading file: {e}")
+        return CliResult(exit_code=1, output=buffer.getvalue(), file_path=file_path)
 
     # --------------------------------------------------------
     # 3. Detect Errors (PASS FILENAME ðŸ”¥)
@@ -60,40 +91,40 @@ def main():
     # --------------------------------------------------------
     # 4. Print Results
     # --------------------------------------------------------
-    print("=" * 60)
-    print("ðŸ§  Multi-Language Syntax Error Checker (CLI)")
-    print("=" * 60)
+    write("=" * 60)
+    write("ðŸ§  Multi-Language Syntax Error Checker (CLI)")
+    write("=" * 60)
 
-    print(f"ðŸ“‚ File        : {file_path}")
-    print(f"ðŸ—‚ Language    : {result['language']}")
+    write(f"ðŸ“‚ File        : {file_path}")
+    write(f"ðŸ—‚ Language    : {result['language']}")
     
     warnings = result.get("warnings", [])
     if warnings:
-        print("Runtime Warnings:")
+        write("Runtime Warnings:")
         for warning in warnings:
-            print(f"   - {warning}")
-        print("-" * 60)
+            write(f"   - {warning}")
+        write("-" * 60)
     
     # Handle both single-error and all-errors output
     if show_all_errors:
         # Multi-error output
-        print(f"ðŸ¤– Total Errors : {result.get('total_errors', 0)}")
-        print("-" * 60)
+        write(f"ðŸ¤– Total Errors : {result.get('total_errors', 0)}")
+        write("-" * 60)
         
         if result.get('total_errors', 0) == 0:
-            print("âœ… No syntax errors detected.")
+            write("âœ… No syntax errors detected.")
         else:
             errors_by_type = result.get('errors_by_type', {})
             for error_type, errors in errors_by_type.items():
-                print(f"\nâš ï¸ {error_type} ({len(errors)} found)")
+                write(f"\nâš ï¸ {error_type} ({len(errors)} found)")
                 for i, error in enumerate(errors, start=1):
-                    print(f"  {i}. Line {error.get('line')}: {error.get('message')}")
+                    write(f"  {i}. Line {error.get('line')}: {error.get('message')}")
                     if error.get("suggestion"):
-                        print(f"     Suggestion: {error.get('suggestion')}")
+                        write(f"     Suggestion: {error.get('suggestion')}")
     else:
         # Single error output  
-        print(f"ðŸ¤– Detected    : {result['predicted_error']}")
-        print("-" * 60)
+        write(f"ðŸ¤– Detected    : {result['predicted_error']}")
+        write("-" * 60)
 
     # --------------------------------------------------------
     # 5. Rule-Based Issues
@@ -101,18 +132,18 @@ def main():
     issues = result.get("rule_based_issues", [])
 
     if issues:
-        print("âš ï¸ Rule-Based Issues:")
+        write("âš ï¸ Rule-Based Issues:")
         for i, issue in enumerate(issues, start=1):
-            print(f"\n{i}. {issue.get('type')}")
+            write(f"\n{i}. {issue.get('type')}")
             if issue.get("line"):
-                print(f"   Line      : {issue.get('line')}")
+                write(f"   Line      : {issue.get('line')}")
             if issue.get("col"):
-                print(f"   Column    : {issue.get('col')}")
-            print(f"   Message   : {issue.get('message')}")
+                write(f"   Column    : {issue.get('col')}")
+            write(f"   Message   : {issue.get('message')}")
             if issue.get("suggestion"):
-                print(f"   Suggestion: {issue.get('suggestion')}")
+                write(f"   Suggestion: {issue.get('suggestion')}")
     else:
-        print("âœ… No rule-based syntax issues detected.")
+        write("âœ… No rule-based syntax issues detected.")
     
     # --------------------------------------------------------
     # 6. Auto-Fix Suggestion
@@ -122,74 +153,129 @@ def main():
     else:
         primary_error = result.get("predicted_error", "NoError")
 
+    fix_result = None
     if primary_error != "NoError":
-        print("\n" + "=" * 60)
-        print("ðŸ”§ AUTO-FIX SUGGESTION")
-        print("=" * 60)
+        write("\n" + "=" * 60)
+        write("ðŸ”§ AUTO-FIX SUGGESTION")
+        write("=" * 60)
         
         fixer = AutoFixer()
         patch_preview = AutoFixer.patch_preview(code, issues, result['language'])
         if patch_preview:
-            print("Auto-Fix Patch:")
+            write("Auto-Fix Patch:")
             for line in AutoFixer.format_patch_preview(patch_preview):
-                print(f"  {line}")
-            print()
+                write(f"  {line}")
+            write()
 
         line_num = AutoFixer.line_for_error(issues, primary_error)
         
         fix_result = fixer.apply_fixes(code, primary_error, line_num, result['language'])
         
         if fix_result['success']:
-            print("âœ… Automatic fix available!\n")
-            print("Fixed Code:")
-            print("-" * 60)
-            print(fix_result['fixed_code'])
-            print("-" * 60)
-            print("\nChanges Applied:")
+            write("âœ… Automatic fix available!\n")
+            write("Fixed Code:")
+            write("-" * 60)
+            write(fix_result['fixed_code'])
+            write("-" * 60)
+            write("\nChanges Applied:")
             for change in fix_result['changes']:
-                print(f"  â€¢ {change}")
+                write(f"  â€¢ {change}")
         elif patch_preview:
-            print("â„¹ï¸ Review and apply the patch lines above; automatic rewriting remains conservative for this error type.")
+            write("â„¹ï¸ Review and apply the patch lines above; automatic rewriting remains conservative for this error type.")
         elif fix_result.get('changes'):
-            print("â„¹ï¸ Manual correction recommended. Suggested next steps:")
+            write("â„¹ï¸ Manual correction recommended. Suggested next steps:")
             for change in fix_result['changes']:
-                print(f"  â€¢ {change}")
+                write(f"  â€¢ {change}")
         else:
-            print("â„¹ï¸ Manual correction recommended for this error type.")
+            write("â„¹ï¸ Manual correction recommended for this error type.")
     
     # --------------------------------------------------------
     # 7. Code Quality Analysis
     # --------------------------------------------------------
-    print("\n" + "=" * 60)
-    print("ðŸ“Š CODE QUALITY ANALYSIS")
-    print("=" * 60)
+    write("\n" + "=" * 60)
+    write("ðŸ“Š CODE QUALITY ANALYSIS")
+    write("=" * 60)
     
+    quality_report = None
     try:
         quality = CodeQualityAnalyzer(code, result['language'])
         quality_report = quality.analyze()
         
-        print(f"Quality Score  : {quality_report['quality_score']}/100")
-        print(f"Code Lines     : {quality_report['line_counts']['code']}")
-        print(f"Comment Lines  : {quality_report['line_counts']['comments']}")
-        print(f"Blank Lines    : {quality_report['line_counts']['blank']}")
+        write(f"Quality Score  : {quality_report['quality_score']}/100")
+        write(f"Code Lines     : {quality_report['line_counts']['code']}")
+        write(f"Comment Lines  : {quality_report['line_counts']['comments']}")
+        write(f"Blank Lines    : {quality_report['line_counts']['blank']}")
         
         complexity = quality_report.get('complexity', 'N/A')
-        print(f"Complexity     : {complexity}")
-        print(f"Comment Ratio  : {quality_report['comment_ratio']}%")
+        write(f"Complexity     : {complexity}")
+        write(f"Comment Ratio  : {quality_report['comment_ratio']}%")
         
         if quality_report['suggestions']:
-            print("\nðŸ’¡ Quality Suggestions:")
+            write("\nðŸ’¡ Quality Suggestions:")
             for i, suggestion in enumerate(quality_report['suggestions'], start=1):
-                print(f"  {i}. {suggestion}")
+                write(f"  {i}. {suggestion}")
         else:
-            print("\nâœ… Code quality looks good!")
+            write("\nâœ… Code quality looks good!")
     
     except Exception as e:
-        print("â„¹ï¸ Quality analysis unavailable for this code snippet.")
+        write("â„¹ï¸ Quality analysis unavailable for this code snippet.")
+
+    write("\n" + "=" * 60)
+    write("Done.")
+    write("=" * 60)
+
+    return CliResult(
+        exit_code=0,
+        output=buffer.getvalue(),
+        file_path=file_path,
+        language=result['language'],
+        predicted_error=primary_error,
+        detection=result,
+        fix=fix_result,
+        quality=quality_report,
+    )
+
+
+def serve(stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None) -> None:
+    """
+    Persistent worker mode: imports and model loading are paid once.
+
+    Prints ``{"ready": true}`` once imports are done, then for every JSON request
+    line (``path`` or ``filename`` + ``code``, optional ``all_errors``) one JSON
+    line with the CliResult fields plus ``elapsed_ms``. Stops at end of input.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    print(json.dumps({"ready": True}), file=stdout, flush=True)
+    for line in stdin:
+        if not line.strip():
+            continue
+        started = time.perf_counter()
+        try:
+            request = json.loads(line)
+            args = [request.get("path") or request.get("filename") or "<stdin>"]
+            if request.get("all_errors"):
+                args.append("--all-errors")
+            response = run_cli(args, code=request.get("code")).to_dict()
+        except Exception as exc:  # noqa: BLE001 - a bad request must not stop the worker
+            response = {"exit_code": 1, "output": "", "error": f"{type(exc).__name__}: {exc}"}
+        response["elapsed_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+        print(json.dumps(response, default=str), file=stdout, flush=True)
+
+
+def main():
+    if "--serve" in sys.argv[1:]:
+        serve()
+        return
+
+    # Fix Unicode encoding on Windows (emojis crash with cp1252)
+    if sys.stdout.encoding != 'utf-8':
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
-    print("\n" + "=" * 60)
-    print("Done.")
-    print("=" * 60)
+    result = run_cli(sys.argv[1:])
+    sys.stdout.write(result.output)
+    if result.exit_code:
+        sys.exit(result.exit_code)
 
 
 # ------------------------------------------------------------
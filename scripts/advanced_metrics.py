@@ -19,9 +19,7 @@ from sklearn.metrics import (
 
 sys.path.insert(0, os.path.abspath("."))
 
-from src.feature_utils import extract_numerical_features
-
-
+from scripts.utils.feature_cache import DEFAULT_CACHE_DIR, load_or_build_features
 from scripts.utils.ml_utils import load_model_bundle
 
 
@@ -31,6 +29,8 @@ def main() -> int:
     parser.add_argument("--models-dir", default="models")
     parser.add_argument("--output", default="results/advanced_metrics.txt")
     parser.add_argument("--smoke", action="store_true", help="Quick metrics check")
+    parser.add_argument("--feature-cache", default=DEFAULT_CACHE_DIR, help="Directory for cached feature matrices")
+    parser.add_argument("--no-feature-cache", action="store_true", help="Always rebuild features")
     args = parser.parse_args()
 
     if not os.path.exists(args.dataset):
@@ -53,14 +53,13 @@ def main() -> int:
     texts = df["buggy_code"].fillna("").astype(str)
     classes = np.asarray(label_encoder.classes_)
     y_true = label_encoder.transform(df["error_type"])
-    x_text = vectorizer.transform(texts)
-    try:
-        from scipy.sparse import hstack
-
-        x_num = np.array([extract_numerical_features(code) for code in texts])
-        x = hstack([x_text, x_num])
-    except Exception:
-        x = x_text
+    features = load_or_build_features(
+        texts,
+        df["error_type"],
+        vectorizer,
+        cache_dir=None if args.no_feature_cache else args.feature_cache,
+    )
+    x = features.matrix
 
     y_pred = model.predict(x)
     accuracy = accuracy_score(y_true, y_pred)
@@ -0,0 +1,843 @@
+"""Performance benchmarks for the OmniSyntax detection engine.
+
+Each scenario builds a worst-case input (or a corpus of real inputs) for one
+known hot spot and times the engine stage that processes it. The accuracy
+suites (`test_accuracy.py`, `production_validation.py`) prove what the engine
+reports; this script tracks how long it takes and how much it allocates.
+
+The ``corpus_<language>_<target>`` scenarios time each public entry point
+(static pipeline, legacy engine, ML classifier, auto-fixer, quality analyzer)
+on that language's files from samples/ and demo/ plus dataset rows. Results
+can be saved as a JSON baseline under artifacts/benchmarks/ and later runs
+gated against it: a scenario whose best-run throughput drops by more than
+``--max-regression`` fails the run.
+
+``--curves`` times the static pipeline on generated programs of every
+language, valid and deliberately broken, from ~10 lines up to MAX_CODE_SIZE,
+fits a power law ``seconds ~ chars ** exponent`` to each curve (plotted to
+``--plot`` when given); a curve steeper than ``--max-exponent`` (a quadratic
+hot spot) fails the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import csv
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from statistics import median
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np
+
+from src import error_engine, ml_engine, static_pipeline
+from src.auto_fix import AutoFixer
+from src.config import get_max_code_size
+from src.language_detector import detect_language
+from src.quality_analyzer import CodeQualityAnalyzer
+
+DATASET_PATH = REPO_ROOT / "dataset" / "merged" / "all_errors_v3.csv"
+SAMPLE_DIRS = (REPO_ROOT / "samples", REPO_ROOT / "demo")
+BASELINE_PATH = REPO_ROOT / "artifacts" / "benchmarks" / "baseline.json"
+DEFAULT_MAX_REGRESSION = 0.25
+DEFAULT_MAX_EXPONENT = 1.5
+LANGUAGE_FILENAMES = {
+    "Python": "bench.py",
+    "Java": "Bench.java",
+    "C": "bench.c",
+    "C++": "bench.cpp",
+    "JavaScript": "bench.js",
+}
+FILENAME_LANGUAGES = {filename: language for language, filename in LANGUAGE_FILENAMES.items()}
+EXTENSION_LANGUAGES = {Path(filename).suffix: language for language, filename in LANGUAGE_FILENAMES.items()}
+
+Inputs = list[tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    build: Callable[[int], Inputs]
+    run: Callable[[str, str], Any]
+    default_size: int
+    smoke_size: int
+    # Returns why the scenario cannot run here (e.g. no trained model), or None.
+    unavailable: Callable[[], str | None] | None = None
+
+
+def _python_many_issues(lines: int) -> Inputs:
+    """Flat module where nearly every line is an UnusedVariable or LineTooLong hit."""
+    out: list[str] = []
+    for index in range(lines):
+        if index % 4 == 3:
+            out.append(f"note_{index} = '{'x' * 130}'")
+        else:
+            out.append(f"value_{index} = {index} + 1")
+    return [("\n".join(out) + "\n", "bench.py")]
+
+
+def _c_repeated_expressions(lines: int) -> Inputs:
+    """Generated C function that repeats a handful of arithmetic expressions."""
+    body = [
+        "    total = total + (scale * 2 + offset) / (scale + 1);",
+        "    ratio = (total - offset) % (scale * 3 + 1);",
+        "    while (total > limit && ratio != 0) { total = total - 1; }",
+    ]
+    out = ["int main() {", "    int total = 0;", "    int ratio = 0;", "    int scale = 4;", "    int offset = 2;", "    int limit = 100;"]
+    out.extend(body[index % len(body)] for index in range(lines))
+    out.extend(["    return total + ratio;", "}"])
+    return [("\n".join(out) + "\n", "bench.c")]
+
+
+def _c_many_functions(lines: int) -> Inputs:
+    """Large C file of many small functions with loops and locals; every tenth has an unused local."""
+    function = [
+        "int helper_{n}(int limit) {{",
+        "    int total = 0;",
+        "    int step_{n} = {n} % 7 + 1;",
+        "    for (int i = 0; i < limit; i++) {{",
+        "        total = total + step_{n};",
+        "        if (total > 100) {{ break; }}",
+        "    }}",
+        "    while (total > 0) {{",
+        "        total = total - step_{n};",
+        "    }}",
+        "    return total;",
+        "}}",
+    ]
+    out = ["#include <stdio.h>", ""]
+    n = 0
+    while len(out) < lines:
+        out.extend(line.format(n=n) for line in function)
+        if n % 10 == 0:
+            out.insert(len(out) - 2, f"    int unused_{n} = {n};")
+        n += 1
+    return [("\n".join(out) + "\n", "bench.c")]
+
+
+def _python_nested_blocks(lines: int) -> Inputs:
+    """Classes of methods with nested loops and branches; every block's text spans its body."""
+    method = [
+        "    def method_{n}(self, items):",
+        "        total = 0",
+        "        for item in items:",
+        "            if item > {n}:",
+        "                while total < item:",
+        "                    total = total + item // 2",
+        "            else:",
+        "                total = total - 1",
+        "        return total",
+    ]
+    out: list[str] = []
+    n = 0
+    while len(out) < lines:
+        if n % 20 == 0:
+            out.append(f"class Block{n // 20}:")
+        out.extend(line.format(n=n) for line in method)
+        n += 1
+    return [("\n".join(out) + "\n", "bench.py")]
+
+
+def _java_long_methods(lines: int) -> Inputs:
+    """One large Java class: many short methods with a 60-line long-function hit every tenth."""
+    out = ["public class Bench {"]
+    n = 0
+    while len(out) < lines:
+        out.append(f"    public int method{n}(int a) {{")
+        out.extend(f"        a = a + {step};" for step in range(58 if n % 10 == 0 else 3))
+        out.extend(["        return a;", "    }"])
+        n += 1
+    out.append("}")
+    return [("\n".join(out) + "\n", "Bench.java")]
+
+
+def _python_long_functions(lines: int) -> Inputs:
+    """Large Python module: many short functions with a 60-line long-function hit every tenth."""
+    out: list[str] = []
+    n = 0
+    while len(out) < lines:
+        out.append(f"def function_{n}(a):")
+        out.extend(f"    a = a + {step}" for step in range(58 if n % 10 == 0 else 3))
+        out.extend(["    return a", ""])
+        n += 1
+    return [("\n".join(out) + "\n", "bench.py")]
+
+
+def _grammar_function(language: str, n: int) -> list[str]:
+    """One function of the ``evaluate_exhaustive_accuracy.generate_valid_grammar``
+    templates, with locals suffixed by ``n`` since the C-like scope model is per file."""
+    a, b = n * 7 % 2000 + 1, n % 5 + 1
+    if language == "Python":
+        return [f"def f_{n}(x):", f"    total = x + {a}", f"    for j in range({b}):", "        total += j", "    return total", ""]
+    declare, indent = ("let", "  ") if language == "JavaScript" else ("int", "    ")
+    header = f"function f_{n}(x_{n}) {{" if language == "JavaScript" else f"int f_{n}(int x_{n}) {{"
+    if language == "Java":
+        header = "  static " + header
+    return [
+        header,
+        f"{indent}{declare} total_{n} = x_{n} + {a};",
+        f"{indent}for ({declare} j_{n} = 0; j_{n} < {b}; j_{n}++) {{",
+        f"{indent}    total_{n} += j_{n};",
+        f"{indent}}}",
+        f"{indent}return total_{n};",
+        "  }" if language == "Java" else "}",
+    ]
+
+
+def _render_grammar_program(language: str, functions: list[list[str]]) -> str:
+    body = [line for function in functions for line in function]
+    if language == "Python":
+        calls = [f"acc = acc + f_{n}({n})" for n in range(len(functions))]
+        out = body + ["acc = 0"] + calls + ["print(acc)"]
+    elif language == "JavaScript":
+        calls = [f"acc = acc + f_{n}({n});" for n in range(len(functions))]
+        out = body + ["let acc = 0;"] + calls + ["console.log(acc);"]
+    elif language == "Java":
+        calls = [f"    acc = acc + f_{n}({n});" for n in range(len(functions))]
+        out = ["public class Main {"] + body + ["  public static void main(String[] args) {", "    int acc = 0;"]
+        out += calls + ["    System.out.println(acc);", "  }", "}"]
+    else:
+        calls = [f"    acc = acc + f_{n}({n});" for n in range(len(functions))]
+        header = ["#include <stdio.h>"] if language == "C" else ["#include <iostream>", "using namespace std;"]
+        printer = '    printf("%d\\n", acc);' if language == "C" else "    cout << acc << endl;"
+        out = header + body + ["int main() {", "    int acc = 0;"] + calls + [printer, "    return 0;", "}"]
+    return "\n".join(out) + "\n"
+
+
+def grammar_program(language: str, chars: int, broken: bool = False) -> str:
+    """A program of at least ``chars`` characters: ``_grammar_function``
+    definitions, each called once from the entry point.
+
+    ``broken`` removes the ``:`` of the middle Python ``def`` or the ``{`` of
+    the middle C-like ``for``, so the rest of the file is read past a real
+    syntax error.
+    """
+    functions = [_grammar_function(language, 0)]
+    code = _render_grammar_program(language, functions)
+    while len(code) < chars:
+        # Grow by an estimate of the missing functions, then re-render.
+        per_function = len(code) / len(functions)
+        missing = max(1, int((chars - len(code)) / per_function))
+        functions += [_grammar_function(language, n) for n in range(len(functions), len(functions) + missing)]
+        code = _render_grammar_program(language, functions)
+    if broken:
+        middle = functions[len(functions) // 2]
+        if language == "Python":
+            middle[0] = middle[0][:-1]
+        else:
+            middle[2] = middle[2][:-2]
+        code = _render_grammar_program(language, functions)
+    return code
+
+
+def _dataset_rows(rows: int, *languages: str) -> Inputs:
+    inputs: Inputs = []
+    with DATASET_PATH.open(encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            if len(inputs) >= rows:
+                break
+            if languages and row.get("language") not in languages:
+                continue
+            inputs.append((row.get("buggy_code") or "", LANGUAGE_FILENAMES.get(row.get("language", ""), "bench.txt")))
+    return inputs
+
+
+def _dataset_corpus(rows: int) -> Inputs:
+    """First ``rows`` snippets of the merged dataset, all languages."""
+    return _dataset_rows(rows)
+
+
+def _dataset_python(rows: int) -> Inputs:
+    """First ``rows`` Python snippets of the merged dataset."""
+    return _dataset_rows(rows, "Python")
+
+
+def _dataset_python_broken(rows: int) -> Inputs:
+    """First ``rows`` Python snippets of the merged dataset that do not parse."""
+    inputs: Inputs = []
+    for code, filename in _dataset_python(sys.maxsize):
+        if len(inputs) >= rows:
+            break
+        try:
+            ast.parse(code)
+        except SyntaxError:
+            inputs.append((code, filename))
+    return inputs
+
+
+def _dataset_c_like(rows: int) -> Inputs:
+    """First ``rows`` C, C++ and Java snippets of the merged dataset."""
+    return _dataset_rows(rows, "C", "C++", "Java")
+
+
+def _sample_files(language: str) -> Inputs:
+    """Every samples/ and demo/ file of ``language``, in path order."""
+    inputs: Inputs = []
+    for directory in SAMPLE_DIRS:
+        for path in sorted(directory.rglob("*")):
+            if path.is_file() and EXTENSION_LANGUAGES.get(path.suffix) == language:
+                inputs.append((path.read_text(encoding="utf-8"), LANGUAGE_FILENAMES[language]))
+    return inputs
+
+
+def _language_corpus(language: str) -> Callable[[int], Inputs]:
+    def build(rows: int) -> Inputs:
+        return _sample_files(language) + _dataset_rows(rows, language)
+
+    build.__doc__ = f"{language} samples/ and demo/ files plus the first ``rows`` {language} dataset rows."
+    return build
+
+
+# Detected error and line per input, filled while building the auto-fix
+# scenarios so that only apply_fixes is timed.
+_FIX_PLANS: dict[tuple[str, str], tuple[str, int | None]] = {}
+_FIXER = AutoFixer()
+
+
+def _with_fix_plans(build: Callable[[int], Inputs]) -> Callable[[int], Inputs]:
+    def planned(size: int) -> Inputs:
+        inputs = build(size)
+        for code, filename in inputs:
+            if (code, filename) not in _FIX_PLANS:
+                result = static_pipeline.analyze_source(code, filename).to_single_result()
+                error_type = result["predicted_error"]
+                _FIX_PLANS[(code, filename)] = (
+                    error_type,
+                    AutoFixer.line_for_error(result.get("rule_based_issues", []), error_type),
+                )
+        return inputs
+
+    planned.__doc__ = build.__doc__
+    return planned
+
+
+def _run_static(code: str, filename: str) -> Any:
+    return static_pipeline.analyze_source(code, filename)
+
+
+def _run_legacy(code: str, filename: str) -> Any:
+    return error_engine.detect_errors(code, filename)
+
+
+def _run_ml(code: str, filename: str) -> Any:
+    return ml_engine.detect_error_ml(code)
+
+
+def _ml_unavailable() -> str | None:
+    return None if ml_engine.is_model_available() else f"ML model unavailable: {ml_engine.model_error}"
+
+
+def _run_autofix(code: str, filename: str) -> Any:
+    error_type, line = _FIX_PLANS[(code, filename)]
+    return _FIXER.apply_fixes(code, error_type, line, FILENAME_LANGUAGES[filename])
+
+
+def _run_c_like_rules(code: str, filename: str) -> Any:
+    return error_engine._collect_c_like_rule_based_issues(code, FILENAME_LANGUAGES[filename])
+
+
+def _run_detect_language(code: str, filename: str) -> Any:
+    # Content only: with the filename the extension answers before any scanning.
+    return detect_language(code)
+
+
+def _run_quality(code: str, filename: str) -> Any:
+    return CodeQualityAnalyzer(code, FILENAME_LANGUAGES[filename]).analyze()
+
+
+def _issue_count(result: Any) -> int:
+    if hasattr(result, "issues"):
+        return len(result.issues)
+    if isinstance(result, dict):
+        return len(
+            result.get("rule_based_issues")
+            or result.get("errors")
+            or result.get("long_functions")
+            or result.get("changes")
+            or []
+        )
+    if isinstance(result, list):
+        return len(result)
+    return 0
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario(
+            "python_many_issues",
+            "Static pipeline on a Python file with one issue per line (snippet/line lookups).",
+            _python_many_issues,
+            _run_static,
+            default_size=10000,
+            smoke_size=200,
+        ),
+        Scenario(
+            "c_repeated_expressions",
+            "Static pipeline on generated C that repeats the same expressions (expression evaluator).",
+            _c_repeated_expressions,
+            _run_static,
+            default_size=3000,
+            smoke_size=100,
+        ),
+        Scenario(
+            "c_many_functions",
+            "Static pipeline on a large C file of many functions (per-declaration and per-loop scans).",
+            _c_many_functions,
+            _run_static,
+            default_size=20000,
+            smoke_size=200,
+        ),
+        Scenario(
+            "python_nested_blocks",
+            "Static pipeline on Python methods with nested loops and branches (per-statement re-parsing).",
+            _python_nested_blocks,
+            _run_static,
+            default_size=5000,
+            smoke_size=100,
+        ),
+        Scenario(
+            "legacy_python_corpus",
+            "error_engine.detect_errors over Python dataset rows, as the validation scripts call it.",
+            _dataset_python,
+            _run_legacy,
+            default_size=2000,
+            smoke_size=20,
+        ),
+        Scenario(
+            "python_syntax_errors",
+            "Static pipeline over Python dataset rows that fail to parse (syntax_checker fallback).",
+            _dataset_python_broken,
+            _run_static,
+            default_size=2000,
+            smoke_size=20,
+        ),
+        Scenario(
+            "c_like_rule_scan",
+            "error_engine C-like rule detectors over C/C++/Java dataset rows (sanitizer and line scans).",
+            _dataset_c_like,
+            _run_c_like_rules,
+            default_size=5000,
+            smoke_size=20,
+        ),
+        Scenario(
+            "quality_java_long_methods",
+            "CodeQualityAnalyzer.analyze on a large Java class (long-function line numbering).",
+            _java_long_methods,
+            _run_quality,
+            default_size=20000,
+            smoke_size=200,
+        ),
+        Scenario(
+            "quality_python_long_functions",
+            "CodeQualityAnalyzer.analyze on a large Python module (long-function extents).",
+            _python_long_functions,
+            _run_quality,
+            default_size=20000,
+            smoke_size=200,
+        ),
+        Scenario(
+            "language_detection_corpus",
+            "detect_language without a filename over dataset rows (comment stripping and scoring).",
+            _dataset_corpus,
+            _run_detect_language,
+            default_size=5000,
+            smoke_size=50,
+        ),
+        Scenario(
+            "language_detection_large_file",
+            "detect_language without a filename on a large Java class (bounded, memoized content scan).",
+            _java_long_methods,
+            _run_detect_language,
+            default_size=20000,
+            smoke_size=200,
+        ),
+        Scenario(
+            "dataset_corpus",
+            "Static pipeline over dataset rows, one analysis per snippet (per-analysis overhead).",
+            _dataset_corpus,
+            _run_static,
+            default_size=5000,
+            smoke_size=50,
+        ),
+    ]
+}
+
+
+# Entry points timed on every language corpus: name -> (runner, what it times, needs the model).
+CORPUS_TARGETS: dict[str, tuple[Callable[[str, str], Any], str, bool]] = {
+    "static": (_run_static, "static_pipeline.analyze_source", False),
+    "legacy": (_run_legacy, "error_engine.detect_errors", False),
+    "ml": (_run_ml, "ml_engine.detect_error_ml", True),
+    "autofix": (_run_autofix, "AutoFixer.apply_fixes for the detected error", False),
+    "quality": (_run_quality, "CodeQualityAnalyzer.analyze", False),
+}
+
+for _language in LANGUAGE_FILENAMES:
+    _key = _language.lower().replace("+", "p")
+    for _target, (_runner, _label, _needs_model) in CORPUS_TARGETS.items():
+        _build = _language_corpus(_language)
+        SCENARIOS[f"corpus_{_key}_{_target}"] = Scenario(
+            f"corpus_{_key}_{_target}",
+            f"{_label} over {_language} samples/, demo/ and dataset rows.",
+            _with_fix_plans(_build) if _target == "autofix" else _build,
+            _runner,
+            default_size=300,
+            smoke_size=5,
+            unavailable=_ml_unavailable if _needs_model else None,
+        )
+
+
+def _run_inputs(scenario: Scenario, inputs: Inputs) -> int:
+    return sum(_issue_count(scenario.run(code, filename)) for code, filename in inputs)
+
+
+def run_scenario(scenario: Scenario, size: int, repeat: int, *, memory: bool = False) -> dict[str, Any]:
+    inputs = scenario.build(size)
+    timings: list[float] = []
+    issues = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        issues = _run_inputs(scenario, inputs)
+        timings.append(time.perf_counter() - started)
+    result: dict[str, Any] = {
+        "scenario": scenario.name,
+        "size": size,
+        "inputs": len(inputs),
+        "chars": sum(len(code) for code, _ in inputs),
+        "issues": issues,
+        "repeat": repeat,
+        "median_seconds": round(median(timings), 4),
+        "min_seconds": round(min(timings), 4),
+    }
+    # Throughput from the best run: the least noisy figure for regression checks.
+    best = min(timings)
+    result["inputs_per_second"] = round(len(inputs) / best, 3) if best > 0 else None
+    result["chars_per_second"] = round(result["chars"] / best, 1) if best > 0 else None
+    if memory:
+        # Separate pass: tracemalloc slows allocation-heavy code several times over.
+        # Results are kept alive so the snapshot shows what they retain.
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot()
+        kept = [scenario.run(code, filename) for code, filename in inputs]
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        growth = [stat for stat in after.compare_to(before, "filename") if stat.size_diff > 0]
+        result["peak_traced_kib"] = round((peak - baseline) / 1024, 1)
+        result["retained_kib"] = round(sum(stat.size_diff for stat in growth) / 1024, 1)
+        result["retained_blocks"] = sum(stat.count_diff for stat in growth)
+        del kept
+    return result
+
+
+def run_scaling(scenario: Scenario, base: dict[str, Any], steps: int, repeat: int) -> list[dict[str, Any]]:
+    """Rerun ``scenario`` at 2x, 4x, ... the base size.
+
+    Each point carries the growth exponent against the previous one: time
+    ratio over input-size ratio on a log scale, so ~1 is linear and ~2 is
+    quadratic.
+    """
+    points = [{key: base[key] for key in ("size", "chars", "median_seconds")}]
+    for step in range(1, steps + 1):
+        result = run_scenario(scenario, base["size"] * 2**step, repeat)
+        point = {key: result[key] for key in ("size", "chars", "median_seconds")}
+        previous = points[-1]
+        if previous["median_seconds"] > 0 and point["chars"] > previous["chars"]:
+            point["exponent"] = round(
+                math.log(max(point["median_seconds"], 1e-9) / previous["median_seconds"])
+                / math.log(point["chars"] / previous["chars"]),
+                2,
+            )
+        points.append(point)
+    return points
+
+
+def fit_power_law(points: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Least-squares fit of ``seconds = coefficient * chars ** exponent``.
+
+    Only the larger half of the points is used: the fixed per-call cost
+    dominates tiny inputs and would flatten the slope. Returns None when
+    fewer than three points were slow enough to time.
+    """
+    timed = sorted((p for p in points if p["median_seconds"] > 0), key=lambda p: p["chars"])
+    if len(timed) > 3:
+        timed = timed[(len(timed) - 1) // 2 :]
+    if len(timed) < 3:
+        return None
+    x = np.log([p["chars"] for p in timed])
+    y = np.log([p["median_seconds"] for p in timed])
+    exponent, intercept = np.polyfit(x, y, 1)
+    residual = y - (exponent * x + intercept)
+    spread = float(np.sum((y - y.mean()) ** 2))
+    return {
+        "exponent": round(float(exponent), 3),
+        "coefficient": float(np.exp(intercept)),
+        "r2": round(1.0 - float(np.sum(residual**2)) / spread, 4) if spread > 0 else None,
+        "fitted_points": len(timed),
+    }
+
+
+def curve_sizes(points: int, largest: int) -> list[int]:
+    """``points`` character counts, evenly spaced on a log scale from ~10 lines to ``largest``."""
+    smallest = 250
+    if points < 2 or largest <= smallest:
+        return [max(largest, smallest)]
+    return sorted({int(round(size)) for size in np.geomspace(smallest, largest, points)})
+
+
+def run_growth_curves(
+    languages: list[str], sizes: list[int], repeat: int, max_exponent: float = DEFAULT_MAX_EXPONENT
+) -> list[dict[str, Any]]:
+    """Time ``static_pipeline.analyze_source`` on valid and broken ``grammar_program``
+    inputs of every size, and fit each curve with ``fit_power_law``."""
+    curves: list[dict[str, Any]] = []
+    for language in languages:
+        filename = LANGUAGE_FILENAMES[language]
+        for variant in ("valid", "broken"):
+            points: list[dict[str, Any]] = []
+            for size in sizes:
+                code = grammar_program(language, size, broken=variant == "broken")
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    result = static_pipeline.analyze_source(code, filename)
+                    timings.append(time.perf_counter() - started)
+                points.append(
+                    {
+                        "chars": len(code),
+                        "lines": code.count("\n"),
+                        "issues": len(result.issues),
+                        "median_seconds": round(median(timings), 5),
+                    }
+                )
+            fit = fit_power_law(points)
+            curves.append(
+                {
+                    "language": language,
+                    "variant": variant,
+                    "points": points,
+                    "fit": fit,
+                    "superlinear": bool(fit and fit["exponent"] > max_exponent),
+                }
+            )
+    return curves
+
+
+def plot_growth_curves(curves: list[dict[str, Any]], path: Path) -> None:
+    """Log-log plot of every curve with its fitted power law."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 2, figsize=(12, 5), sharey=True)
+    for ax, variant in zip(axes, ("valid", "broken")):
+        for curve in (c for c in curves if c["variant"] == variant):
+            chars = [p["chars"] for p in curve["points"]]
+            seconds = [max(p["median_seconds"], 1e-6) for p in curve["points"]]
+            label = curve["language"]
+            (line,) = ax.plot(chars, seconds, "o", label=label)
+            fit = curve["fit"]
+            if fit:
+                ax.plot(chars, [fit["coefficient"] * c ** fit["exponent"] for c in chars], "-", color=line.get_color(), alpha=0.6)
+                line.set_label(f"{label} (n^{fit['exponent']:.2f})")
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_title(f"static pipeline, {variant} programs")
+        ax.set_xlabel("input size (chars)")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend(fontsize=8)
+    axes[0].set_ylabel("median seconds")
+    fig.tight_layout()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+
+
+def compare_to_baseline(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> list[dict[str, Any]]:
+    """Throughput of every result against the baseline run of the same scenario.
+
+    Status is ``regressed`` when chars/second fell by more than
+    ``max_regression`` (a fraction), ``ok`` otherwise; scenarios that were
+    skipped, are missing from the baseline or ran at another size are
+    reported but never fail.
+    """
+    previous = {entry["scenario"]: entry for entry in baseline.get("results", [])}
+    rows: list[dict[str, Any]] = []
+    for result in results:
+        name = result["scenario"]
+        before = previous.get(name)
+        row: dict[str, Any] = {"scenario": name}
+        if result.get("skipped") or before is None or before.get("skipped"):
+            row["status"] = "no_baseline"
+        elif before.get("size") != result["size"]:
+            row["status"] = "size_changed"
+        elif not before.get("chars_per_second") or not result.get("chars_per_second"):
+            row["status"] = "too_fast_to_time"
+        else:
+            ratio = result["chars_per_second"] / before["chars_per_second"]
+            row["baseline_chars_per_second"] = before["chars_per_second"]
+            row["chars_per_second"] = result["chars_per_second"]
+            row["change"] = round(ratio - 1.0, 4)
+            row["status"] = "regressed" if ratio < 1.0 - max_regression else "ok"
+        rows.append(row)
+    return rows
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True, timeout=30
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+        "ml_model_loaded": ml_engine.is_model_available(),
+    }
+
+
+def _max_rss_kib() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark OmniSyntax engine hot spots")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario to run (repeatable, default: all)")
+    parser.add_argument("--size", type=int, default=None, help="Override input size (lines for generated files, rows for corpora)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--memory", action="store_true", help="Also record tracemalloc peak and the memory retained by results")
+    parser.add_argument("--scale", type=int, default=0, metavar="STEPS", help="Also rerun each scenario at 2x, 4x, ... its size (STEPS doublings) and report the growth exponent")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    parser.add_argument("--smoke", action="store_true", help="Tiny inputs, single repeat; checks the harness only")
+    parser.add_argument("--baseline", default=None, help="Compare against this baseline JSON and fail on throughput regressions")
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=str(BASELINE_PATH),
+        default=None,
+        metavar="PATH",
+        help=f"Write the results as a baseline (default path: {BASELINE_PATH.relative_to(REPO_ROOT)})",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Allowed drop in best-run throughput against the baseline, as a fraction (default: 0.25)",
+    )
+    parser.add_argument("--curves", action="store_true", help="Fit static-pipeline growth curves on generated programs of every language (skips the scenarios unless --scenario is given)")
+    parser.add_argument("--curve-points", type=int, default=8, help="Sizes per growth curve (default: 8)")
+    parser.add_argument("--max-exponent", type=float, default=DEFAULT_MAX_EXPONENT, help="Fail when a fitted growth exponent exceeds this (default: 1.5)")
+    parser.add_argument("--plot", help="Also write the growth curves as a PNG to this path (with --curves)")
+    args = parser.parse_args()
+
+    names = args.scenario or ([] if args.curves else sorted(SCENARIOS))
+    results: list[dict[str, Any]] = []
+    for name in names:
+        scenario = SCENARIOS[name]
+        size = args.size or (scenario.smoke_size if args.smoke else scenario.default_size)
+        reason = scenario.unavailable() if scenario.unavailable else None
+        if reason:
+            results.append({"scenario": name, "size": size, "skipped": reason})
+            print(f"{name:<24} skipped: {reason}")
+            continue
+        result = run_scenario(scenario, size, 1 if args.smoke else max(1, args.repeat), memory=args.memory)
+        results.append(result)
+        line = (
+            f"{result['scenario']:<24} size={result['size']:<7} issues={result['issues']:<7} "
+            f"median={result['median_seconds']:.4f}s min={result['min_seconds']:.4f}s"
+        )
+        if args.memory:
+            line += (
+                f" peak={result['peak_traced_kib']}KiB retained={result['retained_kib']}KiB"
+                f" blocks={result['retained_blocks']}"
+            )
+        print(line)
+        if args.scale > 0:
+            result["scaling"] = run_scaling(scenario, result, args.scale, result["repeat"])
+            for point in result["scaling"][1:]:
+                print(f"  size={point['size']:<8} median={point['median_seconds']:.4f}s exponent={point.get('exponent', 'n/a')}")
+            result["scaling_fit"] = fit_power_law(result["scaling"])
+            if result["scaling_fit"]:
+                print(f"  fitted exponent={result['scaling_fit']['exponent']:.2f}")
+
+    curves: list[dict[str, Any]] = []
+    if args.curves:
+        largest = 5000 if args.smoke else get_max_code_size()
+        sizes = curve_sizes(4 if args.smoke else args.curve_points, largest)
+        curves = run_growth_curves(list(LANGUAGE_FILENAMES), sizes, 1 if args.smoke else max(1, args.repeat), args.max_exponent)
+        for curve in curves:
+            fit = curve["fit"]
+            largest_point = curve["points"][-1]
+            described = f"exponent={fit['exponent']:.2f} r2={fit['r2']}" if fit else "exponent=n/a"
+            flag = "  SUPERLINEAR" if curve["superlinear"] else ""
+            print(
+                f"curve {curve['language']:<10} {curve['variant']:<6} {described} "
+                f"largest={largest_point['chars']} chars in {largest_point['median_seconds']:.4f}s{flag}"
+            )
+        if args.plot:
+            plot_growth_curves(curves, Path(args.plot))
+            print(f"plot: {args.plot}")
+
+    max_rss = _max_rss_kib()
+    if max_rss is not None:
+        print(f"max RSS: {max_rss} KiB")
+
+    payload: dict[str, Any] = {"environment": _environment(), "results": results, "max_rss_kib": max_rss}
+    if curves:
+        payload["curves"] = curves
+    for target in (args.output, args.save_baseline):
+        if target:
+            output = Path(target)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        comparison = compare_to_baseline(results, baseline, args.max_regression)
+        regressed = [row for row in comparison if row["status"] == "regressed"]
+        for row in comparison:
+            if "change" in row:
+                print(f"{row['scenario']:<24} {row['status']:<10} {row['change']:+.1%} chars/s vs baseline")
+            else:
+                print(f"{row['scenario']:<24} {row['status']}")
+        if regressed:
+            print(f"{len(regressed)} scenario(s) regressed by more than {args.max_regression:.0%}")
+            return 1
+    superlinear = [curve for curve in curves if curve["superlinear"]]
+    if superlinear:
+        print(f"{len(superlinear)} growth curve(s) steeper than n^{args.max_exponent}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,24 +8,33 @@ Outputs:
 
 from __future__ import annotations
 
+import argparse
+import asyncio
+import contextlib
 import json
-import re
+import logging
+import os
+import random
+import socket
 import statistics
 import subprocess
 import sys
-import tempfile
 import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+import httpx
 from fastapi.testclient import TestClient
 
 import api
+import cli
 from src.auto_fix import AutoFixer
 from src.error_engine import detect_errors
 from src.multi_error_detector import detect_all_errors
 
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 
 @dataclass
 class Case:
@@ -618,6 +627,38 @@ def evaluate_api_cases(cases: list[Case]) -> dict[str, Any]:
     }
 
 
+def measure_cli_startup(case: Case) -> dict[str, Any]:
+    """Start one `cli.py --serve` worker: time to ready, then one warm request through it."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "cli.py", "--serve"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        ready = json.loads(proc.stdout.readline() or "{}")
+        startup_ms = (time.perf_counter() - t0) * 1000.0
+        t1 = time.perf_counter()
+        proc.stdin.write(json.dumps({"filename": f"{case.case_id}.txt", "code": case.code}) + "\n")
+        proc.stdin.flush()
+        response = json.loads(proc.stdout.readline() or "{}")
+        roundtrip_ms = (time.perf_counter() - t1) * 1000.0
+    finally:
+        proc.stdin.close()
+        proc.wait(timeout=60)
+    return {
+        "ready": bool(ready.get("ready")),
+        "startup_ms": round(startup_ms, 3),
+        "warm_roundtrip_ms": round(roundtrip_ms, 3),
+        "warm_predicted_error": response.get("predicted_error"),
+    }
+
+
 def evaluate_cli_samples(cases: list[Case]) -> dict[str, Any]:
     by_language: dict[str, list[Case]] = {}
     for case in cases:
@@ -630,49 +671,31 @@ def evaluate_cli_samples(cases: list[Case]) -> dict[str, Any]:
         if no_error:
             sample_cases.append(no_error[0])
 
+    # In-process runs measure the CLI logic; interpreter startup and model
+    # loading are measured once, separately, through a persistent worker.
     records: list[dict[str, Any]] = []
-    cli_path = Path("cli.py")
-
     for case in sample_cases:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt", mode="w", encoding="utf-8") as tmp:
-            tmp.write(case.code)
-            tmp_path = Path(tmp.name)
         t0 = time.perf_counter()
-        proc = subprocess.run(
-            [sys.executable, str(cli_path), str(tmp_path)],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
-        )
+        run = cli.run_cli([f"{case.case_id}.txt"], code=case.code)
         latency_ms = (time.perf_counter() - t0) * 1000.0
 
-        stdout = proc.stdout or ""
-        match = re.search(r"Detected\s*:\s*([^\r\n]+)", stdout)
-        predicted = match.group(1).strip() if match else None
-
         records.append(
             {
                 "case_id": case.case_id,
                 "language": case.language,
-                "exit_code": proc.returncode,
-                "predicted_error": predicted,
+                "exit_code": run.exit_code,
+                "predicted_error": run.predicted_error,
                 "latency_ms": round(latency_ms, 3),
-                "stdout_excerpt": "\n".join(stdout.splitlines()[:25]),
-                "stderr_excerpt": "\n".join((proc.stderr or "").splitlines()[:20]),
+                "stdout_excerpt": "\n".join(run.output.splitlines()[:25]),
+                "stderr_excerpt": "",
             }
         )
 
-        try:
-            tmp_path.unlink(missing_ok=True)
-        except OSError:
-            pass
-
     return {
         "sample_total": len(records),
         "records": records,
         "avg_latency_ms": round(statistics.mean([r["latency_ms"] for r in records]), 3) if records else None,
+        "startup": measure_cli_startup(sample_cases[0]) if sample_cases else None,
     }
 
 
@@ -775,6 +798,159 @@ def run_stress(cases: list[Case], repeats: int = 3) -> dict[str, Any]:
     }
 
 
+DEFAULT_LOAD_CONCURRENCY = (1, 4, 16)
+DEFAULT_LOAD_MIX = {"check": 8, "quality": 1, "fix": 1}
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@contextlib.contextmanager
+def local_api_server(rate_limit_per_minute: int, startup_timeout: float = 120.0):
+    """Run `uvicorn api:app` on a free local port for the duration of the block; yields its base URL."""
+    port = _free_port()
+    env = os.environ.copy()
+    env["RATE_LIMIT_PER_MINUTE"] = str(rate_limit_per_minute)
+    env["RATE_LIMIT_BACKEND"] = "memory"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode} before becoming ready")
+            try:
+                if httpx.get(f"{base_url}/health/live", timeout=2.0).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn not ready after {startup_timeout:.0f}s")
+            time.sleep(0.2)
+        yield base_url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def build_load_requests(cases: list[Case], mix: dict[str, int], total: int, seed: int) -> list[tuple[str, dict[str, Any]]]:
+    """(endpoint, JSON body) pairs drawn from the case corpus with the given endpoint weights."""
+    fixable: list[tuple[Case, str]] = []
+    for case in cases:
+        for expected in case.expected_types:
+            try:
+                fixable.append((case, api._normalize_fix_type(expected)))
+                break
+            except ValueError:
+                continue
+
+    endpoints = [name for name, weight in mix.items() if weight > 0 and (name != "fix" or fixable)]
+    weights = [mix[name] for name in endpoints]
+    rng = random.Random(seed)
+    requests: list[tuple[str, dict[str, Any]]] = []
+    for _ in range(total):
+        endpoint = rng.choices(endpoints, weights=weights)[0]
+        if endpoint == "fix":
+            case, error_type = rng.choice(fixable)
+            body = {"code": case.code, "error_type": error_type, "language": case.language}
+        else:
+            case = rng.choice(cases)
+            if endpoint == "quality":
+                body = {"code": case.code, "language": case.language.lower()}
+            else:
+                body = {"code": case.code, "filename": None, "language": case.language}
+        requests.append((endpoint, body))
+    return requests
+
+
+async def _drive_load(
+    base_url: str,
+    requests: list[tuple[str, dict[str, Any]]],
+    concurrency: int,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    status_counts: dict[str, int] = {}
+    errors_by_endpoint: dict[str, int] = {}
+    pending = iter(requests)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        for endpoint, body in pending:
+            t0 = time.perf_counter()
+            try:
+                status = str((await client.post(f"/{endpoint}", json=body)).status_code)
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if not status.startswith("2"):
+                errors_by_endpoint[endpoint] = errors_by_endpoint.get(endpoint, 0) + 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits, transport=transport) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    errors = sum(errors_by_endpoint.values())
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 3) if elapsed else None,
+        "p50_latency_ms": round(_pct(latencies, 50), 3),
+        "p95_latency_ms": round(_pct(latencies, 95), 3),
+        "p99_latency_ms": round(_pct(latencies, 99), 3),
+        "error_rate": round(errors / len(latencies), 6) if latencies else None,
+        "status_counts": status_counts,
+        "errors_by_endpoint": errors_by_endpoint,
+    }
+
+
+def run_load_test(
+    cases: list[Case],
+    concurrency_levels: Iterable[int] = DEFAULT_LOAD_CONCURRENCY,
+    requests_per_level: int = 200,
+    mix: dict[str, int] | None = None,
+    rate_limit_per_minute: int = 1_000_000,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Closed-loop load against a locally started uvicorn: at each concurrency
+    level, that many clients send the same seeded request mix back to back.
+
+    The rate limiter stays enabled (with a limit high enough not to throttle)
+    so its lock is on the measured path.
+    """
+    mix = dict(mix or DEFAULT_LOAD_MIX)
+    requests = build_load_requests(cases, mix, requests_per_level, seed)
+    levels: list[dict[str, Any]] = []
+    with local_api_server(rate_limit_per_minute) as base_url:
+        # Warm up imports, model and caches in the server before measuring.
+        asyncio.run(_drive_load(base_url, requests[: min(len(requests), 20)], 1))
+        for concurrency in concurrency_levels:
+            levels.append(asyncio.run(_drive_load(base_url, requests, concurrency)))
+    return {
+        "server": "uvicorn api:app (1 worker, local)",
+        "requests_per_level": requests_per_level,
+        "mix": mix,
+        "rate_limit_per_minute": rate_limit_per_minute,
+        "seed": seed,
+        "levels": levels,
+    }
+
+
 def _pct(values: list[float], percentile: int) -> float:
     if not values:
         return 0.0
@@ -919,6 +1095,7 @@ def build_markdown(
     defects: list[dict[str, Any]],
     root_cause_themes: dict[str, int],
     workspace_integrity: dict[str, Any],
+    load_test: dict[str, Any] | None = None,
 ) -> str:
     lines: list[str] = []
     overall = summary["overall"]
@@ -983,6 +1160,14 @@ def build_markdown(
     lines.append(f"- Core avg latency per case: {stress['core_avg_latency_ms']} ms")
     lines.append(f"- API avg latency per case: {stress['api_avg_latency_ms']} ms")
     lines.append(f"- Consistency verdict: {stress['consistency_verdict']}")
+    if load_test:
+        lines.append(f"- Load test ({load_test['server']}, {load_test['requests_per_level']} requests/level, mix {load_test['mix']}):")
+        for level in load_test["levels"]:
+            lines.append(
+                f"  - concurrency {level['concurrency']}: {level['throughput_rps']} req/s, "
+                f"p50 {level['p50_latency_ms']} ms, p95 {level['p95_latency_ms']} ms, "
+                f"p99 {level['p99_latency_ms']} ms, error rate {level['error_rate']}"
+            )
     lines.append(f"- Core/API mismatch count: {consistency['mismatch_count']}")
     lines.append("")
     lines.append("## 9. Bug List Prioritized")
@@ -1021,13 +1206,44 @@ def build_markdown(
     lines.append("")
     lines.append("## Pathway Runtime Summary")
     lines.append(f"- API total evaluations: {api_results['total']}, avg latency: {api_results['avg_latency_ms']} ms")
-    lines.append(f"- CLI sampled evaluations: {cli_results['sample_total']}, avg latency: {cli_results['avg_latency_ms']} ms")
+    lines.append(f"- CLI sampled evaluations: {cli_results['sample_total']}, avg latency: {cli_results['avg_latency_ms']} ms (in-process)")
+    if cli_results.get("startup"):
+        startup = cli_results["startup"]
+        lines.append(f"- CLI worker startup: {startup['startup_ms']} ms, warm round trip: {startup['warm_roundtrip_ms']} ms")
     lines.append(f"- Streamlit expectation simulations: {streamlit_results['total']}, avg latency: {streamlit_results['avg_latency_ms']} ms")
 
     return "\n".join(lines) + "\n"
 
 
+def _parse_mix(value: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_LOAD_MIX:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {name!r} (choose from {', '.join(DEFAULT_LOAD_MIX)})")
+        mix[name] = int(weight or 1)
+    return mix
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end QA audit for OmniSyntax")
+    parser.add_argument("--load", action="store_true", help="Also load-test a locally started uvicorn server")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(level) for level in value.split(",")],
+        default=list(DEFAULT_LOAD_CONCURRENCY),
+        help="Comma-separated concurrency levels for --load (default: 1,4,16)",
+    )
+    parser.add_argument("--load-requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument(
+        "--load-mix",
+        type=_parse_mix,
+        default=dict(DEFAULT_LOAD_MIX),
+        help="Endpoint weights for --load, e.g. check=8,quality=1,fix=1",
+    )
+    args = parser.parse_args()
+
     # Avoid throttling QA loops while still exercising the same /check handler.
     api.RATE_LIMIT_PER_MINUTE = 0
     api._REQUEST_LOG.clear()
@@ -1041,6 +1257,11 @@ def main() -> None:
     streamlit_results = evaluate_streamlit_expectations(CASES)
     consistency = compute_consistency(core_records, api_results["records"])
     stress = run_stress(CASES, repeats=3)
+    load_test = (
+        run_load_test(CASES, args.concurrency, args.load_requests, args.load_mix)
+        if args.load
+        else None
+    )
     defects, root_cause_themes = build_defects(core_records)
 
     out_dir = Path("artifacts") / "qa"
@@ -1076,6 +1297,7 @@ def main() -> None:
         },
         "consistency": consistency,
         "stress": stress,
+        "load_test": load_test,
         "defects": defects,
         "root_cause_themes": root_cause_themes,
         "remediation_plan": {
@@ -1116,6 +1338,7 @@ def main() -> None:
             defects,
             root_cause_themes,
             workspace_integrity,
+            load_test,
         ),
         encoding="utf-8",
     )
@@ -459,6 +459,152 @@ def forced_model_unavailable():
         api_module.get_model_status = old_api_get_model_status
 
 
+def evaluate_sample(
+    client: TestClient,
+    smp: Sample,
+    mode: str,
+    evaluate_fix: bool,
+    evaluate_quality: bool,
+) -> dict:
+    core = detect_errors(smp.code, smp.filename, smp.language)
+    core_pred = normalize_label(str(core["predicted_error"]))
+    core_conf = float(core.get("confidence", 0.0))
+    core_warn = core.get("warnings", [])
+
+    check_resp = client.post(
+        "/check",
+        json={"code": smp.code, "filename": smp.filename, "language": smp.language},
+    )
+    if check_resp.status_code == 200:
+        check_payload = check_resp.json()
+        api_pred = normalize_label(str(check_payload["predicted_error"]))
+        api_conf = float(check_payload.get("confidence", 0.0))
+        api_warn = check_payload.get("warnings", [])
+    else:
+        api_pred = "API_ERROR"
+        api_conf = 0.0
+        api_warn = [json.dumps(check_resp.json())]
+
+    fix_status = None
+    fix_success = None
+    fix_changes = None
+    if evaluate_fix:
+        err_for_fix = api_pred if api_pred != "API_ERROR" else core_pred
+        line_num = None
+        if core.get("rule_based_issues"):
+            first = core["rule_based_issues"][0]
+            if first.get("line") is not None:
+                line_num = int(first["line"]) - 1
+        fix_resp = client.post(
+            "/fix",
+            json={
+                "code": smp.code,
+                "error_type": err_for_fix,
+                "language": smp.language,
+                "line_num": line_num,
+            },
+        )
+        fix_status = int(fix_resp.status_code)
+        if fix_resp.status_code == 200:
+            fix_payload = fix_resp.json()
+            fix_success = bool(fix_payload.get("success", False))
+            fix_changes = len(fix_payload.get("changes", []))
+        else:
+            fix_success = False
+            fix_changes = None
+
+    quality_status = None
+    quality_score = None
+    quality_complexity = None
+    quality_parity = None
+    if evaluate_quality:
+        q_resp = client.post(
+            "/quality",
+            json={"code": smp.code, "language": smp.language.lower()},
+        )
+        quality_status = int(q_resp.status_code)
+        if q_resp.status_code == 200:
+            q_payload = q_resp.json()
+            quality_score = float(q_payload.get("quality_score", 0.0))
+            quality_complexity = int(q_payload.get("complexity", 0))
+            local_quality = CodeQualityAnalyzer(smp.code, smp.language.lower()).analyze()
+            quality_parity = (
+                abs(local_quality["quality_score"] - quality_score) < 1e-9
+                and int(local_quality["complexity"]) == quality_complexity
+            )
+
+    return {
+        **asdict(smp),
+        "mode": mode,
+        "expected_label_norm": normalize_label(smp.expected_label),
+        "core_predicted": core_pred,
+        "core_confidence": core_conf,
+        "core_degraded_mode": bool(core.get("degraded_mode", False)),
+        "core_warning_count": len(core_warn),
+        "api_status": int(check_resp.status_code),
+        "api_predicted": api_pred,
+        "api_confidence": api_conf,
+        "api_warning_count": len(api_warn),
+        "api_core_match": core_pred == api_pred,
+        "fix_status": fix_status,
+        "fix_success": fix_success,
+        "fix_changes_count": fix_changes,
+        "quality_status": quality_status,
+        "quality_score": quality_score,
+        "quality_complexity": quality_complexity,
+        "quality_core_parity": quality_parity,
+    }
+
+
+# Per-process state for pool workers: each builds its own API client once.
+_WORKER_CLIENT: TestClient | None = None
+_WORKER_CONTEXT = contextlib.ExitStack()
+
+
+def _init_worker(reload_api: bool, forced_unavailable: bool) -> None:
+    global _WORKER_CLIENT
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    _WORKER_CLIENT = setup_api_client(reload_api=reload_api)
+    if forced_unavailable:
+        _WORKER_CONTEXT.enter_context(forced_model_unavailable())
+
+
+def _evaluate_chunk(mode: str, chunk: list[tuple[Sample, bool, bool]]) -> list[dict]:
+    assert _WORKER_CLIENT is not None
+    return [evaluate_sample(_WORKER_CLIENT, smp, mode, run_fix, run_quality) for smp, run_fix, run_quality in chunk]
+
+
+def checkpoint_run_key(mode: str, seed: int, plan: list[tuple[Sample, bool, bool]]) -> str:
+    """Identifies one evaluation plan; a checkpoint is only resumed under the same key."""
+    digest = hashlib.sha256(f"{mode}|{seed}".encode("utf-8"))
+    for smp, run_fix, run_quality in plan:
+        digest.update(f"{smp.sample_id}|{int(run_fix)}|{int(run_quality)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_checkpoint(path: Path, run_key: str) -> dict[str, dict]:
+    """Rows already streamed to ``path`` by an interrupted run with the same plan, by sample id."""
+    if not path.exists():
+        return {}
+    done: dict[str, dict] = {}
+    with path.open(encoding="utf-8") as handle:
+        lines = handle.read().split("\n")
+    try:
+        header = json.loads(lines[0])
+    except (json.JSONDecodeError, IndexError):
+        return {}
+    if header.get("run_key") != run_key:
+        return {}
+    for line in lines[1:]:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            # A write cut short by the interruption; that sample is evaluated again.
+            continue
+        done[row["sample_id"]] = row
+    return done
+
+
 def evaluate_samples(
     samples: list[Sample],
     mode: str,
@@ -467,116 +613,92 @@ def evaluate_samples(
     evaluate_fix_sample_size: int,
     reload_api: bool,
     seed: int,
+    workers: int = 1,
+    chunk_size: int = 64,
+    forced_unavailable: bool = False,
+    checkpoint_path: Path | None = None,
+    resume: bool = False,
+    fresh: bool = False,
 ) -> tuple[pd.DataFrame, dict]:
+    """
+    Evaluate every sample through the engine and the API routes.
+
+    The /quality and /fix subsets are drawn here from ``seed``, so they do not
+    depend on ``workers``. With ``workers > 1`` samples are sharded into
+    ``chunk_size`` chunks across a process pool (each worker has its own API
+    client) and merged back in sample order. Finished rows are appended to
+    ``checkpoint_path`` as they complete; with ``resume`` a checkpoint left by
+    an interrupted run of the same plan is reused and only the rest evaluated.
+    Such a checkpoint is only overwritten with ``fresh``; otherwise
+    FileExistsError is raised before anything is evaluated.
+    """
     rng = random.Random(seed)
-    client = setup_api_client(reload_api=reload_api)
-    health = client.get("/health").json()
-
-    quality_indices = set()
-    if evaluate_quality_sample_size > 0 and samples:
-        idxs = list(range(len(samples)))
-        rng.shuffle(idxs)
-        quality_indices = set(idxs[: min(evaluate_quality_sample_size, len(idxs))])
-
-    fix_indices = set()
-    if evaluate_fix and evaluate_fix_sample_size > 0 and samples:
-        error_candidates = [i for i, smp in enumerate(samples) if smp.expected_label != "NoError"]
-        rng.shuffle(error_candidates)
-        fix_indices.update(error_candidates[: min(evaluate_fix_sample_size, len(error_candidates))])
-
-    rows: list[dict] = []
-    for idx, smp in enumerate(samples):
-        core = detect_errors(smp.code, smp.filename, smp.language)
-        core_pred = normalize_label(str(core["predicted_error"]))
-        core_conf = float(core.get("confidence", 0.0))
-        core_warn = core.get("warnings", [])
-
-        check_resp = client.post(
-            "/check",
-            json={"code": smp.code, "filename": smp.filename, "language": smp.language},
-        )
-        if check_resp.status_code == 200:
-            check_payload = check_resp.json()
-            api_pred = normalize_label(str(check_payload["predicted_error"]))
-            api_conf = float(check_payload.get("confidence", 0.0))
-            api_warn = check_payload.get("warnings", [])
-        else:
-            api_pred = "API_ERROR"
-            api_conf = 0.0
-            api_warn = [json.dumps(check_resp.json())]
-
-        fix_status = None
-        fix_success = None
-        fix_changes = None
-        if evaluate_fix and idx in fix_indices:
-            err_for_fix = api_pred if api_pred != "API_ERROR" else core_pred
-            line_num = None
-            if core.get("rule_based_issues"):
-                first = core["rule_based_issues"][0]
-                if first.get("line") is not None:
-                    line_num = int(first["line"]) - 1
-            fix_resp = client.post(
-                "/fix",
-                json={
-                    "code": smp.code,
-                    "error_type": err_for_fix,
-                    "language": smp.language,
-                    "line_num": line_num,
-                },
+    unavailable = forced_model_unavailable() if forced_unavailable else contextlib.nullcontext()
+    with unavailable:
+        client = setup_api_client(reload_api=reload_api)
+        health = client.get("/health").json()
+
+        quality_indices = set()
+        if evaluate_quality_sample_size > 0 and samples:
+            idxs = list(range(len(samples)))
+            rng.shuffle(idxs)
+            quality_indices = set(idxs[: min(evaluate_quality_sample_size, len(idxs))])
+
+        fix_indices = set()
+        if evaluate_fix and evaluate_fix_sample_size > 0 and samples:
+            error_candidates = [i for i, smp in enumerate(samples) if smp.expected_label != "NoError"]
+            rng.shuffle(error_candidates)
+            fix_indices.update(error_candidates[: min(evaluate_fix_sample_size, len(error_candidates))])
+
+        plan = [
+            (smp, evaluate_fix and idx in fix_indices, idx in quality_indices)
+            for idx, smp in enumerate(samples)
+        ]
+        run_key = checkpoint_run_key(mode, seed, plan)
+        done = load_checkpoint(checkpoint_path, run_key) if checkpoint_path is not None and not fresh else {}
+        if done and not resume:
+            raise FileExistsError(
+                f"{checkpoint_path} holds {len(done)} rows of an interrupted run with the same arguments; "
+                "pass --resume to continue it or --fresh to discard it"
             )
-            fix_status = int(fix_resp.status_code)
-            if fix_resp.status_code == 200:
-                fix_payload = fix_resp.json()
-                fix_success = bool(fix_payload.get("success", False))
-                fix_changes = len(fix_payload.get("changes", []))
+        pending = [entry for entry in plan if entry[0].sample_id not in done]
+
+        checkpoint = None
+        if checkpoint_path is not None:
+            checkpoint = checkpoint_path.open("w", encoding="utf-8")
+            checkpoint.write(json.dumps({"run_key": run_key, "mode": mode}) + "\n")
+            for row in done.values():
+                checkpoint.write(json.dumps(row, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+
+        def record(chunk_rows: list[dict]) -> None:
+            for row in chunk_rows:
+                done[row["sample_id"]] = row
+                if checkpoint is not None:
+                    checkpoint.write(json.dumps(row, ensure_ascii=False) + "\n")
+            if checkpoint is not None:
+                checkpoint.flush()
+
+        try:
+            if workers > 1 and len(pending) > chunk_size:
+                from concurrent.futures import ProcessPoolExecutor
+
+                chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(reload_api, forced_unavailable),
+                ) as pool:
+                    for chunk_rows in pool.map(_evaluate_chunk, [mode] * len(chunks), chunks):
+                        record(chunk_rows)
             else:
-                fix_success = False
-                fix_changes = None
-
-        quality_status = None
-        quality_score = None
-        quality_complexity = None
-        quality_parity = None
-        if idx in quality_indices:
-            q_resp = client.post(
-                "/quality",
-                json={"code": smp.code, "language": smp.language.lower()},
-            )
-            quality_status = int(q_resp.status_code)
-            if q_resp.status_code == 200:
-                q_payload = q_resp.json()
-                quality_score = float(q_payload.get("quality_score", 0.0))
-                quality_complexity = int(q_payload.get("complexity", 0))
-                local_quality = CodeQualityAnalyzer(smp.code, smp.language.lower()).analyze()
-                quality_parity = (
-                    abs(local_quality["quality_score"] - quality_score) < 1e-9
-                    and int(local_quality["complexity"]) == quality_complexity
-                )
-
-        rows.append(
-            {
-                **asdict(smp),
-                "mode": mode,
-                "expected_label_norm": normalize_label(smp.expected_label),
-                "core_predicted": core_pred,
-                "core_confidence": core_conf,
-                "core_degraded_mode": bool(core.get("degraded_mode", False)),
-                "core_warning_count": len(core_warn),
-                "api_status": int(check_resp.status_code),
-                "api_predicted": api_pred,
-                "api_confidence": api_conf,
-                "api_warning_count": len(api_warn),
-                "api_core_match": core_pred == api_pred,
-                "fix_status": fix_status,
-                "fix_success": fix_success,
-                "fix_changes_count": fix_changes,
-                "quality_status": quality_status,
-                "quality_score": quality_score,
-                "quality_complexity": quality_complexity,
-                "quality_core_parity": quality_parity,
-            }
-        )
+                for smp, run_fix, run_quality in pending:
+                    record([evaluate_sample(client, smp, mode, run_fix, run_quality)])
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
 
+    rows = [done[smp.sample_id] for smp in samples]
     df = pd.DataFrame(rows)
     route_summary = {
         "health": health,
@@ -820,6 +942,19 @@ def main() -> int:
     parser.add_argument("--fix-sample-size", type=int, default=5000)
     parser.add_argument("--compare-sample-size", type=int, default=5000)
     parser.add_argument("--output-dir", default="artifacts/accuracy")
+    parser.add_argument("--workers", type=int, default=1, help="Processes to shard samples across")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Samples per worker task")
+    restart = parser.add_mutually_exclusive_group()
+    restart.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse rows checkpointed by an interrupted run with the same arguments",
+    )
+    restart.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Discard the checkpoint of an interrupted run with the same arguments",
+    )
     args = parser.parse_args()
 
     started = time.time()
@@ -865,15 +1000,24 @@ def main() -> int:
 
     write_jsonl(out_dir / "corpus.jsonl", (asdict(s) for s in corpus))
 
-    available_df, available_routes = evaluate_samples(
-        samples=corpus,
-        mode="available",
-        evaluate_quality_sample_size=args.quality_sample_size,
-        evaluate_fix=True,
-        evaluate_fix_sample_size=args.fix_sample_size,
-        reload_api=True,
-        seed=args.seed + 1000,
-    )
+    checkpoint_paths = [out_dir / "checkpoint_available.jsonl", out_dir / "checkpoint_forced_unavailable.jsonl"]
+    try:
+        available_df, available_routes = evaluate_samples(
+            samples=corpus,
+            mode="available",
+            evaluate_quality_sample_size=args.quality_sample_size,
+            evaluate_fix=True,
+            evaluate_fix_sample_size=args.fix_sample_size,
+            reload_api=True,
+            seed=args.seed + 1000,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            checkpoint_path=checkpoint_paths[0],
+            resume=args.resume,
+            fresh=args.fresh,
+        )
+    except FileExistsError as exc:
+        parser.error(str(exc))
 
     compare_subset = available_df.sample(
         n=min(args.compare_sample_size, len(available_df)),
@@ -894,7 +1038,7 @@ def main() -> int:
         for _, row in compare_subset.iterrows()
     ]
 
-    with forced_model_unavailable():
+    try:
         forced_df, forced_routes = evaluate_samples(
             samples=compare_samples,
             mode="forced_unavailable",
@@ -903,7 +1047,15 @@ def main() -> int:
             evaluate_fix_sample_size=min(1500, args.fix_sample_size),
             reload_api=False,
             seed=args.seed + 2000,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            forced_unavailable=True,
+            checkpoint_path=checkpoint_paths[1],
+            resume=args.resume,
+            fresh=args.fresh,
         )
+    except FileExistsError as exc:
+        parser.error(str(exc))
 
     available_metrics = metrics_from_predictions(available_df, labels=labels)
     available_calibration = calibration_bins(available_df, bins=10)
@@ -970,6 +1122,7 @@ def main() -> int:
         "quality_sample_size": args.quality_sample_size,
         "fix_sample_size": args.fix_sample_size,
         "compare_sample_size": args.compare_sample_size,
+        "workers": args.workers,
         "output_dir": str(out_dir),
         "total_corpus_samples": len(corpus),
         "labels": labels,
@@ -988,6 +1141,9 @@ def main() -> int:
         ],
     }
     (out_dir / "run_manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    # The run finished, so a later run with the same arguments starts over without --fresh.
+    for path in checkpoint_paths:
+        path.unlink(missing_ok=True)
 
     print(
         json.dumps(
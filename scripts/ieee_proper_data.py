@@ -9,7 +9,6 @@ import json
 import os
 import sys
 import warnings
-from typing import cast
 warnings.filterwarnings('ignore')
 
 sys.path.insert(0, os.path.abspath('.'))
@@ -20,9 +19,8 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import cross_val_score, StratifiedKFold, train_test_split
 from sklearn.preprocessing import LabelEncoder
-from scipy.sparse import hstack, csr_matrix
 
-from src.feature_utils import extract_numerical_features
+from scripts.utils.feature_cache import load_or_build_features
 
 # ── Load & feature build ────────────────────────────────────────────────────
 df = pd.read_csv("dataset/merged/all_errors_v3.csv")
@@ -36,9 +34,11 @@ y = np.asarray(le.fit_transform(labels))
 
 print("Building features...")
 tfidf = TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 4), max_features=5000, sublinear_tf=True)
-X_tfidf = tfidf.fit_transform(texts)
-X_num = np.array([extract_numerical_features(c) for c in texts])
-X = cast(csr_matrix, csr_matrix(hstack([X_tfidf, csr_matrix(X_num)], format="csr")))
+features = load_or_build_features(texts, labels, tfidf, fit=True)
+tfidf = features.vectorizer
+X = features.matrix
+if features.cached:
+    print("  (loaded from feature cache)")
 
 X_train, X_test, y_train, y_test, idx_train, idx_test = train_test_split(
     X, y, np.arange(len(texts)), test_size=0.2, random_state=42, stratify=y
@@ -150,8 +150,7 @@ lang_dist = pd.Series(languages).value_counts().to_dict()
 err_dist = pd.Series(labels).value_counts().to_dict()
 avg_len = float(np.mean([len(t) for t in texts]))
 model_size = os.path.getsize("models/syntax_error_model.pkl") / (1024 * 1024)
-x_shape = getattr(X, "shape", None)
-feature_dim = int(x_shape[1]) if x_shape is not None and len(x_shape) > 1 else int(X_tfidf.shape[1] + X_num.shape[1])
+feature_dim = int(X.shape[1])
 
 # ── DUMP ─────────────────────────────────────────────────────────────────────
 out = {
@@ -1,20 +1,26 @@
 """
 retrain_model.py
 ================
-Retrains the Gradient Boosting model on the augmented dataset.
+Retrains the error classifier on the augmented dataset.
 
 Preserves the EXACT same feature pipeline as the original model:
   - TF-IDF vectorizer (text features from code)
   - 10 numerical features (code_length, num_lines, etc.)
-  - GradientBoostingClassifier
+  - a classifier from one of the trainer backends (see TRAINER_BACKENDS),
+    GradientBoostingClassifier by default
 
-Overwrites the existing model files so the app immediately uses new model.
+Overwrites the existing model files so the app immediately uses new model,
+and exports the same model as compact NumPy arrays (models/compact-<digest>/)
+that ml_engine predicts from without scikit-learn.
 
 Usage:
     python retrain_model.py                    # full retrain, auto-find dataset
     python retrain_model.py --dataset dataset/merged/all_errors_v3.csv
     python retrain_model.py --preview          # show dataset stats only, no train
     python retrain_model.py --compare          # compare old vs new model accuracy
+    python retrain_model.py --backend forest --n-jobs 4
+    python retrain_model.py --backend gb,hist,linear,forest --no-save   # side-by-side timing
+    python retrain_model.py --export-compact   # convert the saved pickles, no training
 """
 
 import os
@@ -29,7 +35,7 @@ from collections import Counter
 from typing import Any, cast
 
 import numpy as np
-from scipy.sparse import hstack
+from scipy.sparse import csr_matrix, hstack
 
 warnings.filterwarnings('ignore')
 
@@ -41,7 +47,18 @@ for _p in (_src_root, _project_root, os.getcwd()):
     if _p not in sys.path:
         sys.path.insert(0, _p)
 
+from src.compact_model import (
+    COMPACT_DIRNAME,
+    COMPACT_METADATA_KEY,
+    MANIFEST_FILENAME,
+    CompactModelError,
+    compact_files,
+    export_compact_model,
+    file_sha256,
+    remove_compact_exports,
+)
 from src.feature_utils import extract_numerical_features, NUMERICAL_FEATURE_NAMES
+from scripts.utils.feature_cache import DEFAULT_CACHE_DIR, build_feature_matrix, load_or_build_features
 
 # ─── Colour helpers ──────────────────────────────────────────────────────────
 from src.utils.cli_colors import GREEN, RED, YELLOW, CYAN, BOLD, RESET, green, red, yellow, bold, cyan
@@ -69,6 +86,29 @@ MODEL_FILES = {
 }
 MODEL_BUNDLE_METADATA = "bundle_metadata.json"
 
+# Trainer backends: name -> (artifact format suffix, description). Every
+# backend's model takes the same TF-IDF + numerical matrix in predict_proba,
+# so ml_engine loads any of them from the same bundle files.
+TRAINER_BACKENDS = {
+    "gb":     ("gradient_boosting",          "GradientBoostingClassifier (single-threaded, slowest)"),
+    "hist":   ("svd+hist_gradient_boosting", "TruncatedSVD-reduced TF-IDF + HistGradientBoostingClassifier"),
+    "linear": ("linear_sgd",                 "MaxAbs-scaled SGD logistic regression"),
+    "forest": ("random_forest",              "RandomForestClassifier"),
+}
+DEFAULT_BACKEND = "gb"
+SVD_COMPONENTS = 128
+FOREST_STEP = 25         # trees added per early-stopping round
+EARLY_STOPPING_ROUNDS = 10
+COMPACT_CHECK_SAMPLES = 500  # dataset rows the compact export must reproduce exactly
+
+SMOKE_TEST_CASES = [
+    ("x = 1/0",                    "DivisionByZero"),
+    ("def foo()\n    pass",         "MissingColon"),
+    ("from os import *",            "WildcardImport"),
+    ("print('Hello'",              "UnmatchedBracket"),
+    ("def f():\n    return 1\n    dead_code()", "UnreachableCode"),
+]
+
 
 def configure_console_output():
     for stream_name in ("stdout", "stderr"):
@@ -78,7 +118,7 @@ def configure_console_output():
             reconfigure(encoding="utf-8", errors="replace")
 
 
-def get_bundle_metadata():
+def get_bundle_metadata(backend=DEFAULT_BACKEND):
     import sklearn
 
     version = sklearn.__version__
@@ -86,10 +126,60 @@ def get_bundle_metadata():
     return {
         "sklearn_version": version,
         "sklearn_major_minor": major_minor,
-        "artifact_format": "tfidf+numerical+gradient_boosting",
+        "artifact_format": f"tfidf+numerical+{TRAINER_BACKENDS[backend][0]}",
+        "trainer_backend": backend,
     }
 
 
+def read_bundle_metadata(model_dir):
+    path = os.path.join(model_dir, MODEL_BUNDLE_METADATA)
+    try:
+        with open(path, encoding="utf-8") as metadata_file:
+            metadata = json.load(metadata_file)
+    except (OSError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def write_bundle_metadata(model_dir, metadata):
+    """Write bundle_metadata.json with the sha256 of every bundle file present.
+
+    ml_engine refuses any file whose hash does not match, so this runs last,
+    after the pickles and the compact export named by metadata["compact"] are
+    in place. Replacing this file is what moves servers to the new export;
+    only then are older exports deleted, except the one just replaced, which
+    a server that has not reloaded yet may still have mapped.
+    """
+    previous = read_bundle_metadata(model_dir).get(COMPACT_METADATA_KEY)
+    compact_name = metadata.get(COMPACT_METADATA_KEY)
+    names = [name for name in MODEL_FILES.values() if os.path.exists(os.path.join(model_dir, name))]
+    if compact_name:
+        names += [f"{compact_name}/{name}" for name in compact_files(os.path.join(model_dir, compact_name))]
+    metadata = dict(metadata, files={name: file_sha256(os.path.join(model_dir, name)) for name in names})
+    path = os.path.join(model_dir, MODEL_BUNDLE_METADATA)
+    # A running API may be watching this file (MODEL_RELOAD_INTERVAL_SECONDS): never leave it half-written.
+    staging = f"{path}.tmp"
+    with open(staging, "w", encoding="utf-8") as metadata_file:
+        json.dump(metadata, metadata_file, indent=2, sort_keys=True)
+    os.replace(staging, path)
+    remove_compact_exports(model_dir, keep=[name for name in (compact_name, previous) if isinstance(name, str)])
+    return path
+
+
+def parse_backends(value):
+    """Comma-separated backend names, validated and de-duplicated in order."""
+    backends = []
+    for name in value.split(','):
+        name = name.strip()
+        if name not in TRAINER_BACKENDS:
+            raise argparse.ArgumentTypeError(
+                f"unknown backend {name!r} (choose from {', '.join(TRAINER_BACKENDS)})"
+            )
+        if name not in backends:
+            backends.append(name)
+    return backends
+
+
 def find_dataset(override=None):
     if override and os.path.exists(override):
         return override
@@ -111,13 +201,7 @@ def find_model_dir():
 
 def build_features(codes, tfidf, fit_tfidf=False):
     """Build combined TF-IDF + numerical feature matrix."""
-    if fit_tfidf:
-        tfidf_matrix = tfidf.fit_transform(codes)
-    else:
-        tfidf_matrix = tfidf.transform(codes)
-
-    num_matrix = np.array([extract_numerical_features(c) for c in codes])
-    return hstack([tfidf_matrix, num_matrix]).tocsr()
+    return build_feature_matrix(codes, tfidf, fit=fit_tfidf)
 
 
 # ─── Load dataset ────────────────────────────────────────────────────────────
@@ -149,9 +233,119 @@ def print_dataset_stats(rows, title="Dataset Statistics"):
 
 
 # ─── Training ─────────────────────────────────────────────────────────────────
-def train_model(rows, model_dir, compare_old=False):
+def build_classifier(backend, n_text_features, n_jobs=-1, early_stopping=True):
+    """Untrained estimator for ``backend`` over the TF-IDF + numerical matrix.
+
+    The first ``n_text_features`` columns are the TF-IDF block; the hist
+    backend reduces only those with TruncatedSVD and passes the numerical
+    columns through unchanged.
+    """
+    if backend == "gb":
+        from sklearn.ensemble import GradientBoostingClassifier
+        return GradientBoostingClassifier(
+            n_estimators=200,
+            learning_rate=0.1,
+            max_depth=5,
+            subsample=0.8,
+            min_samples_split=5,
+            n_iter_no_change=EARLY_STOPPING_ROUNDS if early_stopping else None,
+            validation_fraction=0.1,
+            random_state=42,
+            verbose=0
+        )
+    if backend == "hist":
+        from sklearn.compose import ColumnTransformer
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import FunctionTransformer
+        reduce = ColumnTransformer(
+            [
+                ("svd", TruncatedSVD(n_components=SVD_COMPONENTS, random_state=42), slice(0, n_text_features)),
+                ("numerical", "passthrough", slice(n_text_features, None)),
+            ],
+            sparse_threshold=0,
+        )
+        return Pipeline([
+            # ml_engine hands over a COO matrix, which cannot be column-sliced.
+            ("csr", FunctionTransformer(csr_matrix, accept_sparse=True)),
+            ("reduce", reduce),
+            ("clf", HistGradientBoostingClassifier(
+                max_iter=200,
+                learning_rate=0.1,
+                early_stopping=early_stopping,
+                n_iter_no_change=EARLY_STOPPING_ROUNDS,
+                validation_fraction=0.1,
+                random_state=42,
+            )),
+        ])
+    if backend == "linear":
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.pipeline import Pipeline
+        from sklearn.preprocessing import MaxAbsScaler
+        return Pipeline([
+            ("scale", MaxAbsScaler()),
+            ("clf", SGDClassifier(
+                loss="log_loss",
+                early_stopping=early_stopping,
+                n_iter_no_change=EARLY_STOPPING_ROUNDS,
+                validation_fraction=0.1,
+                n_jobs=n_jobs,
+                random_state=42,
+            )),
+        ])
+    if backend == "forest":
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(n_estimators=200, n_jobs=n_jobs, random_state=42)
+    raise ValueError(f"unknown trainer backend: {backend}")
+
+
+def fit_classifier(backend, clf, X_train, y_train, n_jobs=-1, early_stopping=True):
+    """Fit ``clf`` and return how many rounds it used (boosting stages, epochs or trees).
+
+    Boosting and SGD stop on their own validation split. The forest grows
+    FOREST_STEP trees at a time and stops once the out-of-bag score stops
+    improving. A positive ``n_jobs`` also caps the OpenMP/BLAS threads the
+    hist backend and the SVD use.
+    """
+    from threadpoolctl import threadpool_limits
+
+    with threadpool_limits(limits=n_jobs if n_jobs > 0 else None):
+        if backend == "forest" and early_stopping:
+            target = clf.n_estimators
+            best = -1.0
+            clf.set_params(warm_start=True, oob_score=True, n_estimators=0)
+            while clf.n_estimators < target:
+                clf.set_params(n_estimators=min(target, clf.n_estimators + FOREST_STEP))
+                clf.fit(X_train, y_train)
+                if clf.oob_score_ <= best:
+                    break
+                best = clf.oob_score_
+            clf.set_params(warm_start=False)
+        else:
+            clf.fit(X_train, y_train)
+
+    if backend == "gb":
+        return clf.n_estimators_
+    if backend == "forest":
+        return len(clf.estimators_)
+    return clf[-1].n_iter_
+
+
+def train_model(rows, model_dir, compare_old=False, backends=(DEFAULT_BACKEND,), n_jobs=-1, early_stopping=True,
+                feature_cache=DEFAULT_CACHE_DIR):
+    """Train every backend in ``backends`` on one split and keep the most accurate.
+
+    With several backends the winner is chosen on a validation split carved
+    from the training rows and then refitted on all of them; the test split
+    only scores the kept model, so its accuracy is not inflated by the choice.
+
+    Features come from ``feature_cache`` when this dataset and vectorizer
+    config were featurized before (None disables the cache).
+
+    Returns (classifier, label encoder, vectorizer, accuracy, backend).
+    """
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.ensemble import GradientBoostingClassifier
     from sklearn.preprocessing import LabelEncoder
     from sklearn.model_selection import train_test_split
     from sklearn.metrics import accuracy_score, classification_report
@@ -171,8 +365,11 @@ def train_model(rows, model_dir, compare_old=False):
         max_features=5000,
         sublinear_tf=True
     )
-    X = build_features(codes, tfidf, fit_tfidf=True)
-    print(f"  Feature matrix: {X.shape}")
+    start = time.time()
+    features = load_or_build_features(codes, labels, tfidf, fit=True, cache_dir=feature_cache)
+    X, tfidf = features.matrix, features.vectorizer
+    source = "cache" if features.cached else "built"
+    print(f"  Feature matrix: {X.shape}  ({source} in {time.time() - start:.2f}s)")
 
     print(f"\n  {bold('Step 3: Train/test split (80/20)...')}")
     indices = np.arange(len(codes))
@@ -225,27 +422,56 @@ def train_model(rows, model_dir, compare_old=False):
             except Exception as e:
                 print(f"\n  Could not load old model for comparison: {e}")
 
-    print(f"\n  {bold('Step 4: Training GradientBoostingClassifier...')}")
-    print(f"  (This takes 2-5 minutes...)")
-    start = time.time()
-
-    clf = GradientBoostingClassifier(
-        n_estimators=200,
-        learning_rate=0.1,
-        max_depth=5,
-        subsample=0.8,
-        min_samples_split=5,
-        random_state=42,
-        verbose=0
-    )
-    clf.fit(X_train, y_train)
-    elapsed = time.time() - start
-    print(f"  Training complete in {elapsed:.1f}s")
+    n_text_features = len(tfidf.vocabulary_)
+    selecting = len(backends) > 1
+    if selecting:
+        fit_idx, val_idx = train_test_split(
+            np.arange(len(y_train)), test_size=0.2, random_state=42, stratify=y_train
+        )
+        X_fit, y_fit = X_train[fit_idx], y_train[fit_idx]
+        X_val, y_val = X_train[val_idx], y_train[val_idx]
+        print(f"\n  Backend selection: {len(fit_idx)} train / {len(val_idx)} validation rows (test rows held out)")
+    else:
+        X_fit, y_fit = X_train, y_train
+
+    results = []
+    for backend in backends:
+        print(f"\n  {bold(f'Step 4: Training {backend} — {TRAINER_BACKENDS[backend][1]}...')}")
+        if backend == "gb":
+            print(f"  (This takes 2-5 minutes...)")
+        clf = build_classifier(backend, n_text_features, n_jobs=n_jobs, early_stopping=early_stopping)
+        start = time.time()
+        rounds = fit_classifier(backend, clf, X_fit, y_fit, n_jobs=n_jobs, early_stopping=early_stopping)
+        elapsed = time.time() - start
+        print(f"  Training complete in {elapsed:.1f}s ({rounds} rounds)")
+
+        if selecting:
+            acc = accuracy_score(y_val, clf.predict(X_val)) * 100
+            print(f"  Validation accuracy: {green(f'{acc:.4f}%')}")
+        else:
+            acc = accuracy_score(y_test, clf.predict(X_test)) * 100
+            print(f"  Test accuracy: {green(f'{acc:.4f}%')}")
+        results.append({"backend": backend, "clf": clf, "seconds": elapsed, "rounds": rounds, "accuracy": acc})
 
     print(f"\n  {bold('Step 5: Evaluating...')}")
+    column = "Val acc" if selecting else "Accuracy"
+    print(f"\n  {'Backend':<10} {'Fit (s)':>8} {'Rounds':>7} {column:>10}")
+    print(f"  {'─'*10} {'─'*8} {'─'*7} {'─'*10}")
+    if old_acc is not None and not selecting:
+        print(f"  {'previous':<10} {'-':>8} {'-':>7} {old_acc:9.4f}%")
+    for result in results:
+        print(f"  {result['backend']:<10} {result['seconds']:8.1f} {result['rounds']:7d} {result['accuracy']:9.4f}%")
+
+    best = max(results, key=lambda result: result["accuracy"])
+    clf = best["clf"]
+    if selecting:
+        print(f"\n  Keeping {bold(best['backend'])} (validation {best['accuracy']:.4f}%), refitting on all training rows...")
+        clf = build_classifier(best["backend"], n_text_features, n_jobs=n_jobs, early_stopping=early_stopping)
+        fit_classifier(best["backend"], clf, X_train, y_train, n_jobs=n_jobs, early_stopping=early_stopping)
     y_pred = clf.predict(X_test)
     acc = accuracy_score(y_test, y_pred) * 100
-    print(f"  Test accuracy: {green(f'{acc:.4f}%')}")
+    if selecting:
+        print(f"  Test accuracy: {green(f'{acc:.4f}%')}")
 
     # Per-class metrics
     report = cast(
@@ -278,11 +504,32 @@ def train_model(rows, model_dir, compare_old=False):
         sign = "+" if delta >= 0 else ""
         print(f"\n  Old model: {old_acc:.4f}%  →  New model: {acc:.4f}%  ({sign}{delta:.4f}%)")
 
-    return clf, le, tfidf, acc
+    return clf, le, tfidf, acc, best["backend"]
 
 
 # ─── Save model ───────────────────────────────────────────────────────────────
-def save_model(clf, le, tfidf, model_dir):
+def export_compact(clf, le, tfidf, model_dir, check_codes=()):
+    """Write a models/compact-<digest>/ export for ``clf``; returns its name, or None.
+
+    The export only lands when the NumPy predictor reproduces predict_proba
+    on ``check_codes`` and the smoke cases. It is not used until
+    write_bundle_metadata points at it.
+    """
+    codes = list(check_codes) + [code for code, _ in SMOKE_TEST_CASES]
+    try:
+        name = export_compact_model(clf, le, tfidf, model_dir, check_codes=codes)
+    except CompactModelError as exc:
+        print(f"    {yellow('~')} compact export skipped: {exc}")
+        return None
+    path = os.path.join(model_dir, name)
+    with open(os.path.join(path, MANIFEST_FILENAME), encoding="utf-8") as manifest_file:
+        kind = json.load(manifest_file)["kind"]
+    size = sum(os.path.getsize(os.path.join(path, file)) for file in os.listdir(path)) / 1024
+    print(f"    {green('✓')} {path}/  ({kind}, {size:.1f} KB, matches predict_proba on {len(codes)} samples)")
+    return name
+
+
+def save_model(clf, le, tfidf, model_dir, backend=DEFAULT_BACKEND, compact=True, check_codes=()):
     os.makedirs(model_dir, exist_ok=True)
 
     paths = {
@@ -297,28 +544,29 @@ def save_model(clf, le, tfidf, model_dir):
     pickle.dump(le,    open(paths["encoder"],  'wb'))
     pickle.dump(tfidf, open(paths["tfidf"],    'wb'))
     pickle.dump(NUMERICAL_FEATURE_NAMES, open(paths["num_feats"], 'wb'))
-    with open(paths["metadata"], "w", encoding="utf-8") as metadata_file:
-        json.dump(get_bundle_metadata(), metadata_file, indent=2, sort_keys=True)
 
     print(f"\n  {bold('Model files saved:')}")
     for k, p in paths.items():
+        if k == "metadata":
+            continue
         size = os.path.getsize(p) / 1024
         print(f"    {green('✓')} {p}  ({size:.1f} KB)")
 
+    # Without an export the metadata points at none, so ml_engine loads the pickles.
+    metadata = get_bundle_metadata(backend)
+    compact_name = export_compact(clf, le, tfidf, model_dir, check_codes) if compact else None
+    if compact_name:
+        metadata[COMPACT_METADATA_KEY] = compact_name
+
+    write_bundle_metadata(model_dir, metadata)
+    print(f"    {green('✓')} {paths['metadata']}  (sha256 of every bundle file)")
+
 
 # ─── Quick smoke test ─────────────────────────────────────────────────────────
 def smoke_test(clf, le, tfidf):
-    test_cases = [
-        ("x = 1/0",                    "DivisionByZero"),
-        ("def foo()\n    pass",         "MissingColon"),
-        ("from os import *",            "WildcardImport"),
-        ("print('Hello'",              "UnmatchedBracket"),
-        ("def f():\n    return 1\n    dead_code()", "UnreachableCode"),
-    ]
-
     print(f"\n  {bold('Smoke test:')}")
     all_pass = True
-    for code, expected in test_cases:
+    for code, expected in SMOKE_TEST_CASES:
         tfidf_vec = tfidf.transform([code])
         num_vec   = np.array([extract_numerical_features(code)])
         X = hstack([tfidf_vec, num_vec])
@@ -345,6 +593,25 @@ def main():
                         help='Show dataset stats only, do not train')
     parser.add_argument('--compare', action='store_true',
                         help='Compare accuracy vs old model')
+    parser.add_argument('--backend', type=parse_backends, default=[DEFAULT_BACKEND],
+                        help='Trainer backend, or a comma-separated list to train side by side '
+                             'and keep the most accurate: '
+                             + ', '.join(f'{name} ({desc})' for name, (_, desc) in TRAINER_BACKENDS.items())
+                             + f' (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--n-jobs', type=int, default=-1,
+                        help='Cores for backends that parallelise (forest, linear, hist); -1 = all')
+    parser.add_argument('--no-early-stopping', action='store_true',
+                        help='Always train the full number of rounds')
+    parser.add_argument('--no-save', action='store_true',
+                        help='Train and report only; leave the existing model files untouched')
+    parser.add_argument('--feature-cache', type=str, default=DEFAULT_CACHE_DIR,
+                        help=f'Directory for cached feature matrices (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-feature-cache', action='store_true',
+                        help='Always rebuild features and do not write the cache')
+    parser.add_argument('--no-compact', action='store_true',
+                        help=f'Do not write the compact NumPy export ({COMPACT_DIRNAME}-<digest>/); ml_engine then loads the pickles')
+    parser.add_argument('--export-compact', action='store_true',
+                        help='Only convert the pickled model in the model dir to the compact export, no training')
     args = parser.parse_args()
 
     print(bold(cyan(f"\n{'='*60}")))
@@ -373,19 +640,46 @@ def main():
         print(f"\n  (Preview only — no training performed)")
         return
 
+    check_codes = [r['buggy_code'] for r in rows[:COMPACT_CHECK_SAMPLES]]
+    if args.export_compact:
+        import joblib
+        print(f"\n  {bold('Exporting compact model...')}")
+        clf = joblib.load(os.path.join(model_dir, MODEL_FILES["model"]))
+        le = joblib.load(os.path.join(model_dir, MODEL_FILES["encoder"]))
+        tfidf = joblib.load(os.path.join(model_dir, MODEL_FILES["tfidf"]))
+        compact_name = export_compact(clf, le, tfidf, model_dir, check_codes)
+        if not compact_name:
+            sys.exit(1)
+        metadata_path = os.path.join(model_dir, MODEL_BUNDLE_METADATA)
+        metadata = dict(read_bundle_metadata(model_dir), **{COMPACT_METADATA_KEY: compact_name})
+        write_bundle_metadata(model_dir, metadata)
+        print(f"    {green('✓')} {metadata_path}  (sha256 of every bundle file)")
+        return
+
     # Check sklearn is available
     try:
-        from sklearn.ensemble import GradientBoostingClassifier
+        import sklearn  # noqa: F401
     except ImportError:
         print(red("\n❌ scikit-learn not found. Run: pip install scikit-learn"))
         sys.exit(1)
 
     # Train
-    clf, le, tfidf, acc = train_model(rows, model_dir, compare_old=args.compare)
+    clf, le, tfidf, acc, backend = train_model(
+        rows,
+        model_dir,
+        compare_old=args.compare,
+        backends=args.backend,
+        n_jobs=args.n_jobs,
+        early_stopping=not args.no_early_stopping,
+        feature_cache=None if args.no_feature_cache else args.feature_cache,
+    )
 
     # Save
-    print(f"\n  {bold('Saving model files...')}")
-    save_model(clf, le, tfidf, model_dir)
+    if args.no_save:
+        print(f"\n  (--no-save — model files left untouched)")
+    else:
+        print(f"\n  {bold('Saving model files...')}")
+        save_model(clf, le, tfidf, model_dir, backend, compact=not args.no_compact, check_codes=check_codes)
 
     # Smoke test
     passed = smoke_test(clf, le, tfidf)
@@ -395,6 +689,7 @@ def main():
     print(bold(f"  RETRAIN COMPLETE"))
     print(bold(f"{'='*60}"))
     print(f"\n  Training samples : {len(rows)}")
+    print(f"  Backend          : {backend}")
     print(f"  Test accuracy    : {green(f'{acc:.4f}%')}")
     print(f"  Smoke test       : {green('PASSED') if passed else yellow('PARTIAL')}")
     print(f"\n  Next steps:")
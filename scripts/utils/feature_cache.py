@@ -0,0 +1,136 @@
+"""
+Feature Cache
+Persists the TF-IDF + numerical feature matrix and label array built from a
+dataset, so repeated training/evaluation runs skip featurization.
+
+Entries are keyed by the samples themselves (code and label of every row), the
+vectorizer (its parameters, plus vocabulary and IDF weights when it is already
+fitted) and the numerical feature extractor's source. Each entry is a
+directory of raw ``.npy`` arrays (the CSR components and the labels) loaded
+with ``mmap_mode="r"``; ``.npz`` archives are zip files and cannot be mapped.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from scipy.sparse import csr_matrix, hstack
+
+from src import feature_utils
+from src.feature_utils import extract_numerical_features
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(".cache", "features")
+_MATRIX_PARTS = ("data", "indices", "indptr")
+
+
+@dataclass
+class CachedFeatures:
+    matrix: csr_matrix
+    labels: np.ndarray
+    vectorizer: Any
+    cached: bool
+
+
+def build_feature_matrix(texts: Sequence[str], vectorizer, fit: bool = False) -> csr_matrix:
+    """Combined TF-IDF + numerical feature matrix (the layout the model is trained on)."""
+    text_matrix = vectorizer.fit_transform(texts) if fit else vectorizer.transform(texts)
+    numerical = np.array([extract_numerical_features(code) for code in texts])
+    return hstack([text_matrix, numerical]).tocsr()
+
+
+def _vectorizer_fingerprint(vectorizer, fit: bool) -> str:
+    digest = hashlib.sha256(type(vectorizer).__name__.encode())
+    params = vectorizer.get_params()
+    digest.update(repr(sorted((key, repr(value)) for key, value in params.items())).encode())
+    if not fit:
+        # Already fitted: the transform depends on what it learned.
+        digest.update(repr(sorted(vectorizer.vocabulary_.items())).encode())
+        idf = getattr(vectorizer, "idf_", None)
+        if idf is not None:
+            digest.update(np.ascontiguousarray(idf).tobytes())
+    return digest.hexdigest()
+
+
+def feature_cache_key(texts: Sequence[str], labels: Sequence[str], vectorizer, fit: bool) -> str:
+    digest = hashlib.sha256(f"v{CACHE_VERSION}:{'fit' if fit else 'transform'}".encode())
+    digest.update(_vectorizer_fingerprint(vectorizer, fit).encode())
+    digest.update(inspect.getsource(feature_utils).encode())
+    for code, label in zip(texts, labels, strict=True):
+        digest.update(str(code).encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+        digest.update(str(label).encode("utf-8", "surrogatepass"))
+        digest.update(b"\1")
+    return digest.hexdigest()
+
+
+def _load_entry(path: str, fit: bool, vectorizer) -> Optional[CachedFeatures]:
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as handle:
+            meta = json.load(handle)
+        parts = [np.load(os.path.join(path, f"{part}.npy"), mmap_mode="r") for part in _MATRIX_PARTS]
+        labels = np.load(os.path.join(path, "labels.npy"), mmap_mode="r")
+        if fit:
+            with open(os.path.join(path, "vectorizer.pkl"), "rb") as handle:
+                vectorizer = pickle.load(handle)
+    except (OSError, ValueError, KeyError, pickle.UnpicklingError, EOFError):
+        return None
+    matrix = csr_matrix(tuple(parts), shape=tuple(meta["shape"]), copy=False)
+    return CachedFeatures(matrix, labels, vectorizer, cached=True)
+
+
+def _store_entry(path: str, features: CachedFeatures, fit: bool) -> None:
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+    try:
+        matrix = features.matrix
+        for part in _MATRIX_PARTS:
+            np.save(os.path.join(staging, f"{part}.npy"), getattr(matrix, part))
+        np.save(os.path.join(staging, "labels.npy"), np.asarray(features.labels, dtype=str))
+        if fit:
+            with open(os.path.join(staging, "vectorizer.pkl"), "wb") as handle:
+                pickle.dump(features.vectorizer, handle)
+        with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as handle:
+            json.dump({"shape": list(matrix.shape), "version": CACHE_VERSION}, handle)
+        os.replace(staging, path)
+    except OSError:
+        # Another run stored the same entry first, or the cache is not writable.
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def load_or_build_features(
+    texts: Sequence[str],
+    labels: Sequence[str],
+    vectorizer,
+    fit: bool = False,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+) -> CachedFeatures:
+    """
+    Feature matrix and labels for ``texts``, from the cache when possible.
+
+    With ``fit=True`` the vectorizer is fitted on ``texts`` and the fitted copy
+    is cached too, so a hit returns it in place of the unfitted one passed in.
+    ``cache_dir=None`` disables the cache.
+    """
+    texts = list(texts)
+    label_array = np.asarray([str(label) for label in labels])
+    if cache_dir is None:
+        return CachedFeatures(build_feature_matrix(texts, vectorizer, fit), label_array, vectorizer, cached=False)
+
+    path = os.path.join(cache_dir, feature_cache_key(texts, label_array, vectorizer, fit))
+    if os.path.isdir(path):
+        entry = _load_entry(path, fit, vectorizer)
+        if entry is not None:
+            return entry
+
+    features = CachedFeatures(build_feature_matrix(texts, vectorizer, fit), label_array, vectorizer, cached=False)
+    _store_entry(path, features, fit)
+    return features
@@ -0,0 +1,466 @@
+"""
+Compact Model
+Exports a trained TF-IDF vectorizer + classifier as plain NumPy arrays and
+reproduces ``predict_proba`` from them without scikit-learn.
+
+An export is a directory of raw ``.npy`` arrays plus ``manifest.json``, named
+after a digest of its contents (``compact-<digest>``) and never modified once
+written; ``bundle_metadata.json`` points at the export in use. The
+arrays are opened with ``mmap_mode="r"``, so loading maps files instead of
+unpickling objects and every process that maps the same export (e.g. each
+uvicorn worker) shares one copy of its pages in the OS page cache. Every classifier retrain_model.py trains is supported:
+gradient boosting and random forests as flattened tree arrays, the SVD +
+histogram gradient boosting pipeline as SVD components plus tree arrays, and
+the MaxAbs-scaled SGD pipeline as linear weights with the scaling folded in.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .feature_utils import extract_numerical_features
+
+COMPACT_FORMAT = "omnisyntax-compact"
+COMPACT_FORMAT_VERSION = 1
+# Exports are written to "compact-<digest>" directories; bundle_metadata.json
+# names the active one under COMPACT_METADATA_KEY.
+COMPACT_DIRNAME = "compact"
+COMPACT_METADATA_KEY = "compact"
+MANIFEST_FILENAME = "manifest.json"
+# Largest |compact - sklearn| probability accepted by the export check.
+PARITY_TOLERANCE = 1e-9
+
+_WHITE_SPACES = re.compile(r"\s\s+")
+_TREE_ARRAYS = ("tree_roots", "tree_column", "node_feature", "node_threshold", "node_left", "node_right",
+                "node_missing_left", "node_value")
+
+
+class CompactModelError(ValueError):
+    """Raised when a model cannot be exported or a compact export cannot be read."""
+
+
+def _char_wb_ngrams(text: str, min_n: int, max_n: int) -> List[str]:
+    """Same n-grams as scikit-learn's ``analyzer='char_wb'``."""
+    ngrams = []
+    for word in _WHITE_SPACES.sub(" ", text).split():
+        word = " " + word + " "
+        word_len = len(word)
+        for n in range(min_n, max_n + 1):
+            offset = 0
+            ngrams.append(word[offset:offset + n])
+            while offset + n < word_len:
+                offset += 1
+                ngrams.append(word[offset:offset + n])
+            if offset == 0:  # a word shorter than n is counted once
+                break
+    return ngrams
+
+
+def _char_ngrams(text: str, min_n: int, max_n: int) -> List[str]:
+    """Same n-grams as scikit-learn's ``analyzer='char'``."""
+    text = _WHITE_SPACES.sub(" ", text)
+    text_len = len(text)
+    ngrams = []
+    for n in range(min_n, min(max_n + 1, text_len + 1)):
+        ngrams.extend(text[i:i + n] for i in range(text_len - n + 1))
+    return ngrams
+
+
+_ANALYZERS = {"char_wb": _char_wb_ngrams, "char": _char_ngrams}
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compact_files(path: str) -> List[str]:
+    """Files of the export in ``path`` (manifest first), relative to ``path``."""
+    try:
+        with open(os.path.join(path, MANIFEST_FILENAME), encoding="utf-8") as handle:
+            arrays = json.load(handle)["arrays"]
+    except (OSError, ValueError, KeyError) as exc:
+        raise CompactModelError(f"cannot read compact model in {path}: {exc}") from exc
+    return [MANIFEST_FILENAME] + [f"{name}.npy" for name in arrays]
+
+
+def is_compact_export_name(name: str) -> bool:
+    """True for a directory name export_compact_model can have written."""
+    return name.startswith(f"{COMPACT_DIRNAME}-") and os.path.basename(name) == name
+
+
+def remove_compact_exports(model_dir: str, keep: Sequence[str] = ()) -> List[str]:
+    """Delete the exports in ``model_dir`` other than ``keep``; returns the names removed.
+
+    An export that cannot be deleted (on Windows, one a running process still
+    has memory-mapped) is left for a later call.
+    """
+    removed = []
+    for name in sorted(os.listdir(model_dir)) if os.path.isdir(model_dir) else []:
+        path = os.path.join(model_dir, name)
+        # The unversioned "compact/" is the layout before exports were versioned.
+        if name in keep or not (is_compact_export_name(name) or name == COMPACT_DIRNAME) or not os.path.isdir(path):
+            continue
+        try:
+            shutil.rmtree(path)
+        except OSError:
+            continue
+        removed.append(name)
+    return removed
+
+
+def _export_digest(manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> str:
+    digest = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode())
+    for name in sorted(arrays):
+        array = np.ascontiguousarray(arrays[name])
+        digest.update(f"{name}:{array.dtype.str}:{array.shape}".encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()[:16]
+
+
+class CompactModel:
+    """Pure-NumPy predictor over a compact export (see ``export_compact_model``)."""
+
+    def __init__(self, manifest: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+        if manifest.get("format") != COMPACT_FORMAT or manifest.get("version") != COMPACT_FORMAT_VERSION:
+            raise CompactModelError(
+                f"unsupported compact model format {manifest.get('format')!r} v{manifest.get('version')}"
+            )
+        self.manifest = manifest
+        self.arrays = arrays
+        self.kind: str = manifest["kind"]
+        self.labels: List[str] = list(manifest["labels"])
+        vectorizer = manifest["vectorizer"]
+        self._ngrams = _ANALYZERS[vectorizer["analyzer"]]
+        self._ngram_range = tuple(vectorizer["ngram_range"])
+        self._lowercase = bool(vectorizer["lowercase"])
+        self._sublinear_tf = bool(vectorizer["sublinear_tf"])
+        self._norm = vectorizer["norm"]
+        self._idf = arrays.get("idf")
+        self._vocabulary = {term: index for index, term in enumerate(arrays["vocabulary"].tolist())}
+        self.n_text_features = len(self._vocabulary)
+        self.n_features = self.n_text_features + int(manifest["n_numerical_features"])
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CompactModel":
+        """Open the export in directory ``path``; arrays are memory-mapped unless ``mmap=False``."""
+        try:
+            with open(os.path.join(path, MANIFEST_FILENAME), encoding="utf-8") as handle:
+                manifest = json.load(handle)
+            arrays = {
+                name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+                for name in manifest["arrays"]
+            }
+        except (OSError, ValueError, KeyError) as exc:
+            raise CompactModelError(f"cannot read compact model in {path}: {exc}") from exc
+        return cls(manifest, arrays)
+
+    def transform_text(self, code: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(column indices, values) of the TF-IDF row for ``code``, sorted by column."""
+        text = code.lower() if self._lowercase else code
+        counts: Dict[int, int] = {}
+        vocabulary = self._vocabulary
+        for gram in self._ngrams(text, *self._ngram_range):
+            index = vocabulary.get(gram)
+            if index is not None:
+                counts[index] = counts.get(index, 0) + 1
+        indices = np.fromiter(sorted(counts), dtype=np.intp, count=len(counts))
+        values = np.array([counts[index] for index in indices.tolist()], dtype=np.float64)
+        if self._sublinear_tf:
+            values = np.log(values) + 1.0
+        if self._idf is not None:
+            values *= self._idf[indices]
+        # Norms are sequential sums (cumsum) like scikit-learn's row normalizer,
+        # not pairwise ones, so the features match it bit for bit.
+        if self._norm == "l2" and values.size:
+            values /= math.sqrt(float(np.cumsum(values * values)[-1]))
+        elif self._norm == "l1" and values.size:
+            values /= float(np.cumsum(np.abs(values))[-1])
+        return indices, values
+
+    def features(self, code: str) -> np.ndarray:
+        """Dense TF-IDF + numerical feature row, the layout the classifier was trained on."""
+        row = np.zeros(self.n_features, dtype=np.float64)
+        indices, values = self.transform_text(code)
+        row[indices] = values
+        row[self.n_text_features:] = extract_numerical_features(code)
+        return row
+
+    def predict_proba(self, code: str) -> np.ndarray:
+        """Class probabilities for ``code``, in ``labels`` order."""
+        arrays = self.arrays
+        if "svd_components" in arrays:
+            indices, values = self.transform_text(code)
+            components = arrays["svd_components"]
+            # Accumulate the non-zero columns in order, as scipy's sparse
+            # product does: a split threshold can sit within rounding error.
+            reduced = (components[:, indices] * values).cumsum(axis=1)[:, -1] if indices.size else np.zeros(len(components))
+            row = np.concatenate([reduced, extract_numerical_features(code)])
+        else:
+            row = self.features(code)
+        if self.kind == "linear":
+            raw = arrays["coef"] @ row + arrays["intercept"]
+        else:
+            raw = self._tree_raw(row)
+        return _apply_link(self.manifest["link"], raw)
+
+    def _tree_raw(self, row: np.ndarray) -> np.ndarray:
+        arrays = self.arrays
+        if self.manifest["tree_input_dtype"] == "float32":
+            # scikit-learn's DecisionTree compares float32 inputs against its thresholds.
+            row = row.astype(np.float32).astype(np.float64)
+        feature = arrays["node_feature"]
+        threshold = arrays["node_threshold"]
+        left = arrays["node_left"]
+        right = arrays["node_right"]
+        missing_left = arrays["node_missing_left"]
+        # Walk every tree at once, one level per step; leaves point at themselves.
+        node = np.array(arrays["tree_roots"])
+        for _ in range(int(self.manifest["max_depth"])):
+            value = row[feature[node]]
+            go_left = np.where(np.isnan(value), missing_left[node], value <= threshold[node])
+            node = np.where(go_left, left[node], right[node])
+        leaf_values = arrays["node_value"][node]
+        init = np.asarray(arrays["init_raw"], dtype=np.float64)
+        if leaf_values.shape[1] == 1:
+            return init + np.bincount(arrays["tree_column"], weights=leaf_values[:, 0], minlength=init.size)
+        return init + leaf_values.sum(axis=0)
+
+
+def _apply_link(link: str, raw: np.ndarray) -> np.ndarray:
+    if link == "softmax":
+        exp = np.exp(raw - raw.max())
+        return exp / exp.sum()
+    if link == "logistic":
+        positive = 1.0 / (1.0 + np.exp(-raw[0]))
+        return np.array([1.0 - positive, positive])
+    if link == "ovr_logistic":
+        prob = 1.0 / (1.0 + np.exp(-raw))
+        return prob / prob.sum()
+    if link == "identity":
+        return raw
+    raise CompactModelError(f"unknown link function: {link}")
+
+
+# ─── Export ───────────────────────────────────────────────────────────────────
+
+def _flatten_trees(trees: Sequence[Dict[str, np.ndarray]], columns: Sequence[int]) -> Tuple[Dict[str, np.ndarray], int]:
+    """Concatenate per-tree node arrays; child indices become global and leaves self-loop."""
+    parts: Dict[str, List[np.ndarray]] = {name: [] for name in _TREE_ARRAYS}
+    offset = 0
+    max_depth = 0
+    for tree, column in zip(trees, columns):
+        n_nodes = len(tree["feature"])
+        own = np.arange(n_nodes, dtype=np.int64) + offset
+        is_leaf = tree["is_leaf"]
+        parts["tree_roots"].append(np.array([offset], dtype=np.int64))
+        parts["tree_column"].append(np.array([column], dtype=np.int64))
+        parts["node_feature"].append(np.where(is_leaf, 0, tree["feature"]).astype(np.int64))
+        parts["node_threshold"].append(np.where(is_leaf, 0.0, tree["threshold"]).astype(np.float64))
+        parts["node_left"].append(np.where(is_leaf, own, tree["left"] + offset).astype(np.int64))
+        parts["node_right"].append(np.where(is_leaf, own, tree["right"] + offset).astype(np.int64))
+        parts["node_missing_left"].append(np.asarray(tree["missing_left"], dtype=bool))
+        parts["node_value"].append(np.asarray(tree["value"], dtype=np.float64))
+        max_depth = max(max_depth, int(tree["depth"]))
+        offset += n_nodes
+    return {name: np.concatenate(chunks) for name, chunks in parts.items()}, max_depth
+
+
+def _sklearn_tree(tree, value: np.ndarray) -> Dict[str, np.ndarray]:
+    missing = getattr(tree, "missing_go_to_left", None)
+    return {
+        "feature": tree.feature,
+        "threshold": tree.threshold,
+        "left": tree.children_left,
+        "right": tree.children_right,
+        "is_leaf": tree.children_left < 0,
+        "missing_left": np.zeros(tree.node_count, dtype=bool) if missing is None else missing.astype(bool),
+        "value": value,
+        "depth": tree.max_depth,
+    }
+
+
+def _export_gradient_boosting(clf, n_features: int) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    stages, n_columns = clf.estimators_.shape
+    trees, columns = [], []
+    for stage in range(stages):
+        for column in range(n_columns):
+            tree = clf.estimators_[stage, column].tree_
+            trees.append(_sklearn_tree(tree, clf.learning_rate * tree.value[:, 0, :1]))
+            columns.append(column)
+    arrays, max_depth = _flatten_trees(trees, columns)
+    arrays["init_raw"] = np.asarray(clf._raw_predict_init(np.zeros((1, n_features)))[0], dtype=np.float64)
+    link = "logistic" if n_columns == 1 else "softmax"
+    return {"kind": "gradient_boosting", "link": link, "max_depth": max_depth, "tree_input_dtype": "float32"}, arrays
+
+
+def _export_random_forest(clf) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    trees = []
+    for estimator in clf.estimators_:
+        tree = estimator.tree_
+        value = tree.value[:, 0, :]
+        totals = value.sum(axis=1, keepdims=True)
+        totals[totals == 0] = 1.0
+        trees.append(_sklearn_tree(tree, value / totals / len(clf.estimators_)))
+    arrays, max_depth = _flatten_trees(trees, [0] * len(trees))
+    arrays["init_raw"] = np.zeros(len(clf.classes_), dtype=np.float64)
+    return {"kind": "random_forest", "link": "identity", "max_depth": max_depth, "tree_input_dtype": "float32"}, arrays
+
+
+def _export_hist_gradient_boosting(pipeline, n_text_features: int) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    reduce = pipeline.named_steps["reduce"]
+    clf = pipeline.named_steps["clf"]
+    svd_slice = dict((name, columns) for name, _, columns in reduce.transformers_)["svd"]
+    if svd_slice != slice(0, n_text_features) or list(reduce.named_transformers_) != ["svd", "numerical"]:
+        raise CompactModelError("hist pipeline does not have the retrain_model SVD + passthrough layout")
+    trees, columns = [], []
+    for iteration in clf._predictors:
+        for column, predictor in enumerate(iteration):
+            nodes = predictor.nodes
+            if nodes["is_categorical"].any():
+                raise CompactModelError("categorical splits are not supported")
+            is_leaf = nodes["is_leaf"].astype(bool)
+            trees.append({
+                "feature": nodes["feature_idx"],
+                "threshold": nodes["num_threshold"],
+                "left": nodes["left"].astype(np.int64),
+                "right": nodes["right"].astype(np.int64),
+                "is_leaf": is_leaf,
+                "missing_left": nodes["missing_go_to_left"].astype(bool),
+                "value": nodes["value"].reshape(-1, 1),
+                "depth": int(nodes["depth"].max()),
+            })
+            columns.append(column)
+    arrays, max_depth = _flatten_trees(trees, columns)
+    arrays["init_raw"] = np.asarray(clf._baseline_prediction, dtype=np.float64).ravel()
+    arrays["svd_components"] = np.asarray(reduce.named_transformers_["svd"].components_, dtype=np.float64)
+    link = "logistic" if clf.n_trees_per_iteration_ == 1 else "softmax"
+    return {"kind": "hist_gradient_boosting", "link": link, "max_depth": max_depth, "tree_input_dtype": "float64"}, arrays
+
+
+def _export_linear(pipeline) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    scale = pipeline.named_steps["scale"].scale_
+    clf = pipeline.named_steps["clf"]
+    if getattr(clf, "loss", None) != "log_loss":
+        raise CompactModelError("only log_loss linear models have predict_proba")
+    coef = np.asarray(clf.coef_, dtype=np.float64) / scale
+    link = "logistic" if coef.shape[0] == 1 else "ovr_logistic"
+    arrays = {"coef": coef, "intercept": np.asarray(clf.intercept_, dtype=np.float64)}
+    return {"kind": "linear", "link": link}, arrays
+
+
+def _final_estimator(clf):
+    return clf.steps[-1][1] if hasattr(clf, "steps") else clf
+
+
+def _export_classifier(clf, n_text_features: int, n_features: int) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    name = type(_final_estimator(clf)).__name__
+    steps = [step for step, _ in getattr(clf, "steps", [])]
+    if name == "GradientBoostingClassifier" and not steps:
+        return _export_gradient_boosting(clf, n_features)
+    if name == "RandomForestClassifier" and not steps:
+        return _export_random_forest(clf)
+    if name == "HistGradientBoostingClassifier" and steps == ["csr", "reduce", "clf"]:
+        return _export_hist_gradient_boosting(clf, n_text_features)
+    if name == "SGDClassifier" and steps == ["scale", "clf"]:
+        return _export_linear(clf)
+    raise CompactModelError(f"no compact export for {name} (pipeline steps: {steps or 'none'})")
+
+
+def _export_vectorizer(vectorizer) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    params = vectorizer.get_params()
+    if params["analyzer"] not in _ANALYZERS:
+        raise CompactModelError(f"no compact export for analyzer={params['analyzer']!r}")
+    for key in ("preprocessor", "tokenizer", "strip_accents"):
+        if params.get(key) is not None:
+            raise CompactModelError(f"no compact export for a vectorizer with {key} set")
+    if params.get("binary") or params.get("norm") not in ("l1", "l2", None):
+        raise CompactModelError("no compact export for binary or custom-normalized vectorizers")
+    terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.__getitem__)
+    arrays = {"vocabulary": np.array(terms, dtype=str)}
+    if params.get("use_idf", True):
+        arrays["idf"] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    manifest = {
+        "analyzer": params["analyzer"],
+        "ngram_range": list(params["ngram_range"]),
+        "lowercase": bool(params["lowercase"]),
+        "sublinear_tf": bool(params.get("sublinear_tf", False)),
+        "norm": params.get("norm"),
+    }
+    return manifest, arrays
+
+
+def export_compact_model(
+    classifier,
+    label_encoder,
+    vectorizer,
+    model_dir: str,
+    check_codes: Sequence[str] = (),
+    n_numerical_features: Optional[int] = None,
+) -> str:
+    """
+    Write ``classifier`` + ``vectorizer`` as a new compact export in ``model_dir``.
+
+    ``check_codes`` are run through both the compact predictor and the
+    scikit-learn objects; the export is only moved into place when every
+    probability agrees within ``PARITY_TOLERANCE``. Raises CompactModelError
+    for unsupported models or a parity failure. Returns the export's directory
+    name; existing exports are left untouched, so processes serving them are
+    unaffected until the caller points ``bundle_metadata.json`` at the new one.
+    """
+    if n_numerical_features is None:
+        n_numerical_features = len(extract_numerical_features(""))
+    vectorizer_manifest, arrays = _export_vectorizer(vectorizer)
+    n_text_features = len(arrays["vocabulary"])
+    classifier_manifest, classifier_arrays = _export_classifier(
+        classifier, n_text_features, n_text_features + n_numerical_features
+    )
+    arrays.update(classifier_arrays)
+    class_ids = np.asarray(_final_estimator(classifier).classes_)
+    manifest = {
+        "format": COMPACT_FORMAT,
+        "version": COMPACT_FORMAT_VERSION,
+        **classifier_manifest,
+        "labels": [str(label) for label in label_encoder.inverse_transform(class_ids)],
+        "vectorizer": vectorizer_manifest,
+        "n_numerical_features": n_numerical_features,
+        "arrays": sorted(arrays),
+    }
+
+    compact = CompactModel(manifest, arrays)
+    for code in check_codes:
+        from scipy.sparse import hstack
+
+        X = hstack([vectorizer.transform([code]), np.array([extract_numerical_features(code)])])
+        expected = classifier.predict_proba(X)[0]
+        drift = float(np.max(np.abs(compact.predict_proba(code) - expected)))
+        if drift > PARITY_TOLERANCE:
+            raise CompactModelError(f"compact predict_proba differs from scikit-learn by {drift:.3g} on {code!r}")
+
+    export_name = f"{COMPACT_DIRNAME}-{_export_digest(manifest, arrays)}"
+    path = os.path.join(model_dir, export_name)
+    if os.path.isdir(path):
+        return export_name  # the same model was exported before
+    os.makedirs(model_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".tmp-compact-", dir=model_dir)
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(array))
+        with open(os.path.join(staging, MANIFEST_FILENAME), "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+        os.rename(staging, path)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.isdir(path):  # otherwise another run wrote the same export first
+            raise
+    return export_name
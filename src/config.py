@@ -1,5 +1,6 @@
 """Unified runtime configuration for OmniSyntax."""
 
+import math
 import os
 from pathlib import Path
 
@@ -49,6 +50,42 @@ def get_max_code_size() -> int:
     return int(os.getenv("MAX_CODE_SIZE", "100000"))
 
 
+def _get_optional_env(key: str, kind: type) -> float | int | None:
+    """Finite, non-negative ``kind`` from ``key``, or None when unset; raises ValueError for anything else."""
+    value = os.getenv(key, "").strip()
+    if not value:
+        return None
+    try:
+        parsed = kind(value)
+    except ValueError:
+        expected = "a number" if kind is float else "a whole number"
+        raise ValueError(f"{key} must be {expected}, got {value!r}") from None
+    if not math.isfinite(parsed):
+        raise ValueError(f"{key} must be a finite number, got {value!r}")
+    if parsed < 0:
+        raise ValueError(f"{key} must not be negative, got {value!r}")
+    return parsed
+
+
+def get_analysis_time_budget() -> float | None:
+    return _get_optional_env("ANALYSIS_TIME_BUDGET_SECONDS", float)
+
+
+def get_analysis_stage_budget() -> float | None:
+    return _get_optional_env("ANALYSIS_STAGE_BUDGET_SECONDS", float)
+
+
+def get_analysis_node_budget() -> int | None:
+    return _get_optional_env("ANALYSIS_NODE_BUDGET", int)
+
+
+def get_model_reload_interval() -> float | None:
+    interval = _get_optional_env("MODEL_RELOAD_INTERVAL_SECONDS", float)
+    if interval == 0:
+        raise ValueError("MODEL_RELOAD_INTERVAL_SECONDS must be greater than zero; leave it empty to disable reloading")
+    return interval
+
+
 def get_rate_limit_per_minute() -> int:
     return int(os.getenv("RATE_LIMIT_PER_MINUTE", "100"))
 
@@ -155,6 +192,9 @@ __all__ = [
     "get_supported_languages",
     "get_supported_fix_error_types",
     "get_max_code_size",
+    "get_analysis_time_budget",
+    "get_analysis_stage_budget",
+    "get_analysis_node_budget",
     "get_rate_limit_per_minute",
     "get_rate_limit_backend",
     "is_rate_limit_backend_valid",
@@ -164,6 +204,7 @@ __all__ = [
     "get_cors_origins",
     "get_models_dir",
     "get_model_bundle_path",
+    "get_model_reload_interval",
     "is_production_mode",
     "get_api_auth_mode",
     "get_api_keys",
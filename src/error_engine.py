@@ -378,6 +378,24 @@ def _strip_c_like_comments_and_strings(code: str) -> str:
     return "".join(out)
 
 
+class _CLikeSource:
+    """Original and comment/string-blanked line arrays for one snippet.
+
+    Built once per ``_collect_c_like_rule_based_issues`` call and handed to every
+    C-like detector, so the character-level sanitizer and ``splitlines`` run once
+    instead of once per detector.
+    """
+
+    __slots__ = ("code", "sanitized", "lines", "clean_lines", "clean_text")
+
+    def __init__(self, code: str) -> None:
+        self.code = code
+        self.sanitized = _strip_c_like_comments_and_strings(code)
+        self.lines = code.splitlines()
+        self.clean_lines = self.sanitized.splitlines()
+        self.clean_text = "\n".join(self.clean_lines)
+
+
 def _braces_balanced(code):
     return len(_find_unmatched_bracket_issues(code)) == 0
 
@@ -385,7 +403,7 @@ def _has_unclosed_strings(code: str) -> bool:
     return _find_unclosed_string_issue(code) is not None
 
 
-def _find_unclosed_string_issue(code: str) -> dict | None:
+def _find_unclosed_string_issue(code: str, source: _CLikeSource | None = None) -> dict | None:
     in_single = False
     in_double = False
     in_backtick = False
@@ -424,7 +442,8 @@ def _find_unclosed_string_issue(code: str) -> dict | None:
             in_backtick = not in_backtick
 
     if in_single or in_double or in_backtick:
-        line_text = code.splitlines()[start_line - 1] if start_line and code.splitlines() else ""
+        lines = source.lines if source is not None else code.splitlines()
+        line_text = lines[start_line - 1] if start_line and lines else ""
         return _make_issue(
             "UnclosedString",
             "String literal is not closed before end of file.",
@@ -436,16 +455,16 @@ def _find_unclosed_string_issue(code: str) -> dict | None:
     return None
 
 
-def _find_unmatched_bracket_issues(code: str) -> list[dict]:
-    sanitized = _strip_c_like_comments_and_strings(code)
+def _find_unmatched_bracket_issues(code: str, source: _CLikeSource | None = None) -> list[dict]:
+    source = source or _CLikeSource(code)
     stack = []
     pairs = {")": "(", "]": "[", "}": "{"}
     issues = []
     line = 1
     col = 0
-    lines = code.splitlines()
+    lines = source.lines
 
-    for ch in sanitized:
+    for ch in source.sanitized:
         if ch == "\n":
             line += 1
             col = 0
@@ -1310,6 +1329,36 @@ def _attach_metadata(payload: dict, warnings: list[str]) -> dict:
     payload["warnings"] = list(warnings)
     return payload
 
+_GLUED_DECLARATION = re.compile(
+    r"(?:^|[;{}])\s*(?:[A-Za-z_][\w<>\[\]]*\s+)+[A-Za-z_]\w*\s*=\s*[^;{}]+?\s*"
+    r"(?:System\.out|console\.log|printf|fprintf|puts|cout|std::cout|cin|std::cin|[A-Za-z_]\w+\s*=)"
+)
+_GLUED_ASSIGNMENT = re.compile(
+    r"(?:^|[;{}])\s*[A-Za-z_]\w*\s*=\s*[^;{}]+?\s*"
+    r"(?:System\.out|console\.log|printf|fprintf|puts|cout|std::cout|cin|std::cin|return\b|if\b|while\b|switch\b|throw\b|[A-Za-z_]\w+\s*=)"
+)
+_SIMPLE_STATEMENTS = [
+    re.compile(pattern)
+    for pattern in (
+        r'^return\s+.+$', r'^cout\s*<<.*$', r'^cin\s*>>.*$',
+        r'^printf\s*\(.*\)$', r'^fprintf\s*\(.*\)$', r'^puts\s*\(.*\)$',
+        r'^std::cout\s*<<.*$', r'^std::cin\s*>>.*$',
+        r'^(break|continue)\s*$', r'^\w+(\.\w+)?\s*(\+\+|--)$',
+        r'^throw\s+.+$',
+    )
+]
+_STRUCT_OR_ENUM_CLOSE = re.compile(r"^(struct|enum)\b.*}\s*$")
+_BARE_DECLARATION = re.compile(
+    r"^(?:unsigned|signed|long|short|int|float|double|char|bool|auto|string|"
+    r"vector<[^>]+>|map<[^>]+>|set<[^>]+>|[A-Za-z_]\w*(?:::\w+)?)\s+"
+    r"[A-Za-z_]\w*(?:\s*\[[^\]]*\])?$"
+)
+_CONTROL_MARKERS = (
+    'if (', 'if(', 'for (', 'for(', 'while (', 'while(',
+    'else', 'try', 'catch', 'switch', 'case ', 'default:', 'do '
+)
+
+
 def _has_statement_glued_after_assignment(line: str) -> bool:
     """
     Detect missing ';' between two statements on a single line, e.g.:
@@ -1320,118 +1369,88 @@ def _has_statement_glued_after_assignment(line: str) -> bool:
     if "for(" in line or "for (" in line:
         return False
 
-    declaration_then_stmt = re.search(
-        r"(?:^|[;{}])\s*(?:[A-Za-z_][\w<>\[\]]*\s+)+[A-Za-z_]\w*\s*=\s*[^;{}]+?\s*"
-        r"(?:System\.out|console\.log|printf|fprintf|puts|cout|std::cout|cin|std::cin|[A-Za-z_]\w+\s*=)",
-        line,
-    )
-    if declaration_then_stmt:
+    if _GLUED_DECLARATION.search(line):
         return True
+    return bool(_GLUED_ASSIGNMENT.search(line))
 
-    assignment_then_known_stmt = re.search(
-        r"(?:^|[;{}])\s*[A-Za-z_]\w*\s*=\s*[^;{}]+?\s*"
-        r"(?:System\.out|console\.log|printf|fprintf|puts|cout|std::cout|cin|std::cin|return\b|if\b|while\b|switch\b|throw\b|[A-Za-z_]\w+\s*=)",
-        line,
-    )
-    return bool(assignment_then_known_stmt)
 
+def _missing_semicolon_issue(lineno: int, raw: str, clean: str, language: str | None) -> dict | None:
+    l = clean.strip()
+    if not l:
+        return None
 
-def _find_missing_semicolon_issues(code: str, language: str | None = None) -> list[dict]:
-    sanitized = _strip_c_like_comments_and_strings(code)
-    simple_statements = [
-        r'^return\s+.+$', r'^cout\s*<<.*$', r'^cin\s*>>.*$',
-        r'^printf\s*\(.*\)$', r'^fprintf\s*\(.*\)$', r'^puts\s*\(.*\)$',
-        r'^std::cout\s*<<.*$', r'^std::cin\s*>>.*$',
-        r'^(break|continue)\s*$', r'^\w+(\.\w+)?\s*(\+\+|--)$',
-        r'^throw\s+.+$',
-    ]
-    issues = []
-    for lineno, (raw, clean) in enumerate(zip(code.splitlines(), sanitized.splitlines()), start=1):
-        l = clean.strip()
-        if not l:
-            continue
+    if l.startswith("using namespace") and not l.endswith(";"):
+        return _make_issue(
+            "MissingDelimiter",
+            "Missing semicolon after namespace declaration.",
+            line=lineno,
+            col=max(len(raw.rstrip()), 1),
+            snippet=raw.strip(),
+            suggestion="Add ';' at the end of the statement.",
+        )
 
-        if l.startswith("using namespace") and not l.endswith(";"):
-            issues.append(_make_issue(
-                "MissingDelimiter",
-                "Missing semicolon after namespace declaration.",
-                line=lineno,
-                col=max(len(raw.rstrip()), 1),
-                snippet=raw.strip(),
-                suggestion="Add ';' at the end of the statement.",
-            ))
-            continue
+    if _STRUCT_OR_ENUM_CLOSE.match(l) and not l.endswith("};"):
+        return _make_issue(
+            "MissingDelimiter",
+            "Missing semicolon after struct or enum declaration.",
+            line=lineno,
+            col=max(len(raw.rstrip()), 1),
+            snippet=raw.strip(),
+            suggestion="Add ';' after the closing brace.",
+        )
 
-        if re.match(r"^(struct|enum)\b.*}\s*$", l) and not l.endswith("};"):
-            issues.append(_make_issue(
-                "MissingDelimiter",
-                "Missing semicolon after struct or enum declaration.",
-                line=lineno,
-                col=max(len(raw.rstrip()), 1),
-                snippet=raw.strip(),
-                suggestion="Add ';' after the closing brace.",
-            ))
-            continue
+    if _BARE_DECLARATION.match(l):
+        return _make_issue(
+            "MissingDelimiter",
+            "Missing semicolon after variable declaration.",
+            line=lineno,
+            col=max(len(raw.rstrip()), 1),
+            snippet=raw.strip(),
+            suggestion="Add ';' at the end of the declaration.",
+        )
 
-        if re.match(
-            r"^(?:unsigned|signed|long|short|int|float|double|char|bool|auto|string|"
-            r"vector<[^>]+>|map<[^>]+>|set<[^>]+>|[A-Za-z_]\w*(?:::\w+)?)\s+"
-            r"[A-Za-z_]\w*(?:\s*\[[^\]]*\])?$",
-            l,
+    if _has_statement_glued_after_assignment(l):
+        return _make_issue(
+            "MissingDelimiter",
+            "Two statements appear to be glued together without a semicolon.",
+            line=lineno,
+            col=max(len(raw.rstrip()), 1),
+            snippet=raw.strip(),
+            suggestion="Insert ';' between the statements.",
+        )
+
+    if (l.startswith('//') or l.startswith('/*') or l.startswith('*') or
+        l.startswith('#') or l.endswith('{') or l.endswith('}') or
+        l.startswith('import') or l.startswith('package') or
+        l.startswith('using') or l.startswith('namespace') or
+        'class ' in l[:20]):
+        return None
+    if language == "JavaScript":
+        # JavaScript supports automatic semicolon insertion; only flag stronger patterns.
+        return None
+    is_control = any(kw in l for kw in _CONTROL_MARKERS)
+    if not is_control and not l.endswith(';') and not l.endswith('{') and not l.endswith('}'):
+        if any(pattern.match(l) for pattern in _SIMPLE_STATEMENTS) or (
+            ('=' in l or ('(' in l and ')' in l)) and not l.startswith('}')
         ):
-            issues.append(_make_issue(
+            return _make_issue(
                 "MissingDelimiter",
-                "Missing semicolon after variable declaration.",
+                "Missing semicolon at the end of the statement.",
                 line=lineno,
                 col=max(len(raw.rstrip()), 1),
                 snippet=raw.strip(),
-                suggestion="Add ';' at the end of the declaration.",
-            ))
-            continue
+                suggestion="Add ';' at the end of the statement.",
+            )
+    return None
 
-        if _has_statement_glued_after_assignment(l):
-            issues.append(_make_issue(
-                "MissingDelimiter",
-                "Two statements appear to be glued together without a semicolon.",
-                line=lineno,
-                col=max(len(raw.rstrip()), 1),
-                snippet=raw.strip(),
-                suggestion="Insert ';' between the statements.",
-            ))
-            continue
 
-        if (l.startswith('//') or l.startswith('/*') or l.startswith('*') or
-            l.startswith('#') or l.endswith('{') or l.endswith('}') or
-            l.startswith('import') or l.startswith('package') or
-            l.startswith('using') or l.startswith('namespace') or
-            'class ' in l[:20]):
-            continue
-        if language == "JavaScript":
-            # JavaScript supports automatic semicolon insertion; only flag stronger patterns.
-            continue
-        is_control = any(kw in l for kw in [
-            'if (', 'if(', 'for (', 'for(', 'while (', 'while(',
-            'else', 'try', 'catch', 'switch', 'case ', 'default:', 'do '
-        ])
-        if not is_control and not l.endswith(';') and not l.endswith('{') and not l.endswith('}'):
-            if any(re.match(pat, l) for pat in simple_statements):
-                issues.append(_make_issue(
-                    "MissingDelimiter",
-                    "Missing semicolon at the end of the statement.",
-                    line=lineno,
-                    col=max(len(raw.rstrip()), 1),
-                    snippet=raw.strip(),
-                    suggestion="Add ';' at the end of the statement.",
-                ))
-            elif ('=' in l or ('(' in l and ')' in l)) and not l.startswith('}'):
-                issues.append(_make_issue(
-                    "MissingDelimiter",
-                    "Missing semicolon at the end of the statement.",
-                    line=lineno,
-                    col=max(len(raw.rstrip()), 1),
-                    snippet=raw.strip(),
-                    suggestion="Add ';' at the end of the statement.",
-                ))
+def _find_missing_semicolon_issues(code: str, language: str | None = None, source: _CLikeSource | None = None) -> list[dict]:
+    source = source or _CLikeSource(code)
+    issues = []
+    for lineno, (raw, clean) in enumerate(zip(source.lines, source.clean_lines), start=1):
+        issue = _missing_semicolon_issue(lineno, raw, clean, language)
+        if issue:
+            issues.append(issue)
     return issues
 
 
@@ -1439,119 +1458,151 @@ def _has_missing_semicolons(code):
     return len(_find_missing_semicolon_issues(code)) > 0
 
 
-def _find_infinite_loop_issues(code: str) -> list[dict]:
-    sanitized = _strip_c_like_comments_and_strings(code)
+_ALWAYS_TRUE_LOOP = re.compile(r"\bwhile\s*\(\s*(true|1)\s*\)|\bfor\s*\(\s*;\s*;\s*\)", re.IGNORECASE)
+_ZERO_ASSIGNMENT = re.compile(r"\b([A-Za-z_]\w*)\s*=\s*0(?:\.0+)?\s*;?")
+_LITERAL_ZERO_DIVISOR = re.compile(r"[/%]\s*0(\.0+)?\b")
+_VARIABLE_DIVISOR = re.compile(r"[/%]\s*([A-Za-z_]\w*)\b")
+_JUMP_STATEMENT = re.compile(r"\b(return|break|continue|throw)\b")
+_FUNCTION_HEADER = re.compile(
+    r"^(?:[A-Za-z_]\w*(?:::[A-Za-z_]\w*)?|public|private|protected|static|final|virtual|inline|template)"
+    r"[\w\s:<>,*&\[\]]*\([^;]*\)\s*\{\s*$"
+)
+
+
+def _infinite_loop_issue(lineno: int, clean: str, lines: list[str]) -> dict | None:
+    if not _ALWAYS_TRUE_LOOP.search(clean):
+        return None
+    return _make_issue(
+        "InfiniteLoop",
+        "Loop condition is always true and has no visible exit path.",
+        line=lineno,
+        col=max(clean.find("while"), clean.find("for")) + 1,
+        snippet=lines[lineno - 1].strip(),
+        suggestion="Add an exit condition or a break path inside the loop.",
+    )
+
+
+def _find_infinite_loop_issues(code: str, source: _CLikeSource | None = None) -> list[dict]:
+    source = source or _CLikeSource(code)
     issues = []
-    for lineno, line in enumerate(sanitized.splitlines(), start=1):
-        if re.search(r"\bwhile\s*\(\s*(true|1)\s*\)|\bfor\s*\(\s*;\s*;\s*\)", line, flags=re.IGNORECASE):
-            issues.append(_make_issue(
-                "InfiniteLoop",
-                "Loop condition is always true and has no visible exit path.",
-                line=lineno,
-                col=max(line.find("while"), line.find("for")) + 1,
-                snippet=code.splitlines()[lineno - 1].strip(),
-                suggestion="Add an exit condition or a break path inside the loop.",
-            ))
+    for lineno, line in enumerate(source.clean_lines, start=1):
+        issue = _infinite_loop_issue(lineno, line, source.lines)
+        if issue:
+            issues.append(issue)
     return issues
 
 
-def _find_division_by_zero_issues(code: str) -> list[dict]:
-    sanitized = _strip_c_like_comments_and_strings(code)
+def _division_by_zero_issue(lineno: int, clean: str, lines: list[str], zero_vars: set[str]) -> dict | None:
+    literal_match = _LITERAL_ZERO_DIVISOR.search(clean)
+    if literal_match:
+        return _make_issue(
+            "DivisionByZero",
+            "Possible division or modulo by zero.",
+            line=lineno,
+            col=literal_match.start() + 1,
+            snippet=lines[lineno - 1].strip(),
+            suggestion="Guard the denominator or change it to a non-zero value.",
+        )
+
+    var_match = _VARIABLE_DIVISOR.search(clean)
+    if var_match and var_match.group(1) in zero_vars:
+        return _make_issue(
+            "DivisionByZero",
+            f"Possible division or modulo by zero via variable '{var_match.group(1)}'.",
+            line=lineno,
+            col=var_match.start() + 1,
+            snippet=lines[lineno - 1].strip(),
+            suggestion="Guard the denominator or change it to a non-zero value.",
+        )
+    return None
+
+
+def _find_division_by_zero_issues(code: str, source: _CLikeSource | None = None) -> list[dict]:
+    source = source or _CLikeSource(code)
     issues = []
-    sanitized_lines = sanitized.splitlines()
-    original_lines = code.splitlines()
 
     # Track simple constant assignments so `x / y` can be flagged when y == 0.
     zero_vars: set[str] = set()
-    for line in sanitized_lines:
-        for assign_match in re.finditer(r"\b([A-Za-z_]\w*)\s*=\s*0(?:\.0+)?\s*;?", line):
+    for line in source.clean_lines:
+        for assign_match in _ZERO_ASSIGNMENT.finditer(line):
             zero_vars.add(assign_match.group(1))
 
-    for lineno, line in enumerate(sanitized_lines, start=1):
-        literal_match = re.search(r"[/%]\s*0(\.0+)?\b", line)
-        if literal_match:
-            issues.append(_make_issue(
-                "DivisionByZero",
-                "Possible division or modulo by zero.",
-                line=lineno,
-                col=literal_match.start() + 1,
-                snippet=original_lines[lineno - 1].strip(),
-                suggestion="Guard the denominator or change it to a non-zero value.",
-            ))
-            continue
+    for lineno, line in enumerate(source.clean_lines, start=1):
+        issue = _division_by_zero_issue(lineno, line, source.lines, zero_vars)
+        if issue:
+            issues.append(issue)
+    return issues
 
-        var_match = re.search(r"[/%]\s*([A-Za-z_]\w*)\b", line)
-        if var_match and var_match.group(1) in zero_vars:
-            issues.append(_make_issue(
-                "DivisionByZero",
-                f"Possible division or modulo by zero via variable '{var_match.group(1)}'.",
+
+def _unreachable_code_step(lineno: int, clean: str, lines: list[str], pending_after_jump: bool) -> tuple[dict | None, bool]:
+    """One line of the unreachable-code scan; returns the finding and the new pending-jump state."""
+    stripped = clean.strip()
+    if not stripped:
+        return None, pending_after_jump
+    issue = None
+    if pending_after_jump:
+        if stripped.startswith("}") or stripped.startswith("case ") or stripped.startswith("default:"):
+            pending_after_jump = False
+        elif _FUNCTION_HEADER.match(stripped):
+            # New function/method scope: previous jump does not apply here.
+            pending_after_jump = False
+        else:
+            issue = _make_issue(
+                "UnreachableCode",
+                "Statement appears after a control-flow jump and may never execute.",
                 line=lineno,
-                col=var_match.start() + 1,
-                snippet=original_lines[lineno - 1].strip(),
-                suggestion="Guard the denominator or change it to a non-zero value.",
-            ))
-    return issues
+                col=1,
+                snippet=lines[lineno - 1].strip(),
+                suggestion="Remove the dead statement or restructure the control flow.",
+            )
+            pending_after_jump = False
+    jump_match = _JUMP_STATEMENT.search(stripped)
+    if jump_match:
+        trailing = stripped[jump_match.end():]
+        pending_after_jump = "}" not in trailing
+    return issue, pending_after_jump
 
 
-def _find_unreachable_code_issues(code: str) -> list[dict]:
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    original_lines = code.splitlines()
+def _find_unreachable_code_issues(code: str, source: _CLikeSource | None = None) -> list[dict]:
+    source = source or _CLikeSource(code)
     issues = []
     pending_after_jump = False
 
-    for lineno, clean in enumerate(sanitized_lines, start=1):
-        stripped = clean.strip()
-        if not stripped:
-            continue
-        if pending_after_jump:
-            if stripped.startswith("}") or stripped.startswith("case ") or stripped.startswith("default:"):
-                pending_after_jump = False
-            elif re.match(
-                r"^(?:[A-Za-z_]\w*(?:::[A-Za-z_]\w*)?|public|private|protected|static|final|virtual|inline|template)"
-                r"[\w\s:<>,*&\[\]]*\([^;]*\)\s*\{\s*$",
-                stripped,
-            ):
-                # New function/method scope: previous jump does not apply here.
-                pending_after_jump = False
-            else:
-                issues.append(_make_issue(
-                    "UnreachableCode",
-                    "Statement appears after a control-flow jump and may never execute.",
-                    line=lineno,
-                    col=1,
-                    snippet=original_lines[lineno - 1].strip(),
-                    suggestion="Remove the dead statement or restructure the control flow.",
-                ))
-                pending_after_jump = False
-        jump_match = re.search(r"\b(return|break|continue|throw)\b", stripped)
-        if jump_match:
-            trailing = stripped[jump_match.end():]
-            pending_after_jump = "}" not in trailing
+    for lineno, clean in enumerate(source.clean_lines, start=1):
+        issue, pending_after_jump = _unreachable_code_step(lineno, clean, source.lines, pending_after_jump)
+        if issue:
+            issues.append(issue)
     return issues
 
 
-def _find_missing_include_issues(code: str, language: str) -> list[dict]:
+# symbol -> (usage pattern, required header, header include pattern), in C_STDIO_SYMBOLS order.
+_C_SYMBOL_PATTERNS = {
+    symbol: (
+        re.compile(r"\bFILE\b" if symbol == "FILE" else rf"\b{symbol}\s*\("),
+        C_SYMBOL_TO_HEADER.get(symbol, "stdio.h"),
+        re.compile(rf"^\s*#include\s*<{re.escape(C_SYMBOL_TO_HEADER.get(symbol, 'stdio.h'))}>", re.MULTILINE),
+    )
+    for symbol in C_STDIO_SYMBOLS
+}
+
+
+def _find_missing_include_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language not in {"C", "C++"}:
         return []
     issues = []
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    includes = "\n".join(sanitized_lines)
-    original_lines = code.splitlines()
-
-    for symbol in C_STDIO_SYMBOLS:
-        if symbol == "FILE":
-            pattern = r"\bFILE\b"
-        else:
-            pattern = rf"\b{symbol}\s*\("
-        if not re.search(pattern, includes):
+    source = source or _CLikeSource(code)
+    sanitized_lines = source.clean_lines
+    includes = source.clean_text
+    original_lines = source.lines
+
+    for symbol, (pattern, required_header, header_include_pattern) in _C_SYMBOL_PATTERNS.items():
+        # Substring test first: most snippets mention only a handful of these symbols.
+        if symbol not in includes or not pattern.search(includes):
             continue
-        # Get the correct header for this symbol
-        required_header = C_SYMBOL_TO_HEADER.get(symbol, "stdio.h")
-        header_include_pattern = rf"^\s*#include\s*<{re.escape(required_header)}>"
-        if re.search(header_include_pattern, includes, flags=re.MULTILINE):
+        if header_include_pattern.search(includes):
             continue
         for lineno, line in enumerate(sanitized_lines, start=1):
-            if re.search(pattern, line):
+            if pattern.search(line):
                 issues.append(_make_issue(
                     "MissingInclude",
                     f"{symbol} is used without including <{required_header}>.",
@@ -1580,16 +1631,17 @@ def _find_missing_include_issues(code: str, language: str) -> list[dict]:
     return issues
 
 
-def _find_missing_import_issues(code: str, language: str) -> list[dict]:
+def _find_missing_import_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language != "Java":
         return []
     issues = []
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    sanitized = "\n".join(sanitized_lines)
-    original_lines = code.splitlines()
+    source = source or _CLikeSource(code)
+    sanitized_lines = source.clean_lines
+    sanitized = source.clean_text
+    original_lines = source.lines
 
     for symbol, import_path in JAVA_IMPORT_HINTS.items():
-        if not re.search(rf"\b{symbol}\b", sanitized):
+        if symbol not in sanitized or not re.search(rf"\b{symbol}\b", sanitized):
             continue
         if re.search(rf"^\s*import\s+{re.escape(import_path)}\s*;", sanitized, flags=re.MULTILINE):
             continue
@@ -1611,73 +1663,82 @@ def _find_missing_import_issues(code: str, language: str) -> list[dict]:
     return issues
 
 
-def _find_type_mismatch_issues(code: str, language: str) -> list[dict]:
+_NUMERIC_FROM_STRING = re.compile(
+    r"\b(?:int|long|short|byte|float|double|char|bool|boolean)\s+([A-Za-z_]\w*)\s*=\s*\"[^\"]*\"\s*;?"
+)
+_STRING_FROM_NUMBER = re.compile(r"\bString\s+([A-Za-z_]\w*)\s*=\s*\d+\s*;?")
+_JAVA_NARROWING_NUMERIC = re.compile(
+    r"\b(?:int|long|short|byte|char)\s+[A-Za-z_]\w*\s*=\s*\d+\.\d+\s*;?"
+)
+_JAVA_STRING_FROM_BOOL = re.compile(r"\bString\s+[A-Za-z_]\w*\s*=\s*(?:true|false)\s*;?")
+_JAVA_BOOL_FROM_STRING = re.compile(r"\bboolean\s+[A-Za-z_]\w*\s*=\s*\"[^\"]*\"\s*;?")
+_C_SCALAR_FROM_MULTICHAR = re.compile(r"\b(?:int|long|short|float|double|char)\s+[A-Za-z_]\w*\s*=\s*'.{2,}'")
+_JAVA_BOOL_FROM_NUMBER = re.compile(r"\bboolean\s+[A-Za-z_]\w*\s*=\s*\d+")
+
+
+def _type_mismatch_issue(lineno: int, raw: str, sanitized_lines: list[str], language: str) -> dict | None:
+    if _NUMERIC_FROM_STRING.search(raw) or _STRING_FROM_NUMBER.search(raw):
+        return _make_issue(
+            "TypeMismatch",
+            "Assigned value type does not match the declared variable type.",
+            line=lineno,
+            col=1,
+            snippet=raw.strip(),
+            suggestion="Convert the value to the correct type or change the variable declaration.",
+        )
+    if language == "Java" and (
+        _JAVA_NARROWING_NUMERIC.search(sanitized_lines[lineno - 1])
+        or _JAVA_STRING_FROM_BOOL.search(sanitized_lines[lineno - 1])
+        or _JAVA_BOOL_FROM_STRING.search(sanitized_lines[lineno - 1])
+    ):
+        return _make_issue(
+            "TypeMismatch",
+            "Assigned value type does not match the declared variable type.",
+            line=lineno,
+            col=1,
+            snippet=raw.strip(),
+            suggestion="Use an explicit conversion or assign a compatible type.",
+        )
+    if language in {"C", "C++"} and _C_SCALAR_FROM_MULTICHAR.search(raw):
+        return _make_issue(
+            "TypeMismatch",
+            "Assigned value type does not match the declared variable type.",
+            line=lineno,
+            col=1,
+            snippet=raw.strip(),
+            suggestion="Use a compatible scalar value or change the variable type.",
+        )
+    if language == "Java" and _JAVA_BOOL_FROM_NUMBER.search(sanitized_lines[lineno - 1]):
+        return _make_issue(
+            "TypeMismatch",
+            "Assigned value type does not match the declared variable type.",
+            line=lineno,
+            col=1,
+            snippet=raw.strip(),
+            suggestion="Assign a boolean literal or convert the expression.",
+        )
+    return None
+
+
+def _find_type_mismatch_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language not in {"Java", "C", "C++"}:
         return []
+    source = source or _CLikeSource(code)
     issues = []
-    original_lines = code.splitlines()
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-
-    numeric_decl = re.compile(
-        r"\b(?:int|long|short|byte|float|double|char|bool|boolean)\s+([A-Za-z_]\w*)\s*=\s*\"[^\"]*\"\s*;?"
-    )
-    string_decl = re.compile(r"\bString\s+([A-Za-z_]\w*)\s*=\s*\d+\s*;?")
-    java_narrowing_numeric = re.compile(
-        r"\b(?:int|long|short|byte|char)\s+[A-Za-z_]\w*\s*=\s*\d+\.\d+\s*;?"
-    )
-    java_string_bool = re.compile(r"\bString\s+[A-Za-z_]\w*\s*=\s*(?:true|false)\s*;?")
-    java_bool_string = re.compile(r"\bboolean\s+[A-Za-z_]\w*\s*=\s*\"[^\"]*\"\s*;?")
-
-    for lineno, raw in enumerate(original_lines, start=1):
-        if numeric_decl.search(raw) or string_decl.search(raw):
-            issues.append(_make_issue(
-                "TypeMismatch",
-                "Assigned value type does not match the declared variable type.",
-                line=lineno,
-                col=1,
-                snippet=raw.strip(),
-                suggestion="Convert the value to the correct type or change the variable declaration.",
-            ))
-        elif language == "Java" and (
-            java_narrowing_numeric.search(sanitized_lines[lineno - 1])
-            or java_string_bool.search(sanitized_lines[lineno - 1])
-            or java_bool_string.search(sanitized_lines[lineno - 1])
-        ):
-            issues.append(_make_issue(
-                "TypeMismatch",
-                "Assigned value type does not match the declared variable type.",
-                line=lineno,
-                col=1,
-                snippet=raw.strip(),
-                suggestion="Use an explicit conversion or assign a compatible type.",
-            ))
-        elif language in {"C", "C++"} and re.search(r"\b(?:int|long|short|float|double|char)\s+[A-Za-z_]\w*\s*=\s*'.{2,}'", raw):
-            issues.append(_make_issue(
-                "TypeMismatch",
-                "Assigned value type does not match the declared variable type.",
-                line=lineno,
-                col=1,
-                snippet=raw.strip(),
-                suggestion="Use a compatible scalar value or change the variable type.",
-            ))
-        elif language == "Java" and re.search(r"\bboolean\s+[A-Za-z_]\w*\s*=\s*\d+", sanitized_lines[lineno - 1]):
-            issues.append(_make_issue(
-                "TypeMismatch",
-                "Assigned value type does not match the declared variable type.",
-                line=lineno,
-                col=1,
-                snippet=raw.strip(),
-                suggestion="Assign a boolean literal or convert the expression.",
-            ))
+    for lineno, raw in enumerate(source.lines, start=1):
+        issue = _type_mismatch_issue(lineno, raw, source.clean_lines, language)
+        if issue:
+            issues.append(issue)
     return issues
 
 
-def _find_dangling_pointer_return_issues(code: str, language: str) -> list[dict]:
+def _find_dangling_pointer_return_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language not in {"C", "C++"}:
         return []
 
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    original_lines = code.splitlines()
+    source = source or _CLikeSource(code)
+    sanitized_lines = source.clean_lines
+    original_lines = source.lines
     issues: list[dict] = []
 
     func_start = re.compile(
@@ -1772,55 +1833,71 @@ def _find_dangling_pointer_return_issues(code: str, language: str) -> list[dict]
     return issues
 
 
+def _line_too_long_issue(line_no: int, line: str, max_len: int = 120) -> dict | None:
+    if len(line) <= max_len:
+        return None
+    return _make_issue(
+        "LineTooLong",
+        f"Line exceeds {max_len} characters.",
+        line=line_no,
+        col=max_len + 1,
+        snippet=line.strip(),
+        suggestion="Wrap this line for readability.",
+    )
+
+
 def _find_line_too_long_issues(code: str, language: str, max_len: int = 120) -> list[dict]:
     if language not in {"Java"}:
         return []
     issues = []
     for line_no, line in enumerate(code.splitlines(), start=1):
-        if len(line) <= max_len:
-            continue
-        issues.append(_make_issue(
-            "LineTooLong",
-            f"Line exceeds {max_len} characters.",
-            line=line_no,
-            col=max_len + 1,
-            snippet=line.strip(),
-            suggestion="Wrap this line for readability.",
-        ))
+        issue = _line_too_long_issue(line_no, line, max_len)
+        if issue:
+            issues.append(issue)
     return issues
 
 
-def _find_import_error_issues(code: str, language: str) -> list[dict]:
+_JAVA_IMPORT = re.compile(r"^import\s+([A-Za-z_][\w\.]*)\s*;")
+_SUSPICIOUS_IMPORT_TOKENS = ("doesnotexist", "ghost", "imaginary", "not.real", "foo.bar.baz")
+
+
+def _import_error_issue(line_no: int, clean: str, lines: list[str]) -> dict | None:
+    import_match = _JAVA_IMPORT.match(clean.strip())
+    if not import_match:
+        return None
+    import_path = import_match.group(1)
+    lowered = import_path.lower()
+    if not any(token in lowered for token in _SUSPICIOUS_IMPORT_TOKENS):
+        return None
+    return _make_issue(
+        "ImportError",
+        f"Imported package '{import_path}' appears invalid or unavailable.",
+        line=line_no,
+        col=1,
+        snippet=lines[line_no - 1].strip(),
+        suggestion="Check package name and dependency availability.",
+    )
+
+
+def _find_import_error_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language != "Java":
         return []
+    source = source or _CLikeSource(code)
     issues = []
-    suspicious_tokens = ("doesnotexist", "ghost", "imaginary", "not.real", "foo.bar.baz")
-    for line_no, line in enumerate(_strip_c_like_comments_and_strings(code).splitlines(), start=1):
-        stripped = line.strip()
-        import_match = re.match(r"^import\s+([A-Za-z_][\w\.]*)\s*;", stripped)
-        if not import_match:
-            continue
-        import_path = import_match.group(1)
-        lowered = import_path.lower()
-        if not any(token in lowered for token in suspicious_tokens):
-            continue
-        issues.append(_make_issue(
-            "ImportError",
-            f"Imported package '{import_path}' appears invalid or unavailable.",
-            line=line_no,
-            col=1,
-            snippet=code.splitlines()[line_no - 1].strip(),
-            suggestion="Check package name and dependency availability.",
-        ))
+    for line_no, line in enumerate(source.clean_lines, start=1):
+        issue = _import_error_issue(line_no, line, source.lines)
+        if issue:
+            issues.append(issue)
     return issues
 
 
-def _find_invalid_assignment_issues(code: str, language: str) -> list[dict]:
+def _find_invalid_assignment_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language != "Java":
         return []
     issues = []
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    original_lines = code.splitlines()
+    source = source or _CLikeSource(code)
+    sanitized_lines = source.clean_lines
+    original_lines = source.lines
 
     final_vars: dict[str, int] = {}
     array_vars: dict[str, int] = {}
@@ -1880,12 +1957,13 @@ def _find_invalid_assignment_issues(code: str, language: str) -> list[dict]:
     return issues
 
 
-def _find_unused_variable_issues(code: str, language: str) -> list[dict]:
+def _find_unused_variable_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language != "Java":
         return []
     issues = []
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    original_lines = code.splitlines()
+    source = source or _CLikeSource(code)
+    sanitized_lines = source.clean_lines
+    original_lines = source.lines
 
     declaration_pattern = re.compile(
         r"\b(?:int|long|short|byte|float|double|char|boolean|String)\s+([A-Za-z_]\w*)\b(?:\s*=\s*[^;]+)?;"
@@ -1922,8 +2000,8 @@ def _find_unused_variable_issues(code: str, language: str) -> list[dict]:
     return issues
 
 
-def _collect_declared_names(code: str, language: str) -> set[str]:
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
+def _collect_declared_names(code: str, language: str, source: _CLikeSource | None = None) -> set[str]:
+    sanitized_lines = (source or _CLikeSource(code)).clean_lines
     declared = set()
 
     if language == "JavaScript":
@@ -1984,12 +2062,15 @@ def _collect_declared_names(code: str, language: str) -> set[str]:
     return declared
 
 
-def _find_duplicate_definition_issues(code: str, language: str) -> list[dict]:
+def _find_duplicate_definition_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     issues = []
+    if language not in {"JavaScript", "Java"}:
+        return issues
+    source = source or _CLikeSource(code)
 
     if language == "JavaScript":
         seen = {}
-        for lineno, line in enumerate(_strip_c_like_comments_and_strings(code).splitlines(), start=1):
+        for lineno, line in enumerate(source.clean_lines, start=1):
             for match in re.finditer(r"\b(let|const)\s+([A-Za-z_]\w*)", line):
                 name = match.group(2)
                 if name in seen:
@@ -1998,7 +2079,7 @@ def _find_duplicate_definition_issues(code: str, language: str) -> list[dict]:
                         f"{name} is declared multiple times in the same scope.",
                         line=lineno,
                         col=match.start(2) + 1,
-                        snippet=code.splitlines()[lineno - 1].strip(),
+                        snippet=source.lines[lineno - 1].strip(),
                         suggestion="Rename or remove the duplicate declaration.",
                     ))
                 else:
@@ -2009,7 +2090,7 @@ def _find_duplicate_definition_issues(code: str, language: str) -> list[dict]:
         seen_methods = {}
         seen_fields = {}
         type_pattern = r"(?:int|long|short|byte|float|double|char|boolean|String|void)"
-        for lineno, line in enumerate(_strip_c_like_comments_and_strings(code).splitlines(), start=1):
+        for lineno, line in enumerate(source.clean_lines, start=1):
             method_match = re.search(rf"\b(?:public|private|protected|static|final|\s)+{type_pattern}\s+([A-Za-z_]\w*)\s*\(", line)
             if method_match:
                 name = method_match.group(1)
@@ -2019,7 +2100,7 @@ def _find_duplicate_definition_issues(code: str, language: str) -> list[dict]:
                         f"Method '{name}' is defined multiple times.",
                         line=lineno,
                         col=method_match.start(1) + 1,
-                        snippet=code.splitlines()[lineno - 1].strip(),
+                        snippet=source.lines[lineno - 1].strip(),
                         suggestion="Rename, overload with distinct signature, or remove duplicates.",
                     ))
                 else:
@@ -2034,7 +2115,7 @@ def _find_duplicate_definition_issues(code: str, language: str) -> list[dict]:
                         f"Field '{name}' is declared multiple times.",
                         line=lineno,
                         col=field_match.start(1) + 1,
-                        snippet=code.splitlines()[lineno - 1].strip(),
+                        snippet=source.lines[lineno - 1].strip(),
                         suggestion="Rename or remove duplicate field declarations.",
                     ))
                 else:
@@ -2044,10 +2125,11 @@ def _find_duplicate_definition_issues(code: str, language: str) -> list[dict]:
     return issues
 
 
-def _find_undeclared_identifier_issues(code: str, language: str) -> list[dict]:
-    declared = _collect_declared_names(code, language)
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-    original_lines = code.splitlines()
+def _find_undeclared_identifier_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
+    source = source or _CLikeSource(code)
+    declared = _collect_declared_names(code, language, source)
+    sanitized_lines = source.clean_lines
+    original_lines = source.lines
     issues = []
 
     excluded = set(C_LIKE_KEYWORDS) | declared
@@ -2102,75 +2184,153 @@ def _find_undeclared_identifier_issues(code: str, language: str) -> list[dict]:
     return issues
 
 
-def _find_incomplete_assignment_issues(code: str, language: str) -> list[dict]:
+_INCOMPLETE_ASSIGNMENT = re.compile(
+    r"^(?:let|const|var|int|long|short|byte|float|double|char|bool|boolean|String)\s+[A-Za-z_]\w*\s*=\s*;\s*$"
+)
+_DOUBLE_DOT = re.compile(r"\.\.(?!\.)")
+
+
+def _incomplete_assignment_issue(lineno: int, raw: str) -> dict | None:
+    line = raw.strip()
+    if not _INCOMPLETE_ASSIGNMENT.search(line):
+        return None
+    return _make_issue(
+        "MissingDelimiter",
+        "Assignment is missing a value expression.",
+        line=lineno,
+        col=1,
+        snippet=line,
+        suggestion="Provide a value on the right-hand side of '='.",
+    )
+
+
+def _find_incomplete_assignment_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language not in {"Java", "C", "C++", "JavaScript"}:
         return []
     issues = []
-    original_lines = code.splitlines()
+    original_lines = source.lines if source is not None else code.splitlines()
 
     for lineno, raw in enumerate(original_lines, start=1):
-        line = raw.strip()
-        if re.search(
-            r"^(?:let|const|var|int|long|short|byte|float|double|char|bool|boolean|String)\s+[A-Za-z_]\w*\s*=\s*;\s*$",
-            line,
-        ):
-            issues.append(_make_issue(
-                "MissingDelimiter",
-                "Assignment is missing a value expression.",
-                line=lineno,
-                col=1,
-                snippet=line,
-                suggestion="Provide a value on the right-hand side of '='.",
-            ))
+        issue = _incomplete_assignment_issue(lineno, raw)
+        if issue:
+            issues.append(issue)
     return issues
 
 
-def _find_invalid_member_access_issues(code: str, language: str) -> list[dict]:
+def _invalid_member_access_issue(lineno: int, clean: str, lines: list[str]) -> dict | None:
+    match = _DOUBLE_DOT.search(clean)
+    if not match:
+        return None
+    return _make_issue(
+        "MissingDelimiter",
+        "Invalid member access syntax '..'.",
+        line=lineno,
+        col=match.start() + 1,
+        snippet=lines[lineno - 1].strip(),
+        suggestion="Use a single '.' for property access.",
+    )
+
+
+def _find_invalid_member_access_issues(code: str, language: str, source: _CLikeSource | None = None) -> list[dict]:
     if language != "JavaScript":
         return []
+    source = source or _CLikeSource(code)
     issues = []
-    original_lines = code.splitlines()
-    sanitized_lines = _strip_c_like_comments_and_strings(code).splitlines()
-
-    for lineno, line in enumerate(sanitized_lines, start=1):
-        for match in re.finditer(r"\.\.(?!\.)", line):
-            issues.append(_make_issue(
-                "MissingDelimiter",
-                "Invalid member access syntax '..'.",
-                line=lineno,
-                col=match.start() + 1,
-                snippet=original_lines[lineno - 1].strip(),
-                suggestion="Use a single '.' for property access.",
-            ))
-            break
+    for lineno, line in enumerate(source.clean_lines, start=1):
+        issue = _invalid_member_access_issue(lineno, line, source.lines)
+        if issue:
+            issues.append(issue)
     return issues
 
 
+def _scan_c_like_lines(source: _CLikeSource, language: str) -> dict[str, list[dict]]:
+    """
+    Run the line-local C-like detectors in a single pass over the shared line arrays.
+
+    Findings are bucketed per detector so the caller can emit them in the same
+    order as the standalone ``_find_*`` functions, which stay available for
+    one-off checks. Division findings need every zero assignment first, so
+    candidate lines are only resolved after the pass.
+    """
+    lines, clean_lines = source.lines, source.clean_lines
+    buckets: dict[str, list[dict]] = {
+        name: []
+        for name in (
+            "missing_semicolon", "incomplete_assignment", "invalid_member_access", "type_mismatch",
+            "import_error", "line_too_long", "division_by_zero", "infinite_loop", "unreachable_code",
+        )
+    }
+    typed = language in {"Java", "C", "C++"}
+    assignments = typed or language == "JavaScript"
+    java = language == "Java"
+    javascript = language == "JavaScript"
+    zero_vars: set[str] = set()
+    division_lines: list[int] = []
+    pending_after_jump = False
+
+    def emit(name: str, issue: dict | None) -> None:
+        if issue:
+            buckets[name].append(issue)
+
+    for index in range(max(len(lines), len(clean_lines))):
+        lineno = index + 1
+        raw = lines[index] if index < len(lines) else None
+        clean = clean_lines[index] if index < len(clean_lines) else None
+        if raw is not None:
+            if clean is not None:
+                emit("missing_semicolon", _missing_semicolon_issue(lineno, raw, clean, language))
+            if assignments:
+                emit("incomplete_assignment", _incomplete_assignment_issue(lineno, raw))
+            if typed:
+                emit("type_mismatch", _type_mismatch_issue(lineno, raw, clean_lines, language))
+            if java:
+                emit("line_too_long", _line_too_long_issue(lineno, raw))
+        if clean is None:
+            continue
+        if javascript:
+            emit("invalid_member_access", _invalid_member_access_issue(lineno, clean, lines))
+        if java:
+            emit("import_error", _import_error_issue(lineno, clean, lines))
+        emit("infinite_loop", _infinite_loop_issue(lineno, clean, lines))
+        if "=" in clean:
+            zero_vars.update(match.group(1) for match in _ZERO_ASSIGNMENT.finditer(clean))
+        if "/" in clean or "%" in clean:
+            division_lines.append(lineno)
+        issue, pending_after_jump = _unreachable_code_step(lineno, clean, lines, pending_after_jump)
+        emit("unreachable_code", issue)
+
+    for lineno in division_lines:
+        emit("division_by_zero", _division_by_zero_issue(lineno, clean_lines[lineno - 1], lines, zero_vars))
+    return buckets
+
+
 def _collect_c_like_rule_based_issues(code: str, language: str) -> list[dict]:
+    source = _CLikeSource(code)
+    scanned = _scan_c_like_lines(source, language)
     issues = []
-    unclosed = _find_unclosed_string_issue(code)
+    unclosed = _find_unclosed_string_issue(code, source)
     if unclosed:
         issues.append(unclosed)
 
-    issues.extend(_find_unmatched_bracket_issues(code))
-    issues.extend(_find_missing_semicolon_issues(code, language))
-    issues.extend(_find_incomplete_assignment_issues(code, language))
-    issues.extend(_find_invalid_member_access_issues(code, language))
+    issues.extend(_find_unmatched_bracket_issues(code, source))
+    issues.extend(scanned["missing_semicolon"])
+    issues.extend(scanned["incomplete_assignment"])
+    issues.extend(scanned["invalid_member_access"])
 
     # Semantic checks remain useful even when the ML bundle is unavailable.
-    issues.extend(_find_type_mismatch_issues(code, language))
-    issues.extend(_find_missing_import_issues(code, language))
-    issues.extend(_find_missing_include_issues(code, language))
-    issues.extend(_find_import_error_issues(code, language))
-    issues.extend(_find_invalid_assignment_issues(code, language))
-    issues.extend(_find_line_too_long_issues(code, language))
-    issues.extend(_find_duplicate_definition_issues(code, language))
-    issues.extend(_find_unused_variable_issues(code, language))
-    issues.extend(_find_undeclared_identifier_issues(code, language))
-    issues.extend(_find_dangling_pointer_return_issues(code, language))
-    issues.extend(_find_division_by_zero_issues(code))
-    issues.extend(_find_infinite_loop_issues(code))
-    issues.extend(_find_unreachable_code_issues(code))
+    issues.extend(scanned["type_mismatch"])
+    issues.extend(_find_missing_import_issues(code, language, source))
+    issues.extend(_find_missing_include_issues(code, language, source))
+    issues.extend(scanned["import_error"])
+    issues.extend(_find_invalid_assignment_issues(code, language, source))
+    issues.extend(scanned["line_too_long"])
+    issues.extend(_find_duplicate_definition_issues(code, language, source))
+    issues.extend(_find_unused_variable_issues(code, language, source))
+    issues.extend(_find_undeclared_identifier_issues(code, language, source))
+    issues.extend(_find_dangling_pointer_return_issues(code, language, source))
+    issues.extend(scanned["division_by_zero"])
+    issues.extend(scanned["infinite_loop"])
+    issues.extend(scanned["unreachable_code"])
     issues = _suppress_cascading_syntax_noise(issues)
     return _normalize_rule_issues(issues)
 
@@ -1,5 +1,6 @@
 ﻿import os
 import re
+from functools import lru_cache
 
 _PREPROCESSOR_PREFIXES = (
     '#include',
@@ -15,12 +16,20 @@ _PREPROCESSOR_PREFIXES = (
     '#line',
 )
 
+# Characters that can open a string or a comment; everything before the first
+# one is copied as-is without walking it character by character.
+_SPECIAL_CHARACTER = re.compile(r'["\'`#/]')
+
 
 def _strip_inline_comments(raw_line: str, allow_hash_comment: bool) -> str:
-    cleaned: list[str] = []
+    first = _SPECIAL_CHARACTER.search(raw_line)
+    if first is None:
+        return raw_line.rstrip()
+
+    cleaned: list[str] = [raw_line[:first.start()]]
     quote: str | None = None
     escaped = False
-    index = 0
+    index = first.start()
 
     while index < len(raw_line):
         ch = raw_line[index]
@@ -121,37 +130,36 @@ def _strip_comment_noise(code: str) -> str:
     return '\n'.join(cleaned_lines)
 
 
-def detect_language(code: str | None, filename: str | None = None) -> str:
-    """
-    Detect the programming language of the given source code.
+_EXTENSION_LANGUAGES = {
+    '.py': 'Python',
+    '.java': 'Java',
+    '.c': 'C',
+    '.cpp': 'C++',
+    '.cc': 'C++',
+    '.cxx': 'C++',
+    '.hpp': 'C++',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'JavaScript',
+    '.tsx': 'JavaScript',
+}
 
-    Priority:
-      1. Filename extension (most reliable)
-      2. Score-based keyword matching (content fallback)
+# Content scoring only looks at this many leading characters (cut back to a
+# line boundary); the markers it scores almost always appear near the top.
+_CONTENT_SCAN_LIMIT = 16384
 
-    Returns one of: "Python", "Java", "C++", "C", "JavaScript", "Unknown"
-    """
-    if not isinstance(code, str):
-        return 'Unknown'
 
-    code = _strip_comment_noise(code)
-    code_lower = code.lower()
+def _scan_prefix(code: str) -> str:
+    if len(code) <= _CONTENT_SCAN_LIMIT:
+        return code
+    # End on a line boundary only when that keeps most of the prefix: cutting a
+    # long minified line back to the one before it would drop nearly everything.
+    cut = code.rfind('\n', 0, _CONTENT_SCAN_LIMIT)
+    return code[:cut] if cut > _CONTENT_SCAN_LIMIT // 2 else code[:_CONTENT_SCAN_LIMIT]
 
-    if filename:
-        ext = os.path.splitext(filename)[1].lower()
-        if ext == '.py':
-            return 'Python'
-        if ext == '.java':
-            return 'Java'
-        if ext == '.c':
-            return 'C'
-        if ext in ('.cpp', '.cc', '.cxx', '.hpp'):
-            return 'C++'
-        if ext in ('.js', '.jsx', '.ts', '.tsx'):
-            return 'JavaScript'
 
+def _score(code_lower: str) -> dict[str, int]:
     scores = {'Python': 0, 'Java': 0, 'C++': 0, 'C': 0, 'JavaScript': 0}
-    line_count = sum(1 for line in code.splitlines() if line.strip())
 
     if 'printf(' in code_lower or 'fprintf(' in code_lower or 'scanf(' in code_lower:
         scores['C'] += 2
@@ -194,6 +202,15 @@ def detect_language(code: str | None, filename: str | None = None) -> str:
     if 'elif ' in code_lower or 'except ' in code_lower:
         scores['Python'] += 2
 
+    return scores
+
+
+@lru_cache(maxsize=512)
+def _detect_from_content(prefix: str) -> str:
+    code = _strip_comment_noise(prefix)
+    scores = _score(code.lower())
+    line_count = sum(1 for line in code.splitlines() if line.strip())
+
     best = max(scores, key=scores.__getitem__)
     best_score = scores[best]
     if best_score == 0:
@@ -203,3 +220,23 @@ def detect_language(code: str | None, filename: str | None = None) -> str:
     return best
 
 
+def detect_language(code: str | None, filename: str | None = None) -> str:
+    """
+    Detect the programming language of the given source code.
+
+    Priority:
+      1. Filename extension (most reliable, checked before any scanning)
+      2. Score-based keyword matching (content fallback) over a bounded
+         prefix, memoized on that prefix
+
+    Returns one of: "Python", "Java", "C++", "C", "JavaScript", "Unknown"
+    """
+    if not isinstance(code, str):
+        return 'Unknown'
+
+    if filename:
+        language = _EXTENSION_LANGUAGES.get(os.path.splitext(filename)[1].lower())
+        if language:
+            return language
+
+    return _detect_from_content(_scan_prefix(code))
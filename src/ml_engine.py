@@ -1,11 +1,23 @@
+import json
 import logging
+import math
 import os
-import json
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 import joblib
 import numpy as np
 
+from .compact_model import (
+    COMPACT_METADATA_KEY,
+    CompactModel,
+    CompactModelError,
+    compact_files,
+    file_sha256,
+    is_compact_export_name,
+)
 from .feature_utils import extract_numerical_features
 
 logging.basicConfig(level=logging.INFO)
@@ -14,14 +26,72 @@ logger = logging.getLogger(__name__)
 MODEL_DIR = "models"
 REQUIRED_SKLEARN_MAJOR_MINOR = "1.1"
 MODEL_BUNDLE_METADATA_FILENAME = "bundle_metadata.json"
+# Inputs a reloaded bundle must score before it replaces the active one.
+RELOAD_SMOKE_CODES = (
+    "x = 1/0",
+    "def foo()\n    pass",
+    "from os import *",
+    "print('Hello'",
+    "int main() { return 0; }",
+)
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """One loaded model bundle.
+
+    Bundles are never mutated: a reload builds a new one and swaps the
+    ``active_bundle`` reference, so a prediction that took a reference keeps
+    using the same model, vectorizer and label encoder throughout.
+    """
+
+    model: Any
+    model_format: str  # "compact" (NumPy arrays, see compact_model) or "pickle" (joblib'd sklearn objects)
+    vectorizer: Any = None
+    label_encoder: Any = None
+    use_enhanced_features: bool = True
+    # True once every loaded file matched its sha256 in bundle_metadata.json;
+    # False for bundles whose metadata predates the "files" hashes.
+    verified: bool = False
+    metadata: dict[str, Any] = field(default_factory=dict)
+    version: int = 0
+    loaded_at: float = 0.0
+
+    @property
+    def labels(self) -> list[str]:
+        if self.model_format == "compact":
+            return list(self.model.labels)
+        return [str(label) for label in self.label_encoder.classes_]
+
+    def predict_proba(self, code: str) -> np.ndarray:
+        if self.model_format == "compact":
+            return np.asarray(self.model.predict_proba(code))
+
+        vec = self.vectorizer.transform([code])
+        if self.use_enhanced_features:
+            from scipy.sparse import hstack
 
-model: Any = None
-vectorizer: Any = None
-label_encoder: Any = None
-use_enhanced_features = False
+            numerical = extract_numerical_features(code)
+            numerical_array = np.array(numerical).reshape(1, -1)
+            vec = hstack([vec, numerical_array])
+        return self.model.predict_proba(vec)[0]
+
+    def predict(self, code: str) -> tuple[str, float]:
+        probs = self.predict_proba(code)
+        pred_index = int(np.argmax(probs))
+        if self.model_format == "compact":
+            return self.model.labels[pred_index], float(probs[pred_index])
+        return self.label_encoder.inverse_transform([pred_index])[0], float(probs[pred_index])
+
+
+active_bundle: ModelBundle | None = None
 model_loaded = False
 model_error: str | None = None
 bundle_metadata: dict[str, Any] = {}
+last_reload_error: str | None = None
+_bundle_versions = 0
+_reload_lock = threading.Lock()
+_watcher_stop: threading.Event | None = None
 
 
 class ModelUnavailableError(RuntimeError):
@@ -32,14 +102,48 @@ class ModelInferenceError(RuntimeError):
     """Raised when model inference fails after successful model load."""
 
 
-def _load_model_bundle() -> None:
-    global model
-    global vectorizer
-    global label_encoder
-    global use_enhanced_features
-    global model_loaded
-    global model_error
-    global bundle_metadata
+class BundleIntegrityError(RuntimeError):
+    """Raised when a bundle file does not match the hash recorded in bundle_metadata.json."""
+
+
+def _verify_bundle_files(names: list[str], metadata: dict[str, Any] | None = None, model_dir: str | None = None) -> bool:
+    """Check ``names`` (relative to the model directory) against the metadata hashes.
+
+    Returns False when the metadata records no hashes (older bundles), True
+    when every file matched; raises BundleIntegrityError otherwise.
+    """
+    metadata = bundle_metadata if metadata is None else metadata
+    model_dir = MODEL_DIR if model_dir is None else model_dir
+    expected = metadata.get("files")
+    if not isinstance(expected, dict):
+        return False
+    for name in names:
+        digest = expected.get(name)
+        if digest is None:
+            raise BundleIntegrityError(f"{name} is not listed in {MODEL_BUNDLE_METADATA_FILENAME}")
+        if file_sha256(os.path.join(model_dir, name)) != digest:
+            raise BundleIntegrityError(f"{name} does not match its sha256 in {MODEL_BUNDLE_METADATA_FILENAME}")
+    return True
+
+
+def _read_model_bundle(model_dir: str, metadata: dict[str, Any]) -> ModelBundle:
+    """Load the first bundle format in ``model_dir`` that verifies; raise ModelUnavailableError if none does."""
+    errors: list[str] = []
+    # Exports are versioned directories; the metadata names the one to use.
+    compact_name = metadata.get(COMPACT_METADATA_KEY)
+    if isinstance(compact_name, str) and is_compact_export_name(compact_name):
+        compact_dir = os.path.join(model_dir, compact_name)
+        try:
+            names = [f"{compact_name}/{name}" for name in compact_files(compact_dir)]
+            verified = _verify_bundle_files(names, metadata, model_dir)
+            return ModelBundle(
+                model=CompactModel.load(compact_dir),
+                model_format="compact",
+                verified=verified,
+                metadata=metadata,
+            )
+        except (CompactModelError, BundleIntegrityError, OSError) as exc:
+            errors.append(f"{compact_name}/: {exc}")
 
     candidates = [
         {
@@ -56,28 +160,148 @@ def _load_model_bundle() -> None:
         },
     ]
 
-    errors: list[str] = []
     for candidate in candidates:
         try:
-            vectorizer = joblib.load(os.path.join(MODEL_DIR, candidate["vectorizer"]))
-            model = joblib.load(os.path.join(MODEL_DIR, candidate["model"]))
-            label_encoder = joblib.load(os.path.join(MODEL_DIR, candidate["label_encoder"]))
+            verified = _verify_bundle_files([name for name in candidate.values() if name], metadata, model_dir)
+            vectorizer = joblib.load(os.path.join(model_dir, candidate["vectorizer"]))
+            model = joblib.load(os.path.join(model_dir, candidate["model"]))
+            label_encoder = joblib.load(os.path.join(model_dir, candidate["label_encoder"]))
             if candidate["numerical_features"]:
-                _ = joblib.load(os.path.join(MODEL_DIR, candidate["numerical_features"]))
-                use_enhanced_features = True
-            else:
-                use_enhanced_features = False
-            bundle_metadata = _load_bundle_metadata()
-            model_loaded = True
-            model_error = None
-            return
+                _ = joblib.load(os.path.join(model_dir, candidate["numerical_features"]))
+            return ModelBundle(
+                model=model,
+                model_format="pickle",
+                vectorizer=vectorizer,
+                label_encoder=label_encoder,
+                use_enhanced_features=bool(candidate["numerical_features"]),
+                verified=verified,
+                metadata=metadata,
+            )
         except Exception as exc:  # noqa: BLE001
             errors.append(f"{candidate['model']}: {exc}")
 
-    bundle_metadata = _load_bundle_metadata()
-    model_loaded = False
-    model_error = " | ".join(errors) if errors else "Unknown model loading failure"
-    logger.error("ML model load failed: %s", model_error)
+    raise ModelUnavailableError(" | ".join(errors) if errors else "Unknown model loading failure")
+
+
+def _publish(bundle: ModelBundle) -> ModelBundle:
+    """Make ``bundle`` the one new predictions use; returns it with its version set."""
+    global active_bundle
+    global model_loaded
+    global model_error
+    global bundle_metadata
+    global _bundle_versions
+
+    _bundle_versions += 1
+    bundle = replace(bundle, version=_bundle_versions, loaded_at=time.time())
+    bundle_metadata = bundle.metadata
+    model_error = None
+    # A single reference assignment: readers see either the old bundle or this one.
+    active_bundle = bundle
+    model_loaded = True
+    return bundle
+
+
+def _load_model_bundle() -> None:
+    global active_bundle
+    global model_loaded
+    global model_error
+    global bundle_metadata
+
+    with _reload_lock:
+        metadata = _load_bundle_metadata()
+        try:
+            _publish(_read_model_bundle(MODEL_DIR, metadata))
+        except ModelUnavailableError as exc:
+            bundle_metadata = metadata
+            active_bundle = None
+            model_loaded = False
+            model_error = str(exc)
+            logger.error("ML model load failed: %s", model_error)
+
+
+def _smoke_check(bundle: ModelBundle) -> None:
+    """Score RELOAD_SMOKE_CODES with ``bundle``; raise ModelInferenceError unless every output is sane."""
+    labels = bundle.labels
+    for code in RELOAD_SMOKE_CODES:
+        try:
+            probs = np.asarray(bundle.predict_proba(code), dtype=float)
+            label, confidence = bundle.predict(code)
+        except Exception as exc:  # noqa: BLE001
+            raise ModelInferenceError(f"smoke prediction failed on {code!r}: {exc}") from exc
+        if probs.shape != (len(labels),) or not np.all(np.isfinite(probs)) or not math.isclose(float(probs.sum()), 1.0, abs_tol=1e-6):
+            raise ModelInferenceError(f"smoke prediction on {code!r} returned invalid probabilities")
+        if str(label) not in labels or not 0.0 <= confidence <= 1.0:
+            raise ModelInferenceError(f"smoke prediction on {code!r} returned {label!r} ({confidence})")
+
+
+def reload_model_bundle() -> dict[str, Any]:
+    """Load the bundle in MODEL_DIR again and make it active if it passes a smoke check.
+
+    Predictions already running finish on the bundle they started with. When
+    the new bundle fails to load, verify or predict, the active one is kept
+    and the failure is reported in ``last_reload_error``.
+    """
+    global last_reload_error
+
+    with _reload_lock:
+        metadata = _load_bundle_metadata()
+        try:
+            bundle = _read_model_bundle(MODEL_DIR, metadata)
+            _smoke_check(bundle)
+        except (ModelUnavailableError, ModelInferenceError) as exc:
+            last_reload_error = str(exc)
+            logger.warning("ML model reload rejected, keeping the current bundle: %s", exc)
+            current = active_bundle
+            return {"reloaded": False, "version": current.version if current else None, "error": last_reload_error}
+        bundle = _publish(bundle)
+        last_reload_error = None
+    logger.info("ML model bundle v%d loaded (%s)", bundle.version, bundle.model_format)
+    return {"reloaded": True, "version": bundle.version, "error": None}
+
+
+def _bundle_fingerprint() -> tuple[int, int] | None:
+    # retrain_model writes bundle_metadata.json last, so it changes once per finished bundle.
+    try:
+        stat = os.stat(os.path.join(MODEL_DIR, MODEL_BUNDLE_METADATA_FILENAME))
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def start_model_watcher(interval: float) -> threading.Event:
+    """Reload the bundle whenever bundle_metadata.json changes, checking every ``interval`` seconds.
+
+    Returns the event that stops the watcher (see stop_model_watcher). Only
+    one watcher runs per process; starting another stops the previous one.
+    """
+    global _watcher_stop
+
+    # Event.wait returns at once for NaN or a non-positive timeout, which would spin the thread.
+    if not interval > 0 or math.isinf(interval):
+        raise ValueError(f"model watcher interval must be a positive number of seconds, got {interval!r}")
+    stop_model_watcher()
+    stop = threading.Event()
+    seen = _bundle_fingerprint()
+
+    def watch() -> None:
+        nonlocal seen
+        while not stop.wait(interval):
+            current = _bundle_fingerprint()
+            if current is not None and current != seen:
+                seen = current
+                reload_model_bundle()
+
+    threading.Thread(target=watch, name="model-bundle-watcher", daemon=True).start()
+    _watcher_stop = stop
+    return stop
+
+
+def stop_model_watcher() -> None:
+    global _watcher_stop
+
+    if _watcher_stop is not None:
+        _watcher_stop.set()
+        _watcher_stop = None
 
 
 def _load_bundle_metadata() -> dict[str, Any]:
@@ -112,6 +336,17 @@ def get_model_status() -> dict[str, Any]:
     status: dict[str, Any] = {"loaded": model_loaded, "error": model_error}
     status["bundle_metadata_present"] = bool(bundle_metadata)
     status["bundle_sklearn_version"] = bundle_metadata.get("sklearn_version")
+    bundle = active_bundle
+    status["model_format"] = bundle.model_format if bundle else None
+    status["bundle_verified"] = bundle.verified if bundle else False
+    status["bundle_version"] = bundle.version if bundle else None
+    status["last_reload_error"] = last_reload_error
+    if model_loaded and bundle and bundle.model_format == "compact":
+        # Pure-NumPy inference: the installed scikit-learn (if any) does not matter.
+        status["sklearn_version"] = None
+        status["expected_sklearn_major_minor"] = None
+        status["sklearn_compatible"] = True
+        return status
     try:
         import sklearn
 
@@ -131,20 +366,10 @@ def detect_error_ml(code: str):
     if not model_loaded:
         raise ModelUnavailableError(model_error or "ML model is unavailable")
 
+    bundle = active_bundle
+    if bundle is None:
+        raise ModelUnavailableError(model_error or "ML model is unavailable")
     try:
-        vec = vectorizer.transform([code])
-        if use_enhanced_features:
-            from scipy.sparse import hstack
-
-            numerical = extract_numerical_features(code)
-            numerical_array = np.array(numerical).reshape(1, -1)
-            vec = hstack([vec, numerical_array])
-
-        probs = model.predict_proba(vec)[0]
-        max_prob = float(np.max(probs))
-        pred_index = int(np.argmax(probs))
-        pred_label = label_encoder.inverse_transform([pred_index])[0]
-        return pred_label, max_prob
+        return bundle.predict(code)
     except Exception as exc:  # noqa: BLE001
         raise ModelInferenceError(str(exc)) from exc
-
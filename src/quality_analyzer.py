@@ -3,8 +3,28 @@ Code Quality Analyzer Module
 Provides metrics and suggestions for code improvement beyond syntax errors
 """
 
+import ast
 import re
-from typing import Dict, List
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+# Decision points for the simplified cyclomatic complexity, as one alternation
+# so the cleaned code is scanned once instead of once per keyword.
+_DECISION_POINT = re.compile(r"\b(?:if|elif|else|for|while|case|catch|except)\b|&&|\|\|")
+_DOUBLE_QUOTED = re.compile(r'"[^"\n]*"')
+_SINGLE_QUOTED = re.compile(r"'[^'\n]*'")
+_HASH_COMMENT = re.compile(r'#[^\n]*')
+_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_LINE_COMMENT = re.compile(r'//[^\n]*')
+_C_STYLE_LANGUAGES = ("java", "c", "c++")
+_COMMENT_PREFIXES = {"python": ("#",), "java": ("//", "/*", "*"), "c": ("//", "/*", "*"), "c++": ("//", "/*", "*")}
+# Function/method headers and the group holding the name; shared by the naming
+# check and the long-function spans.
+_DEFINITIONS = {
+    "python": (re.compile(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('), 1),
+    "java": (re.compile(r'(public|private|protected)?\s+\w+\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('), 2),
+}
 
 
 class CodeQualityAnalyzer:
@@ -14,44 +34,60 @@ class CodeQualityAnalyzer:
     - Naming conventions
     - Code length
     - Comment density
+
+    Each underlying scan (line classes, cleaned code, definition headers) runs
+    at most once per analyzer; the public metric methods share the results.
     """
 
-    def __init__(self, code: str, language: str):
+    def __init__(self, code: str, language: str, tree: Optional[ast.Module] = None):
+        """``tree`` is an already-parsed module for Python ``code``, so callers
+        that have parsed it (the static pipeline) do not pay for a second parse."""
         self.code = code
+        self._tree = tree
         self.language = language.lower()  # Normalize: "Python" → "python", "C++" → "c++"
         self.lines = code.split('\n')
         self.metrics = {}
+        self._newline_offsets: Optional[List[int]] = None
+        self._line_stats: Optional[Tuple[Dict[str, int], float]] = None
+        self._definitions: Optional[List[Tuple[str, int]]] = None
+
+    def _scan_lines(self) -> Tuple[Dict[str, int], float]:
+        """Line classes and average non-blank line length from one pass over the lines."""
+        if self._line_stats is None:
+            prefixes = _COMMENT_PREFIXES.get(self.language, ())
+            code_lines = 0
+            comment_lines = 0
+            blank_lines = 0
+            non_blank_chars = 0
+
+            for line in self.lines:
+                stripped = line.strip()
+                if not stripped:
+                    blank_lines += 1
+                    continue
+                non_blank_chars += len(line)
+                if stripped.startswith(prefixes):
+                    comment_lines += 1
+                else:
+                    code_lines += 1
+
+            line_counts = {
+                'total': len(self.lines),
+                'code': code_lines,
+                'comments': comment_lines,
+                'blank': blank_lines
+            }
+            non_blank = code_lines + comment_lines
+            self._line_stats = (line_counts, non_blank_chars / non_blank if non_blank else 0)
+        return self._line_stats
 
     def count_lines(self) -> Dict[str, int]:
         """Count total, code, and comment lines"""
-        total_lines = len(self.lines)
-        code_lines = 0
-        comment_lines = 0
-        blank_lines = 0
-
-        for line in self.lines:
-            stripped = line.strip()
-            if not stripped:
-                blank_lines += 1
-            elif self._is_comment(stripped):
-                comment_lines += 1
-            else:
-                code_lines += 1
-
-        return {
-            'total': total_lines,
-            'code': code_lines,
-            'comments': comment_lines,
-            'blank': blank_lines
-        }
+        return dict(self._scan_lines()[0])
 
     def _is_comment(self, line: str) -> bool:
         """Check if line is a comment"""
-        if self.language == "python":
-            return line.startswith('#')
-        elif self.language in ["java", "c", "c++"]:
-            return line.startswith('//') or line.startswith('/*') or line.startswith('*')
-        return False
+        return line.startswith(_COMMENT_PREFIXES.get(self.language, ()))
 
     def _strip_strings_and_comments(self, code: str) -> str:
         """
@@ -59,17 +95,17 @@ class CodeQualityAnalyzer:
         This prevents words inside strings/comments from inflating complexity.
         """
         # Remove single-line strings (both quote types), non-greedy
-        code = re.sub(r'"[^"\n]*"', '""', code)
-        code = re.sub(r"'[^'\n]*'", "''", code)
+        code = _DOUBLE_QUOTED.sub('""', code)
+        code = _SINGLE_QUOTED.sub("''", code)
 
         if self.language == "python":
             # Remove Python single-line comments
-            code = re.sub(r'#[^\n]*', '', code)
-        elif self.language in ["java", "c", "c++"]:
+            code = _HASH_COMMENT.sub('', code)
+        elif self.language in _C_STYLE_LANGUAGES:
             # Remove C-style block comments
-            code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
+            code = _BLOCK_COMMENT.sub('', code)
             # Remove C-style single-line comments
-            code = re.sub(r'//[^\n]*', '', code)
+            code = _LINE_COMMENT.sub('', code)
 
         return code
 
@@ -79,29 +115,18 @@ class CodeQualityAnalyzer:
         Counts decision points: if, for, while, case, catch, etc.
         Strings and comments are stripped first to avoid false matches.
         """
-        complexity = 1  # Base complexity
-
-        # Strip strings and comments before scanning for keywords
+        # Base complexity of 1 plus every decision point outside strings/comments
         clean_code = self._strip_strings_and_comments(self.code)
+        return 1 + sum(1 for _ in _DECISION_POINT.finditer(clean_code))
 
-        keyword_patterns = [
-            r"\bif\b",
-            r"\belif\b",
-            r"\belse\b",
-            r"\bfor\b",
-            r"\bwhile\b",
-            r"\bcase\b",
-            r"\bcatch\b",
-            r"\bexcept\b",
-            r"&&",
-            r"\|\|",
-        ]
-
-        for pattern in keyword_patterns:
-            matches = re.findall(pattern, clean_code)
-            complexity += len(matches)
-
-        return complexity
+    def _definition_headers(self) -> List[Tuple[str, int]]:
+        """(name, offset) of every function/method header the language's pattern finds."""
+        if self._definitions is None:
+            pattern, group = _DEFINITIONS.get(self.language, (None, 0))
+            self._definitions = [] if pattern is None else [
+                (match.group(group), match.start()) for match in pattern.finditer(self.code)
+            ]
+        return self._definitions
 
     def check_naming_conventions(self) -> Dict[str, List[str]]:
         """
@@ -115,17 +140,13 @@ class CodeQualityAnalyzer:
 
         if self.language == "python":
             # Find function/variable names
-            func_pattern = r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-            functions = re.findall(func_pattern, self.code)
-            for func in functions:
+            for func, _ in self._definition_headers():
                 if not func.islower() and '_' not in func:
                     issues['snake_case_violations'].append(func)
 
         elif self.language == "java":
             # Check camelCase for methods
-            method_pattern = r'(public|private|protected)?\s+\w+\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-            methods = re.findall(method_pattern, self.code)
-            for _, method in methods:
+            for method, _ in self._definition_headers():
                 if method[0].isupper():
                     issues['camel_case_violations'].append(method)
 
@@ -133,31 +154,57 @@ class CodeQualityAnalyzer:
 
     def calculate_avg_line_length(self) -> float:
         """Calculate average line length"""
-        non_blank = [line for line in self.lines if line.strip()]
-        if not non_blank:
-            return 0
-        return sum(len(line) for line in non_blank) / len(non_blank)
+        return self._scan_lines()[1]
+
+    def _line_of(self, offset: int) -> int:
+        """0-based line of a character offset (same as ``code[:offset].count('\\n')``)."""
+        if self._newline_offsets is None:
+            self._newline_offsets = [match.start() for match in re.finditer('\n', self.code)]
+        return bisect_left(self._newline_offsets, offset)
+
+    def _python_function_lengths(self) -> Optional[List[Tuple[str, int]]]:
+        """(name, line count) for every def in source order, or None if the code does not parse."""
+        tree = self._tree
+        if tree is None:
+            try:
+                tree = ast.parse(self.code)
+            except (SyntaxError, ValueError, RecursionError):
+                return None
+        # Definitions are statements, so only statement lists need visiting, not every expression.
+        functions = []
+        pending = [tree]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions.append(node)
+            for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+                pending.extend(child for child in getattr(node, field, ()) if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)))
+        functions.sort(key=lambda node: (node.lineno, node.col_offset))
+        return [(node.name, node.end_lineno - node.lineno + 1) for node in functions]
 
     def check_long_functions(self, max_lines: int = 50) -> List[str]:
         """Identify functions longer than max_lines"""
         long_functions = []
+        if len(self.lines) <= max_lines:
+            return long_functions
 
         if self.language == "python":
-            pattern = r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-        elif self.language == "java":
-            pattern = r'(public|private|protected)?\s+\w+\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-        else:
+            # Real extents from the AST; the regex heuristic below is only for code that does not parse.
+            lengths = self._python_function_lengths()
+            if lengths is not None:
+                return [f"{name} ({length} lines)" for name, length in lengths if length > max_lines]
+        elif self.language != "java":
             return long_functions
 
         # Simple heuristic: count lines between function definitions
-        func_matches = list(re.finditer(pattern, self.code))
+        headers = self._definition_headers()
+        start_lines = [self._line_of(offset) for _, offset in headers]
 
-        for i, match in enumerate(func_matches):
-            func_name = match.group(1) if self.language == "python" else match.group(2)
-            start_line = self.code[:match.start()].count('\n')
+        for i, (func_name, _) in enumerate(headers):
+            start_line = start_lines[i]
 
-            if i + 1 < len(func_matches):
-                end_line = self.code[:func_matches[i + 1].start()].count('\n')
+            if i + 1 < len(headers):
+                end_line = start_lines[i + 1]
             else:
                 end_line = len(self.lines)
 
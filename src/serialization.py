@@ -0,0 +1,36 @@
+"""JSON encoding for analysis results.
+
+Uses ``orjson`` (a declared requirement) and falls back to the standard
+library when it is missing, so callers always get compact UTF-8 bytes they
+can hand straight to a response. Both branches produce the same JSON:
+non-string keys become strings and NumPy scalars/arrays become plain numbers
+and lists, which is what ``json`` does for int keys and orjson does not do
+without options.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # keep working without the compiled wheel
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+
+def _default(value: Any) -> Any:
+    # NumPy scalars and arrays, encoded as orjson's OPT_SERIALIZE_NUMPY does.
+    tolist = getattr(value, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=_ORJSON_OPTIONS, default=_default)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
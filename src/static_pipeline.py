@@ -7,13 +7,21 @@ import builtins
 import importlib.util
 import re
 import sys
+import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, partial
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
+from .auto_fix import AutoFixer
 from .language_detector import detect_language
 from .ml_engine import get_model_status, is_model_available
+from .serialization import dumps_json
+from .quality_analyzer import CodeQualityAnalyzer
 from .syntax_checker import detect_all
 from .tutor_explainer import explain_error
 
@@ -32,13 +40,19 @@ class ResolveState(str, Enum):
     AMBIGUOUS = "Ambiguous"
 
 
-@dataclass(frozen=True)
+# The IR and issue records below are slotted: large files produce tens of
+# thousands of them per analysis, and batch runs produce them per snippet.
+@dataclass(frozen=True, slots=True)
 class ValueFact:
     state: ValueState
     constant: Any = None
 
 
-@dataclass
+UNKNOWN_VALUE = ValueFact(ValueState.UNKNOWN)
+NONZERO_VALUE = ValueFact(ValueState.NONZERO)
+
+
+@dataclass(slots=True)
 class IRStatement:
     kind: str
     language: str
@@ -52,52 +66,243 @@ class IRStatement:
     symbol: str | None = None
     jump_kind: str | None = None
     scope_depth: int = 0
-    metadata: dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass
+    # Index into IRProgram.nodes for statements backed by a Python ast node.
+    node: int | None = None
+    block_id: int | None = None
+    params: str | None = None
+    init: str | None = None
+    declaration: bool = False
+    final: bool = False
+    operator: str | None = None
+    issue: str | None = None
+
+
+# Same boundaries as str.splitlines(), so line numbers agree with every other
+# line-oriented pass in the engine.
+_LINE_BREAK = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_WORD = re.compile(r"\w+")
+# The Python tokenizer only breaks on \r\n, \r and \n; ast column offsets are
+# relative to these lines (mirrors ast._splitlines_no_ff).
+_SOURCE_LINE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+")
+
+
+class LineIndex:
+    """Line start offsets for one source text, built lazily and shared by every
+    snippet and line lookup of a single analysis."""
+
+    __slots__ = ("code", "_starts", "_ends", "_lines", "_stripped", "_first_word_line", "_source_lines")
+
+    def __init__(self, code: str) -> None:
+        self.code = code
+        self._starts: list[int] | None = None
+        self._ends: list[int] = []
+        self._lines: list[str] | None = None
+        self._stripped: dict[int, str] = {}
+        self._first_word_line: dict[str, int] | None = None
+        self._source_lines: list[bytes] | None = None
+
+    @property
+    def starts(self) -> list[int]:
+        if self._starts is None:
+            starts = [0]
+            ends: list[int] = []
+            for match in _LINE_BREAK.finditer(self.code):
+                ends.append(match.start())
+                starts.append(match.end())
+            ends.append(len(self.code))
+            if starts[-1] == len(self.code):
+                # splitlines() does not report an empty line after a final break.
+                starts.pop()
+                ends.pop()
+            self._starts = starts
+            self._ends = ends
+        return self._starts
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def lines(self) -> list[str]:
+        if self._lines is None:
+            starts = self.starts
+            self._lines = [self.code[start:end] for start, end in zip(starts, self._ends)]
+        return self._lines
+
+    def line(self, line: int | None) -> str:
+        starts = self.starts
+        if not line or not 1 <= line <= len(starts):
+            return ""
+        if self._lines is not None:
+            return self._lines[line - 1]
+        return self.code[starts[line - 1]:self._ends[line - 1]]
+
+    def stripped(self, line: int | None) -> str:
+        if not line:
+            return ""
+        cached = self._stripped.get(line)
+        if cached is None:
+            cached = self._stripped[line] = self.line(line).strip()
+        return cached
+
+    def line_of(self, offset: int) -> int:
+        return max(1, bisect_right(self.starts, offset))
+
+    def first_line_of(self, name: str) -> int:
+        """First line where ``name`` occurs as a whole word, 1 when absent."""
+        if self._first_word_line is None:
+            first: dict[str, int] = {}
+            for match in _WORD.finditer(self.code):
+                word = match.group(0)
+                if word not in first:
+                    first[word] = self.line_of(match.start())
+            self._first_word_line = first
+        return self._first_word_line.get(name, 1)
+
+    def segment(self, node: ast.AST | None) -> str | None:
+        """Equivalent of ``ast.get_source_segment`` without re-splitting the source."""
+        if node is None:
+            return None
+        try:
+            if node.end_lineno is None or node.end_col_offset is None:  # type: ignore[attr-defined]
+                return None
+            lineno = node.lineno - 1  # type: ignore[attr-defined]
+            end_lineno = node.end_lineno - 1  # type: ignore[attr-defined]
+            col_offset = node.col_offset  # type: ignore[attr-defined]
+            end_col_offset = node.end_col_offset  # type: ignore[attr-defined]
+        except AttributeError:
+            return None
+        if self._source_lines is None:
+            self._source_lines = [match.group(0).encode() for match in _SOURCE_LINE.finditer(self.code)]
+        lines = self._source_lines
+        if end_lineno == lineno:
+            return lines[lineno][col_offset:end_col_offset].decode()
+        parts = [lines[lineno][col_offset:].decode()]
+        parts.extend(line.decode() for line in lines[lineno + 1:end_lineno])
+        parts.append(lines[end_lineno][:end_col_offset].decode())
+        return "".join(parts)
+
+
+@dataclass(slots=True)
 class IRProgram:
     language: str
     code: str
     filename: str | None
     statements: list[IRStatement] = field(default_factory=list)
     syntax_issues: list[dict[str, Any]] = field(default_factory=list)
+    # Python only: the module tree parsed once by Parser, walked once, and
+    # shared by every later pass. ``nodes`` is the ast.walk order (statements
+    # reference it by index); ``node_types`` buckets the same nodes by type.
+    tree: ast.Module | None = field(default=None, repr=False, compare=False)
+    nodes: list[ast.AST] = field(default_factory=list, repr=False, compare=False)
+    node_types: dict[type, list[ast.AST]] = field(default_factory=dict, repr=False, compare=False)
+    line_index: LineIndex = field(init=False, repr=False, compare=False)
+    _comment_free: str | None = field(default=None, init=False, repr=False, compare=False)
+    _identifiers: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.line_index = LineIndex(self.code)
+
+    @property
+    def comment_free(self) -> str:
+        """``code`` with comments blanked out, stripped once and shared by every pass."""
+        if self._comment_free is None:
+            self._comment_free = _strip_comments(self.code)
+        return self._comment_free
+
+    @property
+    def identifiers(self) -> list[str]:
+        """Identifier uses outside comments, strings and member access (read-only)."""
+        if self._identifiers is None:
+            self._identifiers = _identifiers(self.comment_free)
+        return self._identifiers
+
+    def index_tree(self, tree: ast.Module, limit: int | None = None, clock: _BudgetClock | None = None) -> list[ast.AST]:
+        """Walk and index ``tree``; with ``limit``, stop after ``limit + 1`` nodes (an over-budget marker).
+
+        With ``clock``, the walk also stops (leaving a partial index) once its time budget is spent.
+        """
+        self.tree = tree
+        walk = ast.walk(tree)
+        if limit is not None:
+            walk = islice(walk, limit + 1)
+        if clock is None:
+            self.nodes = list(walk)
+        else:
+            self.nodes = []
+            for batch in iter(lambda: list(islice(walk, _CLOCK_CHECK_INTERVAL)), []):
+                self.nodes.extend(batch)
+                if clock.exhausted("Parsing"):
+                    break
+        self.node_types = {}
+        for node in self.nodes:
+            self.node_types.setdefault(type(node), []).append(node)
+        return self.nodes
 
+    def nodes_of(self, node_type: type) -> list[ast.AST]:
+        """Nodes of exactly ``node_type``, in ast.walk order."""
+        return self.node_types.get(node_type, [])
 
-@dataclass
+    def release_tree(self) -> None:
+        self.tree = None
+        self.nodes = []
+        self.node_types = {}
+
+    def node_of(self, stmt: IRStatement) -> ast.AST | None:
+        return self.nodes[stmt.node] if stmt.node is not None else None
+
+
+@dataclass(slots=True)
 class Symbol:
     name: str
     kind: str
     line: int
     type_name: str | None = None
-    value: ValueFact = field(default_factory=lambda: ValueFact(ValueState.UNKNOWN))
+    value: ValueFact = UNKNOWN_VALUE
     imported_from: str | None = None
 
 
 @dataclass
 class SymbolTable:
+    """Per-analysis user scope layered over a shared, read-only builtin scope.
+
+    ``symbols`` holds only what the analysed code declares; lookups fall
+    through to ``builtins`` (see ``BUILTIN_SCOPES``), which is never copied.
+    """
+
     language: str
     symbols: dict[str, Symbol] = field(default_factory=dict)
     imports: set[str] = field(default_factory=set)
     includes: set[str] = field(default_factory=set)
+    builtins: Mapping[str, Symbol] = field(default_factory=lambda: EMPTY_SCOPE, repr=False)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.symbols or name in self.builtins
+
+    def lookup(self, name: str) -> Symbol | None:
+        symbol = self.symbols.get(name)
+        return symbol if symbol is not None else self.builtins.get(name)
 
     def declare(self, symbol: Symbol) -> bool:
-        existed = symbol.name in self.symbols and symbol.kind in {"function", "class"}
+        existed = symbol.kind in {"function", "class"} and symbol.name in self
         self.symbols[symbol.name] = symbol
         return not existed
 
     def value_of(self, name: str) -> ValueFact:
-        return self.symbols.get(name, Symbol(name, "unknown", 0)).value
+        symbol = self.lookup(name)
+        return symbol.value if symbol is not None else UNKNOWN_VALUE
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     kind: str
     strength: float
     ambiguity: float = 0.0
 
+    def as_dict(self) -> dict[str, Any]:
+        return {"kind": self.kind, "strength": self.strength, "ambiguity": self.ambiguity}
 
-@dataclass
+
+@dataclass(slots=True)
 class AnalysisIssue:
     type: str
     message: str
@@ -117,7 +322,7 @@ class AnalysisIssue:
             "snippet": self.snippet,
             "suggestion": self.suggestion,
             "confidence": self.confidence,
-            "evidence": [e.__dict__ for e in self.evidence],
+            "evidence": [e.as_dict() for e in self.evidence],
         }
 
 
@@ -131,9 +336,17 @@ class DetectionAnalysis:
     degraded_mode: bool
     warnings: list[str]
     pipeline: list[str]
+    # Set when an AnalysisBudget stopped the pipeline early: which stage, which
+    # limit and its value. ``issues`` then holds what was found up to that point.
+    truncated: dict[str, Any] | None = None
+
+    @cached_property
+    def issue_dicts(self) -> list[dict[str, Any]]:
+        """Serialized issues, built once and shared by every result view."""
+        return [issue.as_dict() for issue in self.issues]
 
     def to_single_result(self) -> dict[str, Any]:
-        issues = [issue.as_dict() for issue in self.issues]
+        issues = self.issue_dicts
         if self.primary:
             predicted = self.primary.type
             confidence = self.primary.confidence
@@ -141,10 +354,7 @@ class DetectionAnalysis:
         else:
             predicted = "NoError"
             confidence = ConfidenceCalibrator().no_error(self.program)
-            tutor = {
-                "why": "No semantic or structural issue was detected.",
-                "fix": "No direct fix is required.",
-            }
+            tutor = dict(NO_ERROR_TUTOR)
         return {
             "language": self.language,
             "predicted_error": predicted,
@@ -155,32 +365,25 @@ class DetectionAnalysis:
             "errors": issues,
             "degraded_mode": self.degraded_mode,
             "warnings": self.warnings,
+            "truncated": self.truncated,
             "analysis_pipeline": self.pipeline,
-            "confidence_model": {
-                "kind": "evidence_calibrated",
-                "constant_output": False,
-                "value_states": [state.value for state in ValueState],
-            },
+            "confidence_model": _confidence_model(),
         }
 
     def to_grouped_result(self) -> dict[str, Any]:
-        single = self.to_single_result()
+        issues = self.issue_dicts
         grouped: dict[str, dict[str, Any]] = {}
-        for issue in single.get("errors", []):
+        by_type: dict[str, list[dict[str, Any]]] = {}
+        for issue in issues:
             kind = issue["type"]
-            grouped.setdefault(
-                kind,
-                {
-                    "type": kind,
-                    "count": 0,
-                    "locations": [],
-                    "confidence": issue.get("confidence", 0.0),
-                    "tutor": explain_error(kind),
-                },
-            )
-            grouped[kind]["count"] += 1
-            grouped[kind]["confidence"] = max(grouped[kind]["confidence"], issue.get("confidence", 0.0))
-            grouped[kind]["locations"].append(
+            confidence = issue.get("confidence", 0.0)
+            entry = grouped.get(kind)
+            if entry is None:
+                entry = grouped[kind] = {"type": kind, "count": 0, "locations": [], "confidence": confidence, "tutor": explain_error(kind)}
+                by_type[kind] = []
+            entry["count"] += 1
+            entry["confidence"] = max(entry["confidence"], confidence)
+            entry["locations"].append(
                 {
                     "line": issue.get("line"),
                     "col": issue.get("col"),
@@ -190,31 +393,41 @@ class DetectionAnalysis:
                     "confidence": issue.get("confidence"),
                 }
             )
+            by_type[kind].append({"line": issue.get("line"), "message": issue.get("message"), "snippet": issue.get("snippet")})
         errors = list(grouped.values())
         return {
-            "language": single["language"],
+            "language": self.language,
             "errors": errors,
-            "primary_error": single.get("primary_error"),
-            "errors_by_type": {
-                err["type"]: [
-                    {
-                        "line": loc.get("line", 0),
-                        "message": loc.get("message", f"{err['type']} detected"),
-                        "snippet": loc.get("snippet", ""),
-                    }
-                    for loc in err.get("locations", [])
-                ]
-                for err in errors
-            },
-            "total_errors": sum(err["count"] for err in errors),
+            "primary_error": issues[0] if issues else None,
+            "errors_by_type": by_type,
+            "total_errors": len(issues),
             "has_errors": bool(errors),
-            "rule_based_issues": single.get("errors", []),
-            "degraded_mode": single.get("degraded_mode", False),
-            "warnings": single.get("warnings", []),
-            "analysis_pipeline": single.get("analysis_pipeline", []),
-            "confidence_model": single.get("confidence_model", {}),
+            "rule_based_issues": issues,
+            "degraded_mode": self.degraded_mode,
+            "warnings": self.warnings,
+            "truncated": self.truncated,
+            "analysis_pipeline": self.pipeline,
+            "confidence_model": _confidence_model(),
         }
 
+    def to_json(self, grouped: bool = False) -> bytes:
+        """Encode the single (or grouped) result as UTF-8 JSON, via orjson when available."""
+        return dumps_json(self.to_grouped_result() if grouped else self.to_single_result())
+
+
+NO_ERROR_TUTOR = {
+    "why": "No semantic or structural issue was detected.",
+    "fix": "No direct fix is required.",
+}
+
+
+def _confidence_model() -> dict[str, Any]:
+    return {
+        "kind": "evidence_calibrated",
+        "constant_output": False,
+        "value_states": [state.value for state in ValueState],
+    }
+
 
 PRIORITY = [
     "UnclosedString",
@@ -275,6 +488,19 @@ C_SYMBOLS = {
 }
 CPP_SYMBOLS = {**C_SYMBOLS, "cout": "iostream", "cin": "iostream", "cerr": "iostream", "endl": "iostream", "vector": "vector", "size_t": "vector"}
 JS_GLOBALS = {"console", "Math", "Number", "String", "Boolean", "Array", "Object", "JSON", "Promise", "Error", "undefined", "NaN", "Infinity"}
+
+
+def _builtin_scope(names: set[str], value: ValueFact) -> Mapping[str, Symbol]:
+    return MappingProxyType({name: Symbol(name, "builtin", 0, value=value) for name in sorted(names)})
+
+
+# Built once at import and shared by every SymbolTable of that language; the
+# Symbol objects in here must be treated as read-only.
+EMPTY_SCOPE: Mapping[str, Symbol] = MappingProxyType({})
+BUILTIN_SCOPES: dict[str, Mapping[str, Symbol]] = {
+    "Python": _builtin_scope(PY_BUILTINS, NONZERO_VALUE),
+    "JavaScript": _builtin_scope(JS_GLOBALS, UNKNOWN_VALUE),
+}
 KEYWORDS = {
     "if", "else", "for", "while", "switch", "case", "do", "break", "continue",
     "return", "throw", "try", "catch", "finally", "new", "class", "public",
@@ -294,21 +520,8 @@ def _norm_type(kind: str | None) -> str:
     return kind or "SyntaxError"
 
 
-def _snippet(code: str, line: int | None) -> str:
-    lines = code.splitlines()
-    if line and 1 <= line <= len(lines):
-        return lines[line - 1].strip()
-    return ""
-
-
-def _safe_source_segment(code: str, node: ast.AST | None) -> str | None:
-    if node is None:
-        return None
-    return ast.get_source_segment(code, node)
-
-
 def _issue(program: IRProgram, kind: str, msg: str, line: int | None, strength: float, *, col: int | None = 1, suggestion: str | None = None, ambiguity: float = 0.0, evidence: str = "semantic") -> AnalysisIssue:
-    return AnalysisIssue(_norm_type(kind), msg, line, col, _snippet(program.code, line), suggestion, [Evidence(evidence, strength, ambiguity)])
+    return AnalysisIssue(_norm_type(kind), msg, line, col, program.line_index.stripped(line), suggestion, [Evidence(evidence, strength, ambiguity)])
 
 
 def _strip_comments(code: str) -> str:
@@ -520,9 +733,9 @@ def _javascript_marked_semicolon_issues(code: str) -> list[dict[str, Any]]:
     return issues
 
 
-def _c_like_semicolon_issues(code: str, *, skip_line: int | None = None) -> list[dict[str, Any]]:
+def _c_like_semicolon_issues(clean: str, *, skip_line: int | None = None) -> list[dict[str, Any]]:
+    """Statement lines missing their delimiter; ``clean`` is the comment-free code."""
     issues: list[dict[str, Any]] = []
-    clean = _strip_comments(code)
     for line_no, line in enumerate(clean.splitlines(), 1):
         if skip_line is not None and line_no == skip_line:
             continue
@@ -559,10 +772,10 @@ def _annotation(node: ast.AST | None) -> str | None:
 
 
 class Parser:
-    def parse(self, code: str, language: str, filename: str | None = None) -> IRProgram:
-        return self._python(code, filename) if language == "Python" else self._c_like(code, language, filename)
+    def parse(self, code: str, language: str, filename: str | None = None, clock: _BudgetClock | None = None) -> IRProgram:
+        return self._python(code, filename, clock) if language == "Python" else self._c_like(code, language, filename, clock)
 
-    def _python(self, code: str, filename: str | None) -> IRProgram:
+    def _python(self, code: str, filename: str | None, clock: _BudgetClock | None = None) -> IRProgram:
         program = IRProgram("Python", code, filename)
         try:
             tree = ast.parse(code)
@@ -586,13 +799,20 @@ class Parser:
                     "col": getattr(exc, "offset", 1) or 1,
                     "suggestion": "Add or remove the matching bracket.",
                 })
-            for raw in detect_all(code):
+            for raw in detect_all(code, exc):
                 program.syntax_issues.append({"type": _norm_type(raw.get("type")), "message": raw.get("message"), "line": raw.get("line"), "col": raw.get("col") or 1, "suggestion": raw.get("suggestion")})
             for raw in _python_lexical_missing_imports(code):
                 program.syntax_issues.append(raw)
             return program
-        for node in ast.walk(tree):
-            raw = ast.get_source_segment(code, node) or ""
+        nodes = program.index_tree(tree, clock.budget.max_nodes if clock is not None else None, clock)
+        # Oversized trees skip building statements, the costliest part of parsing after ast.parse itself.
+        if clock is not None and not clock.admits(program, "Parsing"):
+            return program
+        segment = program.line_index.segment
+        for index, node in enumerate(nodes):
+            if clock is not None and index % _CLOCK_CHECK_INTERVAL == 0 and clock.exhausted("Parsing"):
+                break
+            raw = segment(node) or ""
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     program.statements.append(IRStatement("import", "Python", raw, node.lineno, name=alias.asname or alias.name.split(".")[0], module=alias.name))
@@ -600,26 +820,27 @@ class Parser:
                 for alias in node.names:
                     program.statements.append(IRStatement("import", "Python", raw, node.lineno, name=alias.asname or alias.name, module=node.module or "", symbol=alias.name))
             elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                program.statements.append(IRStatement("definition", "Python", raw, node.lineno, name=node.name, target_type="function", metadata={"node": node}))
+                program.statements.append(IRStatement("definition", "Python", raw, node.lineno, name=node.name, target_type="function", node=index))
             elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
                 target = node.targets[0] if isinstance(node, ast.Assign) and node.targets else getattr(node, "target", None)
                 value = getattr(node, "value", None)
-                expr = _safe_source_segment(code, value if isinstance(value, ast.AST) else None)
-                program.statements.append(IRStatement("assignment", "Python", raw, node.lineno, name=_target_name(target) if target else None, target_type=_annotation(getattr(node, "annotation", None)), expression=expr, metadata={"node": node}))
+                expr = segment(value if isinstance(value, ast.AST) else None)
+                program.statements.append(IRStatement("assignment", "Python", raw, node.lineno, name=_target_name(target) if target else None, target_type=_annotation(getattr(node, "annotation", None)), expression=expr))
             elif isinstance(node, ast.While):
-                program.statements.append(IRStatement("loop", "Python", raw, node.lineno, condition=ast.get_source_segment(code, node.test) or "", metadata={"node": node}))
+                program.statements.append(IRStatement("loop", "Python", raw, node.lineno, condition=segment(node.test) or ""))
             elif isinstance(node, ast.For):
-                cond = f"{ast.get_source_segment(code, node.iter) or 'iter'}"
-                program.statements.append(IRStatement("loop", "Python", raw, node.lineno, condition=cond, metadata={"node": node}))
+                cond = f"{segment(node.iter) or 'iter'}"
+                program.statements.append(IRStatement("loop", "Python", raw, node.lineno, condition=cond))
             elif isinstance(node, (ast.Return, ast.Raise, ast.Break, ast.Continue)):
                 jump_value = getattr(node, "value", None)
-                jump_expr = _safe_source_segment(code, jump_value if isinstance(jump_value, ast.AST) else None)
-                program.statements.append(IRStatement("jump", "Python", raw, node.lineno, expression=jump_expr, jump_kind=node.__class__.__name__.lower(), metadata={"node": node}))
+                jump_expr = segment(jump_value if isinstance(jump_value, ast.AST) else None)
+                program.statements.append(IRStatement("jump", "Python", raw, node.lineno, expression=jump_expr, jump_kind=node.__class__.__name__.lower()))
         program.statements.sort(key=lambda s: (s.line, s.kind))
         return program
 
-    def _c_like(self, code: str, language: str, filename: str | None) -> IRProgram:
+    def _c_like(self, code: str, language: str, filename: str | None, clock: _BudgetClock | None = None) -> IRProgram:
         program = IRProgram(language, code, filename)
+        # Unclosed strings and brackets are always reported; later scans stop once the budget is spent.
         start = _string_start(code)
         if start:
             program.syntax_issues.append({"type": "UnclosedString", "message": "String literal is not closed.", "line": start[0], "col": start[1], "suggestion": "Add the missing closing quote."})
@@ -627,17 +848,19 @@ class Parser:
             if start and raw["line"] <= start[0]:
                 continue
             program.syntax_issues.append({"type": "UnmatchedBracket", "message": "Bracket structure is not balanced.", "line": raw["line"], "col": raw["col"], "suggestion": "Add or remove the matching bracket."})
+        if clock is not None and clock.exhausted("Parsing"):
+            return program
         for raw in _adjacent_literal_delimiter_issues(code):
             program.syntax_issues.append(raw)
         if language == "JavaScript":
             for raw in _javascript_marked_semicolon_issues(code):
                 program.syntax_issues.append(raw)
         if language in {"C", "C++", "Java"}:
-            for raw in _c_like_semicolon_issues(code, skip_line=start[0] if start else None):
+            for raw in _c_like_semicolon_issues(program.comment_free, skip_line=start[0] if start else None):
                 program.syntax_issues.append(raw)
-        if start:
+        if start or (clock is not None and clock.exhausted("Parsing")):
             return program
-        clean = _strip_comments(code)
+        clean = program.comment_free
         for lineno, line in enumerate(clean.splitlines(), 1):
             match = re.search(r"#include\s*[<\"]([^>\"]+)[>\"]", line)
             if match:
@@ -657,15 +880,18 @@ class Parser:
                     raw_line = raw_line.rstrip() + ";"
                 normalized_lines.append(raw_line)
             clean = "\n".join(normalized_lines)
-        for raw, line, depth, closed, block_id in self._split(clean):
+        for index, (raw, line, depth, closed, block_id) in enumerate(self._split(clean, clock)):
+            if clock is not None and index % _CLOCK_CHECK_INTERVAL == 0 and clock.exhausted("Parsing"):
+                break
             stmt = self._classify(raw, line, depth, closed, language)
             if stmt:
-                stmt.metadata.setdefault("block_id", block_id)
+                if stmt.block_id is None:
+                    stmt.block_id = block_id
                 program.statements.append(stmt)
         program.statements.sort(key=lambda s: (s.line, s.scope_depth))
         return program
 
-    def _split(self, code: str) -> list[tuple[str, int, int, str, int]]:
+    def _split(self, code: str, clock: _BudgetClock | None = None) -> list[tuple[str, int, int, str, int]]:
         out: list[tuple[str, int, int, str, int]] = []
         buf: list[str] = []
         line = 1
@@ -690,6 +916,8 @@ class Parser:
         for ch in code:
             if ch == "\n":
                 line += 1
+                if clock is not None and line % _CLOCK_CHECK_INTERVAL == 0 and clock.exhausted("Parsing"):
+                    break
             if not buf and ch.isspace():
                 continue
             if not buf and not ch.isspace():
@@ -748,23 +976,23 @@ class Parser:
             name = compact.split()[-1]
             return IRStatement("definition", language, raw, line, name=name, target_type="class", scope_depth=depth)
         if language == "JavaScript" and re.match(r"^(?:let|const|var)\s+[A-Za-z_]\w*\s*=$", compact):
-            return IRStatement("syntax", language, raw, line, scope_depth=depth, metadata={"issue": "MissingDelimiter"})
+            return IRStatement("syntax", language, raw, line, scope_depth=depth, issue="MissingDelimiter")
         if language == "JavaScript" and ".." in compact:
-            return IRStatement("syntax", language, raw, line, scope_depth=depth, metadata={"issue": "MissingDelimiter"})
+            return IRStatement("syntax", language, raw, line, scope_depth=depth, issue="MissingDelimiter")
         loop = re.search(r"\bwhile\s*\((.*)\)\s*$", compact)
         if loop:
             return IRStatement("loop", language, raw, line, condition=loop.group(1), scope_depth=depth)
         loop = re.search(r"\bfor\s*\((.*)\)\s*$", compact)
         if loop:
             parts = [p.strip() for p in loop.group(1).split(";")]
-            return IRStatement("loop", language, raw, line, condition=(parts[1] if len(parts) > 1 and parts[1] else "true"), scope_depth=depth, metadata={"init": parts[0] if parts else ""})
+            return IRStatement("loop", language, raw, line, condition=(parts[1] if len(parts) > 1 and parts[1] else "true"), scope_depth=depth, init=parts[0] if parts else "")
         fn = re.search(r"(?:^|\s)(?:(?:[\w:<>\[\]]+\s*[*&]?\s+)+)([A-Za-z_]\w*)\s*\(([^)]*)\)\s*$", compact)
         js_fn = re.search(r"\bfunction\s+([A-Za-z_]\w*)\s*\(([^)]*)\)", compact) if language == "JavaScript" else None
         if (fn or js_fn) and "=" not in compact and not compact.startswith(("if", "for", "while", "switch", "catch")) and "<<" not in compact and ">>" not in compact and not compact.startswith(("System.", "console.")):
             m = fn or js_fn
             if m is None:
                 return None
-            return IRStatement("definition", language, raw, line, name=m.group(1), target_type="function", scope_depth=depth, metadata={"params": m.group(2)})
+            return IRStatement("definition", language, raw, line, name=m.group(1), target_type="function", scope_depth=depth, params=m.group(2))
         dec = _declaration(compact, language)
         if dec:
             typ, name, expr = dec
@@ -774,15 +1002,15 @@ class Parser:
                 or re.search(r"\b\d+\s+[A-Za-z_]\w*", expr)
                 or ("<<" in expr and not re.search(r"[;{}]", expr))
             ):
-                return IRStatement("syntax", language, raw, line, scope_depth=depth, metadata={"issue": "MissingDelimiter"})
-            return IRStatement("assignment", language, raw, line, name=name, target_type=typ, expression=expr, scope_depth=depth, metadata={"declaration": True, "final": bool(re.search(r"\bfinal\b", compact))})
+                return IRStatement("syntax", language, raw, line, scope_depth=depth, issue="MissingDelimiter")
+            return IRStatement("assignment", language, raw, line, name=name, target_type=typ, expression=expr, scope_depth=depth, declaration=True, final=bool(re.search(r"\bfinal\b", compact)))
         assign = re.match(r"^([A-Za-z_]\w*)\s*([+\-*/%]?=)\s*(.+)$", compact)
         if assign:
-            return IRStatement("assignment", language, raw, line, name=assign.group(1), expression=assign.group(3), scope_depth=depth, metadata={"operator": assign.group(2)})
+            return IRStatement("assignment", language, raw, line, name=assign.group(1), expression=assign.group(3), scope_depth=depth, operator=assign.group(2))
         if re.match(r"^(?:[-+]?\d+|['\"`].*['\"`]|\([^)]*\))\s*=", compact):
-            return IRStatement("syntax", language, raw, line, scope_depth=depth, metadata={"issue": "InvalidAssignment"})
+            return IRStatement("syntax", language, raw, line, scope_depth=depth, issue="InvalidAssignment")
         if language in {"C", "C++", "Java"} and closed != ";" and re.search(r"\b(int|double|float|char|String|boolean|return|printf|System\.out)\b", compact):
-            return IRStatement("syntax", language, raw, line, scope_depth=depth, metadata={"issue": "MissingDelimiter"})
+            return IRStatement("syntax", language, raw, line, scope_depth=depth, issue="MissingDelimiter")
         return IRStatement("expr", language, raw, line, expression=compact, scope_depth=depth)
 
 
@@ -812,28 +1040,64 @@ def _line_missing_delimiter(stripped: str) -> bool:
     return bool(re.match(r"^(?:[\w:<>\[\]]+\s+[*&]?[\w]+|return\b|System\.out|printf\b|std::cout|std::cerr)", stripped))
 
 
+_TRUE_LITERAL = re.compile(r"\btrue\b", re.I)
+_FALSE_LITERAL = re.compile(r"\bfalse\b", re.I)
+_NULL_LITERAL = re.compile(r"\b(null|nullptr|undefined)\b")
+_BANG = re.compile(r"(?<![=!<>])!(?!=)")
+_CAST = re.compile(r"\([A-Za-z_][\w:<>\[\]]*\)")
+_NEW_EXPR = re.compile(r"\bnew\s+[A-Za-z_][\w:<>]*\s*")
+_INDEXED = re.compile(r"([A-Za-z_]\w*)\s*\[[^\]]*\]")
+_NUMBER = re.compile(r"[-+]?\d+(?:\.\d+)?")
+_NAME = re.compile(r"[A-Za-z_]\w*")
+
+
+def _same_expression_text(raw: str, expression: str | None) -> bool:
+    """True when ``raw`` is only a whitespace variant of ``expression``, so its
+    denominators are already covered. Line continuations and comments can make
+    the two parse differently, so those are never treated as the same."""
+    if not expression or "\\" in raw or "#" in raw:
+        return False
+    return raw.split() == expression.split()
+
+
 class ExpressionEvaluator:
+    """Folds expression text to value facts.
+
+    Normalized text and parsed expression trees are memoized, so generated code
+    that repeats the same expression is parsed once per analysis. The trees are
+    only read by ``_eval``; call ``clear_cache`` between unrelated analyses.
+    """
+
+    def __init__(self) -> None:
+        self._normalized: dict[str, str] = {}
+        self._parsed: dict[str, ast.expr | None] = {}
+
+    def clear_cache(self) -> None:
+        self._normalized.clear()
+        self._parsed.clear()
+
     def evaluate(self, expression: str | None, symbols: SymbolTable) -> ValueFact:
         if not expression:
-            return ValueFact(ValueState.UNKNOWN)
+            return UNKNOWN_VALUE
         expr = self._normalize(expression)
-        try:
-            node = ast.parse(expr, mode="eval").body
-        except SyntaxError:
-            if re.fullmatch(r"[-+]?\d+(?:\.\d+)?", expr):
+        node = self._parse(expr)
+        if node is None:
+            if _NUMBER.fullmatch(expr):
                 value = float(expr) if "." in expr else int(expr)
                 return ValueFact(ValueState.ZERO if value == 0 else ValueState.NONZERO, value)
-            if re.fullmatch(r"[A-Za-z_]\w*", expr):
+            if _NAME.fullmatch(expr):
                 return symbols.value_of(expr)
-            return ValueFact(ValueState.UNKNOWN)
+            return UNKNOWN_VALUE
         return self._eval(node, symbols)
 
     def denominator_states(self, expression: str | None, symbols: SymbolTable) -> list[ValueFact]:
         if not expression:
             return []
         try:
-            node = ast.parse(self._normalize(expression), mode="eval").body
-        except (SyntaxError, ValueError):
+            node = self._parse(self._normalize(expression))
+        except ValueError:
+            return []
+        if node is None:
             return []
         states: list[ValueFact] = []
 
@@ -846,17 +1110,32 @@ class ExpressionEvaluator:
         walk(node)
         return states
 
+    def _parse(self, expr: str) -> ast.expr | None:
+        """Parsed expression body, or None when the text is not a valid expression."""
+        if expr in self._parsed:
+            return self._parsed[expr]
+        try:
+            node: ast.expr | None = ast.parse(expr, mode="eval").body
+        except SyntaxError:
+            node = None
+        self._parsed[expr] = node
+        return node
+
     def _normalize(self, expression: str) -> str:
+        cached = self._normalized.get(expression)
+        if cached is not None:
+            return cached
         expr = expression.strip().rstrip(";")
-        expr = re.sub(r"\btrue\b", "True", expr, flags=re.I)
-        expr = re.sub(r"\bfalse\b", "False", expr, flags=re.I)
-        expr = re.sub(r"\b(null|nullptr|undefined)\b", "None", expr)
+        expr = _TRUE_LITERAL.sub("True", expr)
+        expr = _FALSE_LITERAL.sub("False", expr)
+        expr = _NULL_LITERAL.sub("None", expr)
         expr = expr.replace("&&", " and ").replace("||", " or ")
-        expr = re.sub(r"(?<![=!<>])!(?!=)", " not ", expr)
-        expr = re.sub(r"\([A-Za-z_][\w:<>\[\]]*\)", "", expr)
-        expr = re.sub(r"\bnew\s+[A-Za-z_][\w:<>]*\s*", "", expr)
-        expr = re.sub(r"([A-Za-z_]\w*)\s*\[[^\]]*\]", r"\1", expr)
+        expr = _BANG.sub(" not ", expr)
+        expr = _CAST.sub("", expr)
+        expr = _NEW_EXPR.sub("", expr)
+        expr = _INDEXED.sub(r"\1", expr)
         expr = expr.replace("std::", "")
+        self._normalized[expression] = expr
         return expr
 
     def _eval(self, node: ast.AST, symbols: SymbolTable) -> ValueFact:
@@ -870,7 +1149,7 @@ class ExpressionEvaluator:
                 return ValueFact(ValueState.NONZERO if value else ValueState.ZERO, value)
             if value is None:
                 return ValueFact(ValueState.ZERO, None)
-            return ValueFact(ValueState.UNKNOWN)
+            return UNKNOWN_VALUE
         if isinstance(node, ast.Name):
             return symbols.value_of(node.id)
         if isinstance(node, ast.UnaryOp):
@@ -896,15 +1175,15 @@ class ExpressionEvaluator:
                     return ValueFact(ValueState.NONZERO, True)
                 if all(item.state == ValueState.ZERO for item in values):
                     return ValueFact(ValueState.ZERO, False)
-            return ValueFact(ValueState.UNKNOWN)
+            return UNKNOWN_VALUE
         if isinstance(node, ast.Compare) and len(node.ops) == 1 and len(node.comparators) == 1:
             left = self._eval(node.left, symbols)
             right = self._eval(node.comparators[0], symbols)
             if left.constant is None or right.constant is None:
-                return ValueFact(ValueState.UNKNOWN)
+                return UNKNOWN_VALUE
             result = self._compare(left.constant, right.constant, node.ops[0])
             if result is None:
-                return ValueFact(ValueState.UNKNOWN)
+                return UNKNOWN_VALUE
             return ValueFact(ValueState.NONZERO if result else ValueState.ZERO, result)
         if isinstance(node, ast.BinOp):
             left = self._eval(node.left, symbols)
@@ -915,13 +1194,13 @@ class ExpressionEvaluator:
                 try:
                     folded = self._fold(left.constant, right.constant, node.op)
                 except ZeroDivisionError:
-                    return ValueFact(ValueState.UNKNOWN)
+                    return UNKNOWN_VALUE
                 if folded is not None:
                     return ValueFact(ValueState.ZERO if folded == 0 else ValueState.NONZERO, folded)
             if left.state == ValueState.UNKNOWN or right.state == ValueState.UNKNOWN:
-                return ValueFact(ValueState.UNKNOWN)
+                return UNKNOWN_VALUE
             return ValueFact(ValueState.MAYBE_ZERO)
-        return ValueFact(ValueState.UNKNOWN)
+        return UNKNOWN_VALUE
 
     def _compare(self, left: Any, right: Any, op: ast.cmpop) -> bool | None:
         if isinstance(op, ast.Eq):
@@ -967,40 +1246,33 @@ class SymbolBuilder:
         self.evaluator = evaluator
 
     def build(self, program: IRProgram) -> tuple[SymbolTable, list[AnalysisIssue]]:
-        table = SymbolTable(program.language)
+        table = SymbolTable(program.language, builtins=BUILTIN_SCOPES.get(program.language, EMPTY_SCOPE))
         issues: list[AnalysisIssue] = []
-        if program.language == "Python":
-            for name in PY_BUILTINS:
-                table.declare(Symbol(name, "builtin", 0, value=ValueFact(ValueState.NONZERO)))
-        if program.language == "JavaScript":
-            for name in JS_GLOBALS:
-                table.declare(Symbol(name, "builtin", 0))
         for stmt in program.statements:
             if stmt.kind == "include" and stmt.module:
                 table.includes.add(stmt.module)
             elif stmt.kind == "import":
                 table.imports.add(stmt.module or stmt.name or "")
-                table.declare(Symbol(stmt.name or stmt.module or "", "import", stmt.line, imported_from=stmt.module, value=ValueFact(ValueState.NONZERO)))
+                table.declare(Symbol(stmt.name or stmt.module or "", "import", stmt.line, imported_from=stmt.module, value=NONZERO_VALUE))
             elif stmt.kind == "definition" and stmt.name:
-                if not table.declare(Symbol(stmt.name, stmt.target_type or "function", stmt.line, value=ValueFact(ValueState.NONZERO))):
+                if not table.declare(Symbol(stmt.name, stmt.target_type or "function", stmt.line, value=NONZERO_VALUE)):
                     issues.append(_issue(program, "DuplicateDefinition", f"Definition '{stmt.name}' appears more than once.", stmt.line, 0.84, suggestion="Rename or remove the duplicate.", evidence="symbol_table"))
-                params = stmt.metadata.get("params")
-                if isinstance(params, str):
-                    for param in _parameter_names(params):
+                if stmt.params is not None:
+                    for param in _parameter_names(stmt.params):
                         table.declare(Symbol(param, "parameter", stmt.line))
-                node = stmt.metadata.get("node")
+                node = program.node_of(stmt)
                 args = getattr(node, "args", None)
                 if args:
                     for arg in args.args:
                         table.declare(Symbol(arg.arg, "parameter", getattr(arg, "lineno", stmt.line), type_name=_annotation(arg.annotation)))
             elif stmt.kind == "assignment" and stmt.name:
                 value = self.evaluator.evaluate(stmt.expression, table)
-                existing = table.symbols.get(stmt.name)
-                if existing and stmt.metadata.get("declaration"):
+                existing = table.lookup(stmt.name)
+                if existing and stmt.declaration:
                     issues.append(_issue(program, "DuplicateDefinition", f"'{stmt.name}' is declared more than once.", stmt.line, 0.82, suggestion="Reuse the existing variable or choose a new name.", evidence="symbol_table"))
                 table.declare(Symbol(stmt.name, "variable", stmt.line, type_name=stmt.target_type or (existing.type_name if existing else None), value=value))
-            elif stmt.kind == "loop" and isinstance(stmt.metadata.get("init"), str):
-                dec = _declaration(stmt.metadata["init"], program.language)
+            elif stmt.kind == "loop" and stmt.init is not None:
+                dec = _declaration(stmt.init, program.language)
                 if dec:
                     typ, name, expr = dec
                     table.declare(Symbol(name, "variable", stmt.line, type_name=typ, value=self.evaluator.evaluate(expr, table)))
@@ -1063,20 +1335,24 @@ class ControlFlowAnalyzer:
 
     def _loops(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for stmt in program.statements:
+        for index, stmt in enumerate(program.statements):
             if stmt.kind != "loop":
                 continue
-            if stmt.metadata.get("init") and ("++" in stmt.raw or "--" in stmt.raw) and stmt.condition not in {"", "true", "True"}:
+            if stmt.init and ("++" in stmt.raw or "--" in stmt.raw) and stmt.condition not in {"", "true", "True"}:
                 continue
             condition = self.evaluator.evaluate(stmt.condition or "Unknown", symbols)
-            if condition.state == ValueState.NONZERO and not self._body_has_break(program, stmt):
+            if condition.state == ValueState.NONZERO and not self._body_has_break(program, stmt, index + 1):
                 issues.append(_issue(program, "InfiniteLoop", "Loop condition is provably always true and no reachable break was found.", stmt.line, 0.9, suggestion="Change the condition or add a reachable break.", evidence="cfg_condition_truth"))
         return issues
 
-    def _body_has_break(self, program: IRProgram, loop_stmt: IRStatement) -> bool:
+    def _body_has_break(self, program: IRProgram, loop_stmt: IRStatement, start: int = 0) -> bool:
+        """``start`` may be the index after ``loop_stmt``: statements are sorted by line first,
+        so everything before it is on or above the loop's line and the scan covers only its block."""
         if "break" in (loop_stmt.raw or ""):
             return True
-        for stmt in program.statements:
+        statements = program.statements
+        for index in range(start, len(statements)):
+            stmt = statements[index]
             if stmt.line <= loop_stmt.line:
                 continue
             if stmt.scope_depth <= loop_stmt.scope_depth:
@@ -1091,7 +1367,7 @@ class ControlFlowAnalyzer:
         issues: list[AnalysisIssue] = []
         jumped: dict[int, IRStatement] = {}
         for stmt in program.statements:
-            block_id = int(stmt.metadata.get("block_id", stmt.scope_depth))
+            block_id = stmt.block_id if stmt.block_id is not None else stmt.scope_depth
             prior = jumped.get(block_id)
             if prior and stmt.line >= prior.line and stmt.kind not in {"include", "import"}:
                 issues.append(_issue(program, "UnreachableCode", f"Statement cannot execute after {prior.jump_kind}.", stmt.line, 0.88, suggestion="Move this statement before the jump or remove it.", evidence="cfg_post_jump"))
@@ -1106,16 +1382,26 @@ class SemanticAnalyzer:
         self.evaluator = evaluator
         self.resolver = resolver
 
-    def analyze(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
+    def analyze(self, program: IRProgram, symbols: SymbolTable, clock: _BudgetClock | None = None) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
         issues.extend(self._syntax(program))
         if program.language != "Python" and any(_norm_type(raw.get("type")) == "UnclosedString" for raw in program.syntax_issues):
             return issues
+        if clock is not None and not clock.enter("Semantic Analysis"):
+            return issues
         issues.extend(self._division(program, symbols))
         if program.language == "Python":
-            issues.extend(self._python(program, symbols))
+            issues.extend(self._python(program, symbols, clock))
         else:
-            issues.extend(self._c_like(program, symbols))
+            issues.extend(self._c_like(program, symbols, clock))
+        return issues
+
+    def _run_passes(self, passes: tuple[partial[list[AnalysisIssue]], ...], clock: _BudgetClock | None) -> list[AnalysisIssue]:
+        issues: list[AnalysisIssue] = []
+        for run in passes:
+            if clock is not None and clock.exhausted("Semantic Analysis"):
+                break
+            issues.extend(run())
         return issues
 
     def _syntax(self, program: IRProgram) -> list[AnalysisIssue]:
@@ -1124,25 +1410,30 @@ class SemanticAnalyzer:
             kind = _norm_type(raw.get("type"))
             issues.append(_issue(program, kind, raw.get("message") or "Parser error.", raw.get("line"), 0.9, col=raw.get("col") or 1, suggestion=raw.get("suggestion"), evidence="parser"))
         for stmt in program.statements:
-            if stmt.kind == "syntax" and stmt.metadata.get("issue") == "MissingDelimiter":
+            if stmt.kind == "syntax" and stmt.issue == "MissingDelimiter":
                 issues.append(_issue(program, "MissingDelimiter", "Statement appears to be missing a delimiter.", stmt.line, 0.84, suggestion="Add the required semicolon or delimiter.", ambiguity=0.05, evidence="parser_statement"))
-            if stmt.kind == "syntax" and stmt.metadata.get("issue") == "InvalidAssignment":
+            if stmt.kind == "syntax" and stmt.issue == "InvalidAssignment":
                 issues.append(_issue(program, "InvalidAssignment", "Assignment target is not writable.", stmt.line, 0.86, suggestion="Assign to a variable, attribute, or indexed value.", ambiguity=0.04, evidence="parser_statement"))
         return issues
 
     def _division(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
         for stmt in program.statements:
-            for expr in (stmt.expression, stmt.raw):
+            texts = [stmt.expression]
+            # Python statement text (def/if/for blocks, assignments, returns) is
+            # never a valid expression; the parsed tree already supplied the
+            # expression, so re-tokenizing whole blocks here only costs time.
+            if stmt.language != "Python" and not _same_expression_text(stmt.raw, stmt.expression):
+                texts.append(stmt.raw)
+            for expr in texts:
                 if any(state.state == ValueState.ZERO for state in self.evaluator.denominator_states(expr, symbols)):
                     issues.append(_issue(program, "DivisionByZero", "Denominator is provably zero after constant folding and symbol propagation.", stmt.line, 0.93, suggestion="Guard the denominator or use a non-zero value.", evidence="expression_denominator_zero"))
                     break
         return issues
 
-    def _python(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
-        try:
-            tree = ast.parse(program.code)
-        except SyntaxError:
+    def _python(self, program: IRProgram, symbols: SymbolTable, clock: _BudgetClock | None = None) -> list[AnalysisIssue]:
+        tree = program.tree
+        if tree is None:
             return []
         issues: list[AnalysisIssue] = []
         for stmt in program.statements:
@@ -1151,23 +1442,23 @@ class SemanticAnalyzer:
                     issues.append(_issue(program, "WildcardImport", "Wildcard import hides which symbols enter the namespace.", stmt.line, 0.83, suggestion="Import specific names instead.", evidence="import_wildcard"))
                 if stmt.module and self.resolver.python_module(stmt.module) == ResolveState.MISSING:
                     issues.append(_issue(program, "ImportError", f"Module '{stmt.module}' could not be resolved.", stmt.line, 0.86, suggestion="Install the dependency or correct the module name.", evidence="import_resolver_missing"))
-        issues.extend(self._python_dynamic_import_calls(program, tree))
-        issues.extend(self._python_names(program, tree, symbols))
-        issues.extend(self._python_types(program, tree))
-        issues.extend(self._python_assignment_shapes(program, tree))
-        issues.extend(self._python_mutable_defaults(program, tree))
-        issues.extend(self._python_unreachable_ast(program, tree))
-        issues.extend(self._python_unused_variables(program, tree))
-        issues.extend(self._python_ctypes_pointer_risk(program, tree))
-        issues.extend(self._python_expanded_line_length(program, tree))
-        issues.extend(self._line_too_long(program))
+        issues.extend(self._run_passes((
+            partial(self._python_dynamic_import_calls, program),
+            partial(self._python_names, program, symbols),
+            partial(self._python_types, program),
+            partial(self._python_assignment_shapes, program),
+            partial(self._python_mutable_defaults, program),
+            partial(self._python_unreachable_ast, program, tree),
+            partial(self._python_unused_variables, program),
+            partial(self._python_ctypes_pointer_risk, program),
+            partial(self._python_expanded_line_length, program),
+            partial(self._line_too_long, program),
+        ), clock))
         return issues
 
-    def _python_dynamic_import_calls(self, program: IRProgram, tree: ast.AST) -> list[AnalysisIssue]:
+    def _python_dynamic_import_calls(self, program: IRProgram) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Call):
-                continue
+        for node in program.nodes_of(ast.Call):
             if isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
                 if node.func.value.id == "importlib" and node.func.attr == "import_module" and node.args:
                     first = node.args[0]
@@ -1177,21 +1468,20 @@ class SemanticAnalyzer:
                             issues.append(_issue(program, "ImportError", f"Module '{mod}' could not be resolved.", getattr(node, "lineno", 1), 0.85, suggestion="Install the dependency or correct the module name.", evidence="import_resolver_missing"))
         return issues
 
-    def _python_names(self, program: IRProgram, tree: ast.AST, symbols: SymbolTable) -> list[AnalysisIssue]:
+    def _python_names(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        declared = set(symbols.symbols)
         has_wildcard_import = any(stmt.kind == "import" and stmt.symbol == "*" for stmt in program.statements)
         first_store: dict[str, int] = {}
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+        for node in program.nodes_of(ast.Name):
+            if isinstance(node.ctx, ast.Store):
                 first_store[node.id] = min(first_store.get(node.id, node.lineno), node.lineno)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id not in declared:
+        for node in program.nodes:
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id not in symbols:
                 state, module = self.resolver.python_symbol(node.value.id)
                 if state == ResolveState.MISSING and module:
                     issues.append(_issue(program, "MissingImport", f"Symbol '{node.value.id}' appears to come from module '{module}' but is not imported.", node.lineno, 0.82, col=node.col_offset + 1, suggestion=f"Import '{module}' before using it.", ambiguity=0.08, evidence="import_resolver_symbol"))
             elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                if node.id in declared or node.id in PY_BUILTINS or node.id in {"True", "False", "None"}:
+                if node.id in symbols or node.id in PY_BUILTINS or node.id in {"True", "False", "None"}:
                     continue
                 if has_wildcard_import:
                     continue
@@ -1203,9 +1493,7 @@ class SemanticAnalyzer:
                 elif node.id not in KEYWORDS:
                     kind = "UndeclaredIdentifier" if ("not_defined" in node.id or "undeclared" in node.id) else "NameError"
                     issues.append(_issue(program, kind, f"Name '{node.id}' is read before it is defined.", node.lineno, 0.82, col=node.col_offset + 1, suggestion=f"Define '{node.id}' before using it.", ambiguity=0.08, evidence="symbol_unresolved_read"))
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Assign):
-                continue
+        for node in program.nodes_of(ast.Assign):
             if len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
                 continue
             target = node.targets[0].id
@@ -1219,9 +1507,9 @@ class SemanticAnalyzer:
                 issues.append(_issue(program, "NameError", f"Name '{target}' is read before it is defined.", node.lineno, 0.82, col=node.col_offset + 1, suggestion=f"Initialize '{target}' before using it in expressions.", ambiguity=0.08, evidence="symbol_unresolved_read"))
         return issues
 
-    def _python_types(self, program: IRProgram, tree: ast.AST) -> list[AnalysisIssue]:
+    def _python_types(self, program: IRProgram) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for node in ast.walk(tree):
+        for node in program.nodes:
             if isinstance(node, ast.FunctionDef) and node.returns:
                 expected = _annotation(node.returns)
                 for child in ast.walk(node):
@@ -1244,16 +1532,16 @@ class SemanticAnalyzer:
                                 break
         return issues
 
-    def _python_assignment_shapes(self, program: IRProgram, tree: ast.AST) -> list[AnalysisIssue]:
+    def _python_assignment_shapes(self, program: IRProgram) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign) and node.targets and isinstance(node.targets[0], (ast.Tuple, ast.List)) and not isinstance(node.value, (ast.Tuple, ast.List)):
+        for node in program.nodes_of(ast.Assign):
+            if node.targets and isinstance(node.targets[0], (ast.Tuple, ast.List)) and not isinstance(node.value, (ast.Tuple, ast.List)):
                 issues.append(_issue(program, "InvalidAssignment", "Multiple targets are assigned from a scalar value.", node.lineno, 0.85, col=node.col_offset + 1, suggestion="Provide the same number of values as targets.", evidence="assignment_shape"))
         return issues
 
-    def _python_mutable_defaults(self, program: IRProgram, tree: ast.AST) -> list[AnalysisIssue]:
+    def _python_mutable_defaults(self, program: IRProgram) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for node in ast.walk(tree):
+        for node in program.nodes:
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 for default in node.args.defaults:
                     if isinstance(default, (ast.List, ast.Dict, ast.Set)):
@@ -1291,14 +1579,14 @@ class SemanticAnalyzer:
         scan_block(list(getattr(tree, "body", [])))
         return issues
 
-    def _python_unused_variables(self, program: IRProgram, tree: ast.AST) -> list[AnalysisIssue]:
+    def _python_unused_variables(self, program: IRProgram) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
         stored: dict[str, list[tuple[int, int]]] = {}
         loaded: set[str] = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+        for node in program.nodes_of(ast.Name):
+            if isinstance(node.ctx, ast.Store):
                 stored.setdefault(node.id, []).append((node.lineno, node.col_offset + 1))
-            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            elif isinstance(node.ctx, ast.Load):
                 loaded.add(node.id)
         for name, positions in stored.items():
             if name.startswith("_") or name in loaded or name in PY_BUILTINS:
@@ -1307,39 +1595,39 @@ class SemanticAnalyzer:
                 issues.append(_issue(program, "UnusedVariable", f"Variable '{name}' is assigned but never used.", line, 0.82, col=col, suggestion=f"Use '{name}' or remove the assignment.", ambiguity=0.06, evidence="symbol_usage"))
         return issues
 
-    def _python_ctypes_pointer_risk(self, program: IRProgram, tree: ast.AST) -> list[AnalysisIssue]:
+    def _python_ctypes_pointer_risk(self, program: IRProgram) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        for node in program.nodes_of(ast.Call):
+            if isinstance(node.func, ast.Attribute):
                 if isinstance(node.func.value, ast.Name) and node.func.value.id == "ctypes" and node.func.attr == "pointer":
                     issues.append(_issue(program, "DanglingPointer", "Pointer derived from local ctypes storage may outlive backing value.", getattr(node, "lineno", 1), 0.84, suggestion="Avoid returning or storing pointers to short-lived ctypes objects.", ambiguity=0.12, evidence="lifetime_pointer_escape"))
         return issues
 
-    def _python_expanded_line_length(self, program: IRProgram, tree: ast.AST, max_len: int = 120) -> list[AnalysisIssue]:
+    def _python_expanded_line_length(self, program: IRProgram, max_len: int = 120) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        for node in program.nodes_of(ast.BinOp):
+            if isinstance(node.op, ast.Mult):
                 left, right = node.left, node.right
                 if isinstance(left, ast.Constant) and isinstance(left.value, str) and isinstance(right, ast.Constant) and isinstance(right.value, int):
                     if len(left.value) * right.value > max_len:
                         issues.append(_issue(program, "LineTooLong", "Expression expands to a string longer than the configured line limit.", getattr(node, "lineno", 1), 0.82, suggestion=f"Keep generated literal text under {max_len} characters.", ambiguity=0.08, evidence="constant_string_expansion"))
         return issues
 
-    def _c_like(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
-        issues: list[AnalysisIssue] = []
-        issues.extend(self._missing_includes(program, symbols))
-        issues.extend(self._java_import_errors(program))
-        issues.extend(self._java_imports(program, symbols))
-        issues.extend(self._js_asi_ambiguity(program))
-        issues.extend(self._typed_assignments(program))
-        issues.extend(self._string_numeric_misuse(program, symbols))
-        issues.extend(self._invalid_array_assignment(program))
-        issues.extend(self._invalid_final_assignment(program))
-        issues.extend(self._dangling_pointer(program))
-        issues.extend(self._undeclared(program, symbols))
-        issues.extend(self._unused_c_like_variables(program))
-        issues.extend(self._line_too_long(program))
-        return issues
+    def _c_like(self, program: IRProgram, symbols: SymbolTable, clock: _BudgetClock | None = None) -> list[AnalysisIssue]:
+        return self._run_passes((
+            partial(self._missing_includes, program, symbols),
+            partial(self._java_import_errors, program),
+            partial(self._java_imports, program, symbols),
+            partial(self._js_asi_ambiguity, program),
+            partial(self._typed_assignments, program),
+            partial(self._string_numeric_misuse, program, symbols),
+            partial(self._invalid_array_assignment, program),
+            partial(self._invalid_final_assignment, program),
+            partial(self._dangling_pointer, program),
+            partial(self._undeclared, program, symbols),
+            partial(self._unused_c_like_variables, program),
+            partial(self._line_too_long, program),
+        ), clock)
 
     def _java_import_errors(self, program: IRProgram) -> list[AnalysisIssue]:
         if program.language != "Java":
@@ -1357,28 +1645,28 @@ class SemanticAnalyzer:
         if program.language not in {"C", "C++"}:
             return []
         issues: list[AnalysisIssue] = []
-        for name in _identifiers(program.code):
+        for name in program.identifiers:
             header = self.resolver.c_header(name, program.language)
             if not header:
                 continue
             include_names = {item.split("/")[-1] for item in symbols.includes}
             alt = "c" + header.removesuffix(".h") if header.endswith(".h") else header
             if header not in include_names and alt not in include_names:
-                issues.append(_issue(program, "MissingInclude", f"'{name}' requires include <{header}>.", _identifier_line(program.code, name), 0.84, suggestion=f"Add #include <{header}>.", ambiguity=0.04, evidence="include_resolver"))
+                issues.append(_issue(program, "MissingInclude", f"'{name}' requires include <{header}>.", program.line_index.first_line_of(name), 0.84, suggestion=f"Add #include <{header}>.", ambiguity=0.04, evidence="include_resolver"))
         return issues
 
     def _java_imports(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
         if program.language != "Java":
             return []
         issues: list[AnalysisIssue] = []
-        for typ in re.findall(r"\b[A-Z][A-Za-z0-9_]*\b", _strip_comments(program.code)):
+        for typ in re.findall(r"\b[A-Z][A-Za-z0-9_]*\b", program.comment_free):
             if typ in {"String", "System", "Main", "Integer", "Double", "Boolean"}:
                 continue
             if f"java.util.{typ}" in program.code:
                 continue
             state, required = self.resolver.java_type(typ, symbols.imports)
             if state == ResolveState.MISSING and required:
-                issues.append(_issue(program, "MissingImport", f"Type '{typ}' requires import '{required}'.", _identifier_line(program.code, typ), 0.82, suggestion=f"Add import {required};", ambiguity=0.05, evidence="java_import_resolver"))
+                issues.append(_issue(program, "MissingImport", f"Type '{typ}' requires import '{required}'.", program.line_index.first_line_of(typ), 0.82, suggestion=f"Add import {required};", ambiguity=0.05, evidence="java_import_resolver"))
         return issues
 
     def _typed_assignments(self, program: IRProgram) -> list[AnalysisIssue]:
@@ -1405,14 +1693,15 @@ class SemanticAnalyzer:
         # directly — not via `.method()`, `(call)`, or `[index]` — so `s.length() > 0`
         # is not flagged.
         op = r"(?:<=|>=|<|>|\*|/|%|-)"
+        patterns = []
+        for var in string_vars:
+            v = re.escape(var)
+            patterns.append((var, re.compile(rf"\b{v}\b(?!\s*[.\(\[])\s*{op}\s*-?\d"), re.compile(rf"-?\d\s*{op}\s*\b{v}\b(?!\s*[.\(\[])")))
         issues: list[AnalysisIssue] = []
         flagged_lines: set[int] = set()
-        for idx, raw_line in enumerate(_strip_comments(program.code).splitlines(), start=1):
+        for idx, raw_line in enumerate(program.comment_free.splitlines(), start=1):
             line = re.sub(r'"(?:\\.|[^"\\])*"', '""', raw_line)  # blank string-literal contents
-            for var in string_vars:
-                v = re.escape(var)
-                p1 = re.compile(rf"\b{v}\b(?!\s*[.\(\[])\s*{op}\s*-?\d")
-                p2 = re.compile(rf"-?\d\s*{op}\s*\b{v}\b(?!\s*[.\(\[])")
+            for var, p1, p2 in patterns:
                 if (p1.search(line) or p2.search(line)) and idx not in flagged_lines:
                     flagged_lines.add(idx)
                     issues.append(_issue(program, "TypeMismatch", f"String variable '{var}' is used in a numeric operation.", idx, 0.85, suggestion="Parse the String first (e.g. Integer.parseInt) or compare against a String value.", evidence="string_numeric_operation"))
@@ -1420,11 +1709,11 @@ class SemanticAnalyzer:
 
     def _invalid_array_assignment(self, program: IRProgram) -> list[AnalysisIssue]:
         arrays = {s.name for s in program.statements if s.kind == "assignment" and s.name and s.target_type and "[]" in s.target_type}
-        return [_issue(program, "InvalidAssignment", "Array variable is assigned a scalar expression.", s.line, 0.85, suggestion="Assign an array value or update one element with an index.", evidence="assignment_shape") for s in program.statements if s.kind == "assignment" and s.name in arrays and not s.metadata.get("declaration") and s.expression and not s.expression.strip().startswith("{")]
+        return [_issue(program, "InvalidAssignment", "Array variable is assigned a scalar expression.", s.line, 0.85, suggestion="Assign an array value or update one element with an index.", evidence="assignment_shape") for s in program.statements if s.kind == "assignment" and s.name in arrays and not s.declaration and s.expression and not s.expression.strip().startswith("{")]
 
     def _invalid_final_assignment(self, program: IRProgram) -> list[AnalysisIssue]:
-        final_vars = {s.name for s in program.statements if s.kind == "assignment" and s.name and s.metadata.get("declaration") and s.metadata.get("final")}
-        return [_issue(program, "InvalidAssignment", f"Final variable '{s.name}' cannot be reassigned.", s.line, 0.87, suggestion="Remove reassignment or declaration final modifier.", evidence="assignment_shape") for s in program.statements if s.kind == "assignment" and s.name in final_vars and not s.metadata.get("declaration")]
+        final_vars = {s.name for s in program.statements if s.kind == "assignment" and s.name and s.declaration and s.final}
+        return [_issue(program, "InvalidAssignment", f"Final variable '{s.name}' cannot be reassigned.", s.line, 0.87, suggestion="Remove reassignment or declaration final modifier.", evidence="assignment_shape") for s in program.statements if s.kind == "assignment" and s.name in final_vars and not s.declaration]
 
     def _dangling_pointer(self, program: IRProgram) -> list[AnalysisIssue]:
         if program.language != "C++":
@@ -1458,39 +1747,47 @@ class SemanticAnalyzer:
 
     def _undeclared(self, program: IRProgram, symbols: SymbolTable) -> list[AnalysisIssue]:
         issues: list[AnalysisIssue] = []
-        declared = set(symbols.symbols)
-        declared.update(re.findall(r"\b([A-Za-z_]\w*)\s*=>", program.code))
+        arrow_params = set(re.findall(r"\b([A-Za-z_]\w*)\s*=>", program.code))
         standard = CPP_SYMBOLS if program.language == "C++" else C_SYMBOLS if program.language == "C" else JS_GLOBALS if program.language == "JavaScript" else {}
-        for name in _identifiers(program.code):
-            if name in declared or name in KEYWORDS or name in standard or name in {"std", "main", "args", "out", "println", "log", "namespace", "java", "util"}:
+        for name in program.identifiers:
+            if name in symbols or name in arrow_params or name in KEYWORDS or name in standard or name in {"std", "main", "args", "out", "println", "log", "namespace", "java", "util"}:
                 continue
             if program.language == "Java" and (name[:1].isupper() or name in JAVA_TYPES):
                 continue
-            issues.append(_issue(program, "UndeclaredIdentifier", f"Identifier '{name}' is used before declaration.", _identifier_line(program.code, name), 0.78, suggestion=f"Declare '{name}' before using it.", ambiguity=0.15, evidence="symbol_unresolved_read"))
+            issues.append(_issue(program, "UndeclaredIdentifier", f"Identifier '{name}' is used before declaration.", program.line_index.first_line_of(name), 0.78, suggestion=f"Declare '{name}' before using it.", ambiguity=0.15, evidence="symbol_unresolved_read"))
         return issues
 
     def _line_too_long(self, program: IRProgram, max_len: int = 120) -> list[AnalysisIssue]:
-        return [_issue(program, "LineTooLong", f"Line is {len(line)} characters long.", line_no, 0.86, suggestion=f"Keep lines under {max_len} characters.", evidence="style_line_length") for line_no, line in enumerate(program.code.splitlines(), 1) if len(line) > max_len]
+        return [_issue(program, "LineTooLong", f"Line is {len(line)} characters long.", line_no, 0.86, suggestion=f"Keep lines under {max_len} characters.", evidence="style_line_length") for line_no, line in enumerate(program.line_index.lines, 1) if len(line) > max_len]
 
     def _unused_c_like_variables(self, program: IRProgram) -> list[AnalysisIssue]:
         if program.language not in {"Java", "C", "C++", "JavaScript"}:
             return []
         issues: list[AnalysisIssue] = []
-        for stmt in program.statements:
-            if stmt.kind != "assignment" or not stmt.metadata.get("declaration") or not stmt.name:
+        # Words of every statement and how many statements mention each one, built on
+        # the first candidate: a name is used when a statement other than its own
+        # declaration mentions it, so one count replaces a regex scan per declaration.
+        words: list[set[str]] = []
+        mentions: dict[str, int] = {}
+        for index, stmt in enumerate(program.statements):
+            if stmt.kind != "assignment" or not stmt.declaration or not stmt.name:
                 continue
             if program.language in {"Java", "JavaScript"} and stmt.scope_depth > 0:
                 continue
             if stmt.name.startswith("_"):
                 continue
-            used = False
-            for other in program.statements:
-                if other is stmt:
-                    continue
-                hay = " ".join((other.raw or "", other.expression or "", other.condition or ""))
-                if re.search(rf"\b{re.escape(stmt.name)}\b", hay):
-                    used = True
-                    break
+            if not words:
+                for other in program.statements:
+                    found = set(_WORD.findall(" ".join((other.raw or "", other.expression or "", other.condition or ""))))
+                    words.append(found)
+                    for word in found:
+                        mentions[word] = mentions.get(word, 0) + 1
+            if _WORD.fullmatch(stmt.name):
+                used = mentions.get(stmt.name, 0) > (stmt.name in words[index])
+            else:
+                # Names with non-word characters (JavaScript ``$``) keep the boundary search.
+                pattern = re.compile(rf"\b{re.escape(stmt.name)}\b")
+                used = any(pattern.search(" ".join((other.raw or "", other.expression or "", other.condition or ""))) for other in program.statements if other is not stmt)
             if not used:
                 issues.append(_issue(program, "UnusedVariable", f"Variable '{stmt.name}' is declared but never used.", stmt.line, 0.82, suggestion=f"Use '{stmt.name}' or remove the declaration.", ambiguity=0.06, evidence="symbol_usage"))
         return issues
@@ -1498,7 +1795,7 @@ class SemanticAnalyzer:
     def _js_asi_ambiguity(self, program: IRProgram) -> list[AnalysisIssue]:
         if program.language != "JavaScript":
             return []
-        lines = program.code.splitlines()
+        lines = program.line_index.lines
         top_level_risky: list[int] = []
         for idx in range(1, len(lines)):
             prev_raw = lines[idx - 1]
@@ -1575,8 +1872,8 @@ def _types_compatible(expected: str, actual: str) -> bool:
     return False
 
 
-def _identifiers(code: str) -> list[str]:
-    clean = re.sub(r"(['\"`])(?:\\.|(?!\1).)*\1", " ", _strip_comments(code))
+def _identifiers(comment_free: str) -> list[str]:
+    clean = re.sub(r"(['\"`])(?:\\.|(?!\1).)*\1", " ", comment_free)
     clean = re.sub(r"#include\s*[<\"][^>\"]+[>\"]", " ", clean)
     clean = re.sub(r"\.\s*[A-Za-z_]\w*", " ", clean)
     clean = re.sub(r"\b[A-Za-z_]\w*\s*:", " ", clean)
@@ -1594,14 +1891,6 @@ def _identifiers(code: str) -> list[str]:
     return result
 
 
-def _identifier_line(code: str, name: str) -> int:
-    pattern = re.compile(rf"\b{re.escape(name)}\b")
-    for line_no, line in enumerate(code.splitlines(), 1):
-        if pattern.search(line):
-            return line_no
-    return 1
-
-
 class MultiErrorAggregator:
     def aggregate(self, issues: list[AnalysisIssue]) -> list[AnalysisIssue]:
         deduped: dict[tuple[str, int | None, int | None, str], AnalysisIssue] = {}
@@ -1679,6 +1968,66 @@ class Ranker:
         )
 
 
+# Nodes, statements or lines the parser handles between two budget checks.
+_CLOCK_CHECK_INTERVAL = 256
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisBudget:
+    """Work limits for one analysis; ``None`` leaves a limit off.
+
+    ``max_seconds`` caps the whole analysis and ``stage_seconds`` any single
+    stage. Both are checked between stages, between semantic passes and every
+    ``_CLOCK_CHECK_INTERVAL`` nodes, statements or lines while parsing, so
+    only ``ast.parse`` and a running semantic pass always finish. ``max_nodes`` caps the program size (AST
+    nodes for Python, statements otherwise) that the symbol, control-flow and
+    semantic stages accept; larger programs only get parser diagnostics.
+    """
+
+    max_seconds: float | None = None
+    stage_seconds: float | None = None
+    max_nodes: int | None = None
+
+
+class _BudgetClock:
+    """Tracks one analysis against its budget; ``truncated`` is set once, on the first limit hit."""
+
+    __slots__ = ("budget", "started", "stage_started", "truncated")
+
+    def __init__(self, budget: AnalysisBudget) -> None:
+        self.budget = budget
+        self.started = self.stage_started = time.perf_counter()
+        self.truncated: dict[str, Any] | None = None
+
+    def _stop(self, stage: str, reason: str, limit: float) -> None:
+        self.truncated = {"stage": stage, "reason": reason, "limit": limit}
+
+    def exhausted(self, stage: str) -> bool:
+        """True once a limit is hit; ``stage`` is the work that would run next."""
+        if self.truncated is None:
+            now = time.perf_counter()
+            budget = self.budget
+            if budget.max_seconds is not None and now - self.started > budget.max_seconds:
+                self._stop(stage, "time_budget", budget.max_seconds)
+            elif budget.stage_seconds is not None and now - self.stage_started > budget.stage_seconds:
+                self._stop(stage, "stage_time_budget", budget.stage_seconds)
+        return self.truncated is not None
+
+    def enter(self, stage: str) -> bool:
+        """Start timing ``stage``; False if it must be skipped."""
+        if self.exhausted(stage):
+            return False
+        self.stage_started = time.perf_counter()
+        return True
+
+    def admits(self, program: IRProgram, stage: str) -> bool:
+        """False if ``program`` (AST nodes, else statements) is over the node budget."""
+        limit = self.budget.max_nodes
+        if limit is not None and self.truncated is None and len(program.nodes or program.statements) > limit:
+            self._stop(stage, "node_budget", limit)
+        return self.truncated is None
+
+
 class StaticAnalysisEngine:
     def __init__(self, project_root: Path | None = None) -> None:
         self.parser = Parser()
@@ -1691,13 +2040,25 @@ class StaticAnalysisEngine:
         self.calibrator = ConfidenceCalibrator()
         self.ranker = Ranker()
 
-    def analyze(self, code: str, filename: str | None = None, language_override: str | None = None) -> dict[str, Any]:
+    def analyze(self, code: str, filename: str | None = None, language_override: str | None = None, *, keep_tree: bool = False, budget: AnalysisBudget | None = None) -> dict[str, Any]:
         # C1: Sanitize null bytes to prevent ast.parse ValueError crashes
         code = code.replace("\x00", "")
+        self.evaluator.clear_cache()
+        clock = _BudgetClock(budget) if budget is not None else None
         language = language_override or detect_language(code, filename)
-        program = self.parser.parse(code, language, filename)
-        symbols, symbol_issues = self.symbols.build(program)
-        issues = symbol_issues + self.cfg.analyze(program, symbols) + self.semantic.analyze(program, symbols)
+        program = self.parser.parse(code, language, filename, clock)
+        if clock is None or (clock.admits(program, "Symbol Table") and clock.enter("Symbol Table")):
+            symbols, issues = self.symbols.build(program)
+        else:
+            symbols, issues = SymbolTable(program.language, builtins=BUILTIN_SCOPES.get(program.language, EMPTY_SCOPE)), []
+        if clock is None or clock.enter("Control Flow"):
+            issues += self.cfg.analyze(program, symbols)
+        # Parser diagnostics are already computed, so they are reported even when the budget is spent.
+        issues += self.semantic.analyze(program, symbols, clock)
+        # The result keeps the program; the syntax tree is only needed by the passes
+        # above unless the caller asked to reuse it (and will release it).
+        if not keep_tree:
+            program.release_tree()
         issues = self.aggregator.aggregate(issues)
         for issue in issues:
             issue.confidence = self.calibrator.score(issue, len(issues))
@@ -1707,6 +2068,9 @@ class StaticAnalysisEngine:
         if degraded:
             status = get_model_status()
             warnings.append(f"ML model unavailable; falling back to rule-based checks only ({status.get('error', 'unknown reason')})")
+        truncated = clock.truncated if clock is not None else None
+        if truncated:
+            warnings.append(f"Analysis stopped at {truncated['stage']} ({truncated['reason']} of {truncated['limit']} exceeded); results are partial.")
         return {
             "language": language,
             "program": program,
@@ -1715,6 +2079,7 @@ class StaticAnalysisEngine:
             "primary": ranked[0] if ranked else None,
             "degraded_mode": degraded,
             "warnings": warnings,
+            "truncated": truncated,
             "pipeline": [
                 "Parsing",
                 "Symbol Table",
@@ -1732,8 +2097,8 @@ def _engine() -> StaticAnalysisEngine:
     return StaticAnalysisEngine(Path.cwd())
 
 
-def analyze_source(code: str, filename: str | None = None, language_override: str | None = None) -> DetectionAnalysis:
-    analysis = _engine().analyze(code, filename, language_override)
+def analyze_source(code: str, filename: str | None = None, language_override: str | None = None, *, keep_tree: bool = False, budget: AnalysisBudget | None = None) -> DetectionAnalysis:
+    analysis = _engine().analyze(code, filename, language_override, keep_tree=keep_tree, budget=budget)
     return DetectionAnalysis(
         language=analysis["language"],
         program=analysis["program"],
@@ -1743,6 +2108,7 @@ def analyze_source(code: str, filename: str | None = None, language_override: st
         degraded_mode=analysis["degraded_mode"],
         warnings=analysis["warnings"],
         pipeline=analysis["pipeline"],
+        truncated=analysis["truncated"],
     )
 
 
@@ -1754,3 +2120,27 @@ def detect_errors_static(code: str, filename: str | None = None, language_overri
 def detect_all_errors_static(code: str, filename: str | None = None, language_override: str | None = None) -> dict[str, Any]:
     analysis = analyze_source(code, filename, language_override)
     return analysis.to_grouped_result()
+
+
+def analyze_submission(code: str, filename: str | None = None, language_override: str | None = None, *, fix_preview: bool = False, budget: AnalysisBudget | None = None) -> dict[str, Any]:
+    """Detection result, quality metrics and an optional patch preview from one analysis.
+
+    Language detection and the Python parse happen once: the quality analyzer
+    reuses the pipeline's language and syntax tree instead of starting over.
+    When ``budget`` stopped the analysis, ``quality`` is None: the quality
+    pass would otherwise rescan (and reparse) the whole file unbounded.
+    """
+    analysis = analyze_source(code, filename, language_override, keep_tree=True, budget=budget)
+    program = analysis.program
+    quality = None
+    if analysis.truncated is None:
+        # The pipeline drops NUL bytes before parsing; its tree only describes ``code`` without them.
+        tree = program.tree if program.code == code else None
+        quality = CodeQualityAnalyzer(code, analysis.language, tree=tree).analyze()
+    program.release_tree()
+    detection = analysis.to_single_result()
+    return {
+        "detection": detection,
+        "quality": quality,
+        "fix_preview": AutoFixer.patch_preview(code, detection["rule_based_issues"], analysis.language) if fix_preview else None,
+    }
@@ -2,7 +2,44 @@ import ast
 import re
 import tokenize
 import io
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class TokenStream:
+    """One tokenize pass over ``code``, shared by every detector in this module.
+
+    ``tokens`` holds everything the tokenizer produced before it stopped and
+    ``error`` the exception that stopped it (None when it reached the end), so
+    detectors can replay the stream instead of tokenizing the code again.
+    """
+
+    __slots__ = ("code", "lines", "tokens", "error")
+
+    def __init__(self, code: str):
+        self.code = code
+        self.lines = code.splitlines()
+        self.tokens: List[tokenize.TokenInfo] = []
+        self.error: Optional[Exception] = None
+        try:
+            for tok in tokenize.generate_tokens(io.StringIO(code).readline):
+                self.tokens.append(tok)
+        except Exception as e:
+            self.error = e
+
+    @property
+    def error_position(self) -> Optional[Tuple[int, int]]:
+        """(line, col) where tokenizing stopped, or None when it did not fail."""
+        if self.error is None:
+            return None
+        if isinstance(self.error, SyntaxError):
+            return self.error.lineno, self.error.offset
+        if isinstance(self.error, tokenize.TokenError) and len(self.error.args) > 1:
+            return self.error.args[1]
+        return self.tokens[-1].end if self.tokens else (1, 0)
+
+
+def _lines(code: str, stream: Optional[TokenStream]) -> List[str]:
+    return stream.lines if stream is not None else code.splitlines()
 
 
 def try_ast_parse(code: str) -> Tuple[bool, Any]:
@@ -14,23 +51,20 @@ def try_ast_parse(code: str) -> Tuple[bool, Any]:
         return False, e
 
 
-def detect_unclosed_quotes(code: str) -> List[Dict[str, Any]]:
+def detect_unclosed_quotes(code: str, stream: Optional[TokenStream] = None) -> List[Dict[str, Any]]:
     """Detect unclosed or unterminated string quotes safely, even when indentation is invalid."""
     issues = []
     try:
-        import io, tokenize
-
-        try:
-            # Try tokenizing — any bad indentation or string will raise an error
-            _ = list(tokenize.generate_tokens(io.StringIO(code).readline))
-        except tokenize.TokenError as e:
+        # Tokenizing raises on any bad indentation or string; the stream keeps that error.
+        e = (stream or TokenStream(code)).error
+        if isinstance(e, tokenize.TokenError):
             issues.append({
                 "type": "UnclosedQuotes",
                 "message": str(e),
                 "line": None,
                 "suggestion": "Check for missing or mismatched quotes."
             })
-        except IndentationError as e:
+        elif isinstance(e, IndentationError):
             # IndentationError must NOT be reported as UnclosedQuotes
             issues.append({
                 "type": "IndentationError",
@@ -38,14 +72,14 @@ def detect_unclosed_quotes(code: str) -> List[Dict[str, Any]]:
                 "line": getattr(e, 'lineno', None),
                 "suggestion": "Check for inconsistent indentation (use 4 spaces per level, avoid mixing tabs and spaces)."
             })
-        except SyntaxError as e:
+        elif isinstance(e, SyntaxError):
             issues.append({
                 "type": "UnclosedQuotes",
                 "message": str(e) if str(e) else "Tokenizer failed — possible unterminated string.",
                 "line": getattr(e, 'lineno', None),
                 "suggestion": "Check for missing quotes or inconsistent indentation."
             })
-        except Exception as e:
+        elif e is not None:
             # Absolute fallback for any unknown tokenizer failure
             issues.append({
                 "type": "UnclosedQuotes",
@@ -64,45 +98,44 @@ def detect_unclosed_quotes(code: str) -> List[Dict[str, Any]]:
     return issues
 
 
-def detect_unmatched_brackets(code: str) -> List[Dict[str, Any]]:
+def detect_unmatched_brackets(code: str, stream: Optional[TokenStream] = None) -> List[Dict[str, Any]]:
     """Detect missing or extra brackets/parentheses while ignoring strings/comments."""
     stack = []
     pairs = {')': '(', ']': '[', '}': '{'}
     issues = []
+    stream = stream or TokenStream(code)
 
-    try:
-        token_stream = tokenize.generate_tokens(io.StringIO(code).readline)
-        for tok in token_stream:
-            if tok.type != tokenize.OP:
-                continue
-            ch = tok.string
-            lineno, col = tok.start
-            if ch in "([{":
-                stack.append((ch, lineno, col + 1))
-            elif ch in ")]}":
-                if not stack:
+    for tok in stream.tokens:
+        if tok.type != tokenize.OP:
+            continue
+        ch = tok.string
+        lineno, col = tok.start
+        if ch in "([{":
+            stack.append((ch, lineno, col + 1))
+        elif ch in ")]}":
+            if not stack:
+                issues.append({
+                    "type": "UnmatchedBracket",
+                    "message": f"Found closing {ch} without opening bracket.",
+                    "line": lineno,
+                    "col": col + 1,
+                    "suggestion": "Remove the extra closing bracket or add matching opening bracket."
+                })
+            else:
+                top, tline, tcol = stack[-1]
+                if top == pairs[ch]:
+                    stack.pop()
+                else:
                     issues.append({
                         "type": "UnmatchedBracket",
-                        "message": f"Found closing {ch} without opening bracket.",
+                        "message": f"Bracket mismatch: found {ch} but last opening is {top}.",
                         "line": lineno,
                         "col": col + 1,
-                        "suggestion": "Remove the extra closing bracket or add matching opening bracket."
+                        "suggestion": "Fix the matching bracket types."
                     })
-                else:
-                    top, tline, tcol = stack[-1]
-                    if top == pairs[ch]:
-                        stack.pop()
-                    else:
-                        issues.append({
-                            "type": "UnmatchedBracket",
-                            "message": f"Bracket mismatch: found {ch} but last opening is {top}.",
-                            "line": lineno,
-                            "col": col + 1,
-                            "suggestion": "Fix the matching bracket types."
-                        })
-    except Exception:
-        # Fallback parser when tokenizer fails early.
-        for lineno, line in enumerate(code.splitlines(), start=1):
+    if stream.error is not None:
+        # Fallback scan when the tokenizer failed early.
+        for lineno, line in enumerate(stream.lines, start=1):
             for col, ch in enumerate(line, start=1):
                 if ch in "([{":
                     stack.append((ch, lineno, col))
@@ -139,11 +172,11 @@ def detect_unmatched_brackets(code: str) -> List[Dict[str, Any]]:
     return issues
 
 
-def detect_missing_colon(code: str) -> List[Dict[str, Any]]:
+def detect_missing_colon(code: str, stream: Optional[TokenStream] = None) -> List[Dict[str, Any]]:
     """Detect lines missing colon after control or function definitions."""
     issues = []
     keywords = ['def ', 'class ', 'if ', 'elif ', 'else', 'for ', 'while ', 'try', 'except', 'with ']
-    for lineno, raw in enumerate(code.splitlines(), start=1):
+    for lineno, raw in enumerate(_lines(code, stream), start=1):
         line = raw.strip()
         if not line or line.startswith('#'):
             continue
@@ -162,13 +195,13 @@ def detect_missing_colon(code: str) -> List[Dict[str, Any]]:
     return issues
 
 
-def detect_missing_commas(code: str) -> List[Dict[str, Any]]:
+def detect_missing_commas(code: str, stream: Optional[TokenStream] = None) -> List[Dict[str, Any]]:
     """Detect adjacent literal values that Python reports as a likely missing comma."""
     issues = []
     adjacent_number = re.compile(
         r"(?<![\w.])(?:\d+(?:\.\d*)?|\.\d+)\s+(?:\d+(?:\.\d*)?|\.\d+)(?![\w.])"
     )
-    for lineno, raw in enumerate(code.splitlines(), start=1):
+    for lineno, raw in enumerate(_lines(code, stream), start=1):
         code_part = raw.split('#', 1)[0]
         if not any(opening in code_part for opening in "([{"):
             continue
@@ -183,13 +216,13 @@ def detect_missing_commas(code: str) -> List[Dict[str, Any]]:
     return issues
 
 
-def detect_block_indentation_errors(code: str) -> List[Dict[str, Any]]:
+def detect_block_indentation_errors(code: str, stream: Optional[TokenStream] = None) -> List[Dict[str, Any]]:
     """Detect a likely unindented block after Python block-opening lines."""
     issues = []
     header_pattern = re.compile(
         r"^\s*(if|elif|else|for|while|def|class|try|except|finally|with)\b"
     )
-    lines = code.splitlines()
+    lines = _lines(code, stream)
     for index, raw in enumerate(lines):
         code_part = raw.split('#', 1)[0].rstrip()
         if not code_part.endswith(":") or not header_pattern.match(code_part):
@@ -215,20 +248,27 @@ def detect_block_indentation_errors(code: str) -> List[Dict[str, Any]]:
 
 def detect_indentation_errors(code: str) -> List[Dict[str, Any]]:
     """Detect indentation problems using compile()."""
-    issues = []
     try:
         compile(code, '<string>', 'exec')
-    except IndentationError as e:
-        issues.append({
-            "type": "IndentationError",
-            "message": str(e),
-            "line": getattr(e, 'lineno', None),
-            "suggestion": "Check indentation levels (use consistent tabs/spaces; prefer 4 spaces)."
-        })
-    except SyntaxError:
+    except SyntaxError as e:
+        return _indentation_issues(e)
+    return []
+
+
+def _indentation_issues(exc: Optional[Exception]) -> List[Dict[str, Any]]:
+    """The detect_indentation_errors report for a parse failure that is already known."""
+    if not isinstance(exc, IndentationError):
         # Skip non-indentation syntax errors
-        pass
-    return issues
+        return []
+    # Report it the way compile(code, '<string>', 'exec') words it, whichever
+    # parser call raised it.
+    compiled = type(exc)(exc.msg, ('<string>', exc.lineno, exc.offset, exc.text, exc.end_lineno, exc.end_offset))
+    return [{
+        "type": "IndentationError",
+        "message": str(compiled),
+        "line": getattr(exc, 'lineno', None),
+        "suggestion": "Check indentation levels (use consistent tabs/spaces; prefer 4 spaces)."
+    }]
 
 
 def classify_syntax_error(exc: Exception) -> Dict[str, Any]:
@@ -262,18 +302,27 @@ def classify_syntax_error(exc: Exception) -> Dict[str, Any]:
     return info
 
 
-def detect_all(code: str) -> List[Dict[str, Any]]:
-    """Run all detectors and return combined list of issues."""
+def detect_all(code: str, syntax_error: Optional[Exception] = None) -> List[Dict[str, Any]]:
+    """Run all detectors and return combined list of issues.
+
+    The code is tokenized once and parsed at most once. Callers whose own
+    ``ast.parse`` already failed pass that exception as ``syntax_error`` so the
+    code is not parsed again.
+    """
+    stream = TokenStream(code)
+    if syntax_error is None:
+        _, syntax_error = try_ast_parse(code)
+
     issues = []
-    issues += detect_unclosed_quotes(code)
-    issues += detect_unmatched_brackets(code)
-    issues += detect_missing_commas(code)
-    issues += detect_missing_colon(code)
-    issues += detect_block_indentation_errors(code)
-    issues += detect_indentation_errors(code)
-
-    ok, exc = try_ast_parse(code)
-    if not ok and exc is not None:
+    issues += detect_unclosed_quotes(code, stream)
+    issues += detect_unmatched_brackets(code, stream)
+    issues += detect_missing_commas(code, stream)
+    issues += detect_missing_colon(code, stream)
+    issues += detect_block_indentation_errors(code, stream)
+    issues += _indentation_issues(syntax_error)
+
+    exc = syntax_error
+    if exc is not None:
         sp = classify_syntax_error(exc)
         # Avoid duplicates by message
         if all(sp.get("message") != i.get("message") for i in issues):
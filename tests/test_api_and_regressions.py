@@ -27,6 +27,10 @@ def _load_api(
         "RATE_LIMIT_BACKEND": "memory",
         "API_KEYS": None,
         "RATE_LIMIT_REDIS_URL": None,
+        "ANALYSIS_TIME_BUDGET_SECONDS": None,
+        "ANALYSIS_STAGE_BUDGET_SECONDS": None,
+        "ANALYSIS_NODE_BUDGET": None,
+        "MODEL_RELOAD_INTERVAL_SECONDS": None,
     }
     defaults.update(env_overrides)
 
@@ -78,6 +82,193 @@ def test_model_status_prefers_bundle_metadata(monkeypatch: pytest.MonkeyPatch, t
     assert status["expected_sklearn_major_minor"] == "1.7"
 
 
+def _train_tiny_bundle(backend: str):
+    import numpy as np
+    from scipy.sparse import hstack
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.preprocessing import LabelEncoder
+
+    from scripts.retrain_model import build_classifier, fit_classifier
+    from src.feature_utils import extract_numerical_features
+
+    codes = [
+        "x = 1/0", "y = 10 / 0", "def f()\n    pass", "if x\n    y = 1",
+        "print('hi'", "foo(1, 2", "from os import *", "from sys import *",
+        "x = 1", "def f():\n    return 2",
+    ] * 3
+    labels = ["DivisionByZero"] * 2 + ["MissingColon"] * 2 + ["UnmatchedBracket"] * 2 + ["WildcardImport"] * 2 + ["NoError"] * 2
+    le = LabelEncoder()
+    y = le.fit_transform(labels * 3)
+    tfidf = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), max_features=5000, sublinear_tf=True)
+    X = hstack([tfidf.fit_transform(codes), np.array([extract_numerical_features(c) for c in codes])]).tocsr()
+    clf = build_classifier(backend, len(tfidf.vocabulary_), n_jobs=1, early_stopping=False)
+    fit_classifier(backend, clf, X, y, n_jobs=1, early_stopping=False)
+    return clf, le, tfidf, codes
+
+
+@pytest.mark.parametrize("backend", ["gb", "hist", "linear", "forest"])
+def test_compact_model_reproduces_sklearn_predict_proba(backend, tmp_path):
+    import numpy as np
+    from scipy.sparse import hstack
+
+    from src.compact_model import CompactModel, export_compact_model
+    from src.feature_utils import extract_numerical_features
+
+    clf, le, tfidf, codes = _train_tiny_bundle(backend)
+    name = export_compact_model(clf, le, tfidf, str(tmp_path), check_codes=codes)
+    compact = CompactModel.load(str(tmp_path / name))
+
+    assert name.startswith("compact-")
+    assert compact.labels == compact.manifest["labels"] == list(le.classes_)
+    for code in codes + ["while True:\n    pass", ""]:
+        X = hstack([tfidf.transform([code]), np.array([extract_numerical_features(code)])])
+        np.testing.assert_allclose(compact.predict_proba(code), clf.predict_proba(X)[0], rtol=0, atol=1e-9)
+
+
+def _publish_tiny_bundle(model_dir, backend="linear", **metadata):
+    from scripts.retrain_model import write_bundle_metadata
+    from src.compact_model import export_compact_model
+
+    clf, le, tfidf, codes = _train_tiny_bundle(backend)
+    name = export_compact_model(clf, le, tfidf, str(model_dir), check_codes=codes)
+    write_bundle_metadata(str(model_dir), dict(metadata, trainer_backend=backend, compact=name))
+    return le, name
+
+
+def test_write_bundle_metadata_switches_compact_exports(tmp_path):
+    _, first = _publish_tiny_bundle(tmp_path, "linear")
+    (tmp_path / "compact").mkdir()  # unversioned layout of older exports
+    _, second = _publish_tiny_bundle(tmp_path, "forest")
+
+    # The replaced export stays for servers that have not reloaded yet.
+    assert {path.name for path in tmp_path.glob("compact*")} == {first, second}
+
+    _, third = _publish_tiny_bundle(tmp_path, "gb")
+    metadata = json.loads((tmp_path / "bundle_metadata.json").read_text(encoding="utf-8"))
+    assert metadata["compact"] == third
+    assert {path.name for path in tmp_path.glob("compact*")} == {second, third}
+
+
+def _use_model_dir(monkeypatch: pytest.MonkeyPatch, model_dir):
+    import src.ml_engine as ml
+
+    for name in ("active_bundle", "model_loaded", "model_error", "bundle_metadata", "last_reload_error"):
+        monkeypatch.setattr(ml, name, getattr(ml, name))
+    monkeypatch.setattr(ml, "MODEL_DIR", str(model_dir))
+    return ml
+
+
+def test_ml_engine_prefers_compact_export(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    from src.compact_model import export_compact_model
+
+    clf, le, tfidf, codes = _train_tiny_bundle("linear")
+    name = export_compact_model(clf, le, tfidf, str(tmp_path), check_codes=codes)
+    (tmp_path / "bundle_metadata.json").write_text(json.dumps({"compact": name}), encoding="utf-8")
+    ml = _use_model_dir(monkeypatch, tmp_path)
+
+    ml._load_model_bundle()
+
+    assert ml.is_model_available()
+    assert ml.get_model_status()["model_format"] == "compact"
+    assert ml.get_model_status()["bundle_verified"] is False
+    label, confidence = ml.detect_error_ml("x = 1/0")
+    assert label in le.classes_
+    assert 0.0 < confidence <= 1.0
+
+
+def test_ml_engine_verifies_bundle_hashes(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    import numpy as np
+
+    _, name = _publish_tiny_bundle(tmp_path, "linear")
+    ml = _use_model_dir(monkeypatch, tmp_path)
+
+    ml._load_model_bundle()
+    assert ml.is_model_available()
+    assert ml.get_model_status()["bundle_verified"] is True
+    assert isinstance(ml.active_bundle.model.arrays["coef"], np.memmap)
+
+    intercept = tmp_path / name / "intercept.npy"
+    intercept.write_bytes(intercept.read_bytes()[:-1] + b"\x01")
+    ml._load_model_bundle()
+    assert not ml.is_model_available()
+    assert "intercept.npy does not match its sha256" in ml.model_error
+
+
+def test_reload_model_bundle_swaps_only_a_healthy_bundle(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    from src.compact_model import compact_files
+
+    _publish_tiny_bundle(tmp_path, "linear")
+    ml = _use_model_dir(monkeypatch, tmp_path)
+    ml._load_model_bundle()
+    old = ml.active_bundle
+
+    le, name = _publish_tiny_bundle(tmp_path, "forest")
+    result = ml.reload_model_bundle()
+
+    assert result == {"reloaded": True, "version": old.version + 1, "error": None}
+    assert ml.active_bundle.metadata["trainer_backend"] == "forest"
+    assert ml.get_model_status()["bundle_version"] == old.version + 1
+    # A prediction holding the previous bundle still finishes on it.
+    assert old.predict("x = 1/0")[0] in le.classes_
+
+    current = ml.active_bundle
+    array = tmp_path / name / compact_files(str(tmp_path / name))[1]
+    array.write_bytes(array.read_bytes()[:-1] + b"\x01")
+    result = ml.reload_model_bundle()
+
+    assert result["reloaded"] is False
+    assert f"{array.name} does not match its sha256" in result["error"]
+    assert ml.active_bundle is current
+    assert ml.get_model_status()["last_reload_error"] == result["error"]
+    assert ml.detect_error_ml("x = 1/0")[0] in le.classes_
+
+
+def test_model_watcher_reloads_when_bundle_metadata_changes(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    import time
+
+    _publish_tiny_bundle(tmp_path, "linear")
+    ml = _use_model_dir(monkeypatch, tmp_path)
+    ml._load_model_bundle()
+    version = ml.active_bundle.version
+
+    ml.start_model_watcher(0.01)
+    try:
+        _publish_tiny_bundle(tmp_path, "linear", retrained=True)
+        deadline = time.monotonic() + 10
+        while ml.active_bundle.version == version and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        ml.stop_model_watcher()
+
+    assert ml.active_bundle.version == version + 1
+    assert ml.active_bundle.metadata["retrained"] is True
+    for interval in (0, -1, float("nan"), float("inf")):
+        with pytest.raises(ValueError, match="positive number of seconds"):
+            ml.start_model_watcher(interval)
+
+
+def test_admin_reload_model_endpoint(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    ml = _use_model_dir(monkeypatch, tmp_path)
+    open_api = _load_api(monkeypatch, API_AUTH_MODE="disabled")
+    assert TestClient(open_api.app).post("/admin/reload-model").status_code == 404
+
+    api = _load_api(monkeypatch, API_AUTH_MODE="api_key", API_KEYS="secret-key")
+    client = TestClient(api.app)
+
+    assert client.post("/admin/reload-model").status_code == 401
+    rejected = client.post("/admin/reload-model", headers={"X-API-Key": "secret-key"})
+    assert rejected.status_code == 409
+    assert rejected.json()["detail"]["error_code"] == "MODEL_RELOAD_REJECTED"
+
+    _publish_tiny_bundle(tmp_path, "linear")
+    response = client.post("/admin/reload-model", headers={"X-API-Key": "secret-key"})
+
+    assert response.status_code == 200
+    assert response.json()["reloaded"] is True
+    assert ml.is_model_available()
+    assert client.get("/health/capabilities").json()["ml_model_loaded"] is True
+
+
 def test_quality_complexity_baseline():
     analyzer = CodeQualityAnalyzer("x=1", "python")
     assert analyzer.calculate_complexity() == 1
@@ -447,3 +638,132 @@ def test_check_endpoint_reports_python_semantic_errors(monkeypatch: pytest.Monke
     payload = response.json()
     assert payload["predicted_error"] == "DivisionByZero"
     assert payload["has_errors"] is True
+
+
+def test_check_endpoint_payload_matches_error_response_model(monkeypatch: pytest.MonkeyPatch):
+    api = _load_api(monkeypatch, rate_limit="100")
+    client = TestClient(api.app)
+    code = "".join(f"value_{i} = {i} / 0\n" for i in range(50))
+
+    response = client.post("/check", json={"code": code, "filename": "many.py"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload == api.ErrorResponse.model_validate(payload).model_dump()
+    assert len(payload["rule_based_issues"]) >= 50
+
+
+def test_check_endpoint_reports_truncation_under_analysis_budget(monkeypatch: pytest.MonkeyPatch):
+    code = "".join(f"value_{i} = {i} / 0\n" for i in range(50))
+    api = _load_api(monkeypatch, rate_limit="100")
+    assert TestClient(api.app).post("/check", json={"code": code, "filename": "many.py"}).json()["truncated"] is None
+
+    api = _load_api(monkeypatch, rate_limit="100", ANALYSIS_NODE_BUDGET="20")
+    response = TestClient(api.app).post("/check", json={"code": code, "filename": "many.py"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload == api.ErrorResponse.model_validate(payload).model_dump()
+    assert payload["truncated"] == {"stage": "Parsing", "reason": "node_budget", "limit": 20}
+    assert payload["predicted_error"] == "NoError"
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "message"),
+    [
+        ("ANALYSIS_NODE_BUDGET", "-1", "ANALYSIS_NODE_BUDGET must not be negative"),
+        ("ANALYSIS_TIME_BUDGET_SECONDS", "soon", "ANALYSIS_TIME_BUDGET_SECONDS must be a number"),
+        ("ANALYSIS_NODE_BUDGET", "2.5", "ANALYSIS_NODE_BUDGET must be a whole number"),
+        ("ANALYSIS_TIME_BUDGET_SECONDS", "nan", "ANALYSIS_TIME_BUDGET_SECONDS must be a finite number"),
+        ("ANALYSIS_STAGE_BUDGET_SECONDS", "inf", "ANALYSIS_STAGE_BUDGET_SECONDS must be a finite number"),
+        ("MODEL_RELOAD_INTERVAL_SECONDS", "nan", "MODEL_RELOAD_INTERVAL_SECONDS must be a finite number"),
+        ("MODEL_RELOAD_INTERVAL_SECONDS", "0", "MODEL_RELOAD_INTERVAL_SECONDS must be greater than zero"),
+    ],
+)
+def test_malformed_runtime_limits_fail_at_startup(monkeypatch: pytest.MonkeyPatch, key, value, message):
+    with pytest.raises(ValueError, match=message):
+        _load_api(monkeypatch, rate_limit="100", **{key: value})
+
+
+def test_analyze_endpoint_skips_quality_when_analysis_is_truncated(monkeypatch: pytest.MonkeyPatch):
+    code = "".join(f"value_{i} = {i} / 0\n" for i in range(50))
+    api = _load_api(monkeypatch, rate_limit="100", ANALYSIS_NODE_BUDGET="20")
+
+    def _unbounded(*args, **kwargs):
+        raise AssertionError("quality analysis ran past the analysis budget")
+
+    monkeypatch.setattr(api.static_pipeline.CodeQualityAnalyzer, "analyze", _unbounded)
+    response = TestClient(api.app).post("/analyze", json={"code": code, "filename": "many.py"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload == api.AnalyzeResponse.model_validate(payload).model_dump()
+    assert payload["error_detection"]["truncated"] == {"stage": "Parsing", "reason": "node_budget", "limit": 20}
+    assert payload["quality"] is None
+
+
+def test_json_encoding_is_the_same_with_and_without_orjson(monkeypatch: pytest.MonkeyPatch):
+    import numpy as np
+
+    from src import serialization
+
+    assert serialization.HAS_ORJSON, "orjson is a declared requirement"
+    api = _load_api(monkeypatch, rate_limit="100")
+    client = TestClient(api.app)
+    code = "def calculate():\n    numbers = [1, 2 3]\n    ratio = 1 / 0\n    return 'é'\n"
+    requests = [
+        ("/check", {"code": code, "filename": "a.py"}),
+        ("/analyze", {"code": code, "filename": "a.py", "include_fix_preview": True}),
+    ]
+    extra = {"score": np.float64(0.5), "count": np.int64(3), 7: "seven", "weights": np.array([1.5, 2.0])}
+
+    encoded = {}
+    for branch in ("orjson", "json"):
+        if branch == "json":
+            monkeypatch.setattr(serialization, "orjson", None)
+        responses = [client.post(path, json=body) for path, body in requests]
+        assert all(response.status_code == 200 for response in responses)
+        encoded[branch] = [response.content for response in responses] + [serialization.dumps_json(extra)]
+
+    assert encoded["orjson"] == encoded["json"]
+    assert json.loads(encoded["json"][-1]) == {"score": 0.5, "count": 3, "7": "seven", "weights": [1.5, 2.0]}
+
+
+def test_analyze_endpoint_matches_check_and_quality(monkeypatch: pytest.MonkeyPatch):
+    api = _load_api(monkeypatch, rate_limit="100")
+    client = TestClient(api.app)
+    code = "def calculate():\n    numbers = [1, 2 3]\n" + "".join(f"    value_{i} = {i}\n" for i in range(60))
+
+    response = client.post("/analyze", json={"code": code, "filename": "a.py", "include_fix_preview": True})
+
+    assert response.status_code == 200
+    payload = response.json()
+    api.AnalyzeResponse.model_validate(payload)
+    check = client.post("/check", json={"code": code, "filename": "a.py"}).json()
+    quality = client.post("/quality", json={"code": code, "language": "python"}).json()
+    assert payload["error_detection"] == check
+    assert payload["quality"] == quality
+    assert any(item["line"] == 2 and item["kind"] == "replace" for item in payload["fix_preview"])
+    assert client.post("/analyze", json={"code": code, "filename": "a.py"}).json()["fix_preview"] is None
+
+
+def test_analyze_submission_reuses_the_pipeline_parse(monkeypatch: pytest.MonkeyPatch):
+    import ast
+
+    from src.static_pipeline import analyze_submission
+
+    code = "def long_one(x):\n" + "".join(f"    x = x + {i}\n" for i in range(60)) + "    return x\n"
+    parses = []
+    real_parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        if kwargs.get("mode", "exec") == "exec" and not args:
+            parses.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    result = analyze_submission(code, "long.py")
+
+    assert len(parses) == 1
+    assert result["quality"] == CodeQualityAnalyzer(code, "Python").analyze()
+    assert result["quality"]["long_functions"] == ["long_one (62 lines)"]
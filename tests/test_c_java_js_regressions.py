@@ -342,3 +342,25 @@ def test_javascript_invalid_member_access_double_dot_detected():
     )
     result = detect_errors(code, "x.js")
     assert result["predicted_error"] == "MissingDelimiter"
+
+
+def test_fused_c_like_line_scan_matches_standalone_detectors():
+    from src import error_engine as ee
+
+    snippets = {
+        "C": "int main() {\n    int z = 0;\n    int x = 5 / z\n    while (1) { }\n    return x;\n    x++;\n}\n",
+        "Java": 'import ghost.Pkg;\nclass A {\n    int n = "1";\n    void f() { int y = ; return; y = 2; }\n}\n',
+        "JavaScript": "let a = obj..b\nfor (;;) {}\nconst q = 1 % 0;\n",
+    }
+    for language, code in snippets.items():
+        fused = ee._scan_c_like_lines(ee._CLikeSource(code), language)
+        assert fused["missing_semicolon"] == ee._find_missing_semicolon_issues(code, language)
+        assert fused["incomplete_assignment"] == ee._find_incomplete_assignment_issues(code, language)
+        assert fused["invalid_member_access"] == ee._find_invalid_member_access_issues(code, language)
+        assert fused["type_mismatch"] == ee._find_type_mismatch_issues(code, language)
+        assert fused["import_error"] == ee._find_import_error_issues(code, language)
+        assert fused["line_too_long"] == ee._find_line_too_long_issues(code, language)
+        assert fused["division_by_zero"] == ee._find_division_by_zero_issues(code)
+        assert fused["infinite_loop"] == ee._find_infinite_loop_issues(code)
+        assert fused["unreachable_code"] == ee._find_unreachable_code_issues(code)
+        assert sum(map(len, fused.values())) >= 2, language
@@ -3,6 +3,7 @@ Comprehensive Unit Tests for OmniSyntax
 Covers: language detection, syntax checker, error engine, auto-fix,
         quality analyzer, multi-error detector, and feature utils.
 """
+import re
 import unittest
 import sys
 import os
@@ -78,6 +79,22 @@ class TestLanguageDetectorEdgeCases(unittest.TestCase):
         code = "# printf('hi')\nvalue = 1\n"
         self.assertEqual(detect_language(code), "Unknown")
 
+    def test_content_scan_is_bounded_and_memoized(self):
+        """Only a prefix of a large file is scored, and repeats hit the memo."""
+        from src import language_detector
+
+        header = "public class Big {\n    public static void main(String[] args) {}\n"
+        code = header + "    // filler\n" * 5000 + "def tail():\n    elif x:\n"
+        self.assertGreater(len(code), language_detector._CONTENT_SCAN_LIMIT)
+        self.assertEqual(detect_language(code), "Java")
+        hits = language_detector._detect_from_content.cache_info().hits
+        self.assertEqual(detect_language(code), "Java")
+        self.assertEqual(language_detector._detect_from_content.cache_info().hits, hits + 1)
+
+        minified = "// bundle\n" + "const a=1;function f(){console.log(a)};" * 600
+        self.assertGreater(len(minified), language_detector._CONTENT_SCAN_LIMIT)
+        self.assertEqual(detect_language(minified), "JavaScript")
+
     def test_non_string_input_falls_back_to_unknown(self):
         self.assertEqual(detect_language(None), "Unknown")
 
@@ -131,6 +148,33 @@ class TestSyntaxChecker(unittest.TestCase):
         success, error = try_ast_parse(code)
         self.assertFalse(success)
 
+    def test_detect_all_tokenizes_once_and_reuses_parse_error(self):
+        import ast
+        import tokenize
+        from unittest import mock
+
+        code = "def f(:\n    x = [1, 2\n  y = 'open\n"
+        expected = detect_all(code)
+        try:
+            ast.parse(code)
+        except SyntaxError as exc:
+            parse_error = exc
+
+        with mock.patch.object(tokenize, "generate_tokens", wraps=tokenize.generate_tokens) as tokens, \
+                mock.patch.object(ast, "parse", wraps=ast.parse) as parse:
+            self.assertEqual(detect_all(code, parse_error), expected)
+        self.assertEqual(tokens.call_count, 1)
+        self.assertEqual(parse.call_count, 0)
+
+    def test_token_stream_keeps_tokens_and_error_position(self):
+        from src.syntax_checker import TokenStream
+
+        stream = TokenStream("x = (1,\n")
+        self.assertIn("(", [tok.string for tok in stream.tokens])
+        self.assertIsNotNone(stream.error)
+        self.assertEqual(stream.error_position, (2, 0))
+        self.assertIsNone(TokenStream("x = 1\n").error_position)
+
 
 # ==============================================================
 # 3. Error Engine Tests
@@ -289,6 +333,40 @@ class TestQualityAnalyzer(unittest.TestCase):
         report = qa.analyze()
         self.assertIsInstance(report['suggestions'], list)
 
+    def test_metrics_share_one_scan_per_analyzer(self):
+        code = (
+            "public class T {\n"
+            "    // if while for\n"
+            "    public int Bad(int a) { if (a > 0 && a < 9 || a == 3) { return \"else\".length(); } else { return 0; } }\n"
+            "    /* case catch */\n"
+            "    private void ok() { for (;;) { while (true) {} } }\n"
+            "}\n"
+        )
+        qa = CodeQualityAnalyzer(code, "Java")
+        report = qa.analyze()
+        self.assertEqual(report['complexity'], 1 + 6)
+        self.assertEqual(report['naming_issues']['camel_case_violations'], ["Bad"])
+        self.assertEqual(report['line_counts'], {'total': 7, 'code': 4, 'comments': 2, 'blank': 1})
+        headers = qa._definition_headers()
+        self.assertIs(qa._definition_headers(), headers)
+        self.assertEqual(qa.calculate_avg_line_length(), sum(len(l) for l in code.split('\n') if l.strip()) / 6)
+
+    def test_long_python_functions_use_real_extents(self):
+        body = "".join(f"    x = {i}\n" for i in range(55))
+        code = f"def outer():\n    def inner():\n{body.replace('    x', '        x')}        return x\n{body}\n\n\n" + "def short():\n    return 1\n" * 3
+        qa = CodeQualityAnalyzer(code, "Python")
+        self.assertEqual(qa.check_long_functions(), ["outer (113 lines)", "inner (57 lines)"])
+
+    def test_long_java_methods_line_numbers_match_slice_counting(self):
+        code = "public class T {\n" + "".join(
+            f"    public int m{n}(int a) {{\n" + "        a++;\n" * (60 if n % 3 == 0 else 2) + "        return a;\n    }\n"
+            for n in range(9)
+        ) + "}\n"
+        qa = CodeQualityAnalyzer(code, "Java")
+        offsets = [m.start() for m in re.finditer(r"public int", code)]
+        self.assertEqual([qa._line_of(offset) for offset in offsets], [code[:offset].count("\n") for offset in offsets])
+        self.assertEqual(qa.check_long_functions(), ["m0 (63 lines)", "m3 (63 lines)", "m6 (63 lines)"])
+
 
 # ==============================================================
 # 6. Multi-Error Detector Tests
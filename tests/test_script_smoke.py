@@ -1,4 +1,5 @@
-﻿import os
+﻿import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -49,12 +50,98 @@ def test_advanced_metrics_smoke():
     proc = _run(["scripts/advanced_metrics.py", "--smoke"], encoding="utf-8")
     assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
 
+def test_benchmark_engine_smoke():
+    proc = _run(["scripts/benchmark_engine.py", "--smoke"], encoding="utf-8")
+    assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
+    assert "python_many_issues" in proc.stdout
+
+
+def test_benchmark_engine_fails_on_throughput_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    command = ["scripts/benchmark_engine.py", "--smoke", "--scenario", "corpus_python_static"]
+    proc = _run(command + ["--save-baseline", str(baseline)], encoding="utf-8")
+    assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
+
+    payload = json.loads(baseline.read_text(encoding="utf-8"))
+    payload["results"][0]["chars_per_second"] *= 100
+    baseline.write_text(json.dumps(payload), encoding="utf-8")
+    proc = _run(command + ["--baseline", str(baseline)], encoding="utf-8")
+    assert proc.returncode == 1, proc.stderr + "\n" + proc.stdout
+    assert "regressed" in proc.stdout
+
+
+def test_benchmark_engine_growth_curves_smoke(tmp_path):
+    output = tmp_path / "curves.json"
+    plot = tmp_path / "scaling.png"
+    command = ["scripts/benchmark_engine.py", "--curves", "--smoke", "--output", str(output), "--plot", str(plot)]
+    proc = _run(command, encoding="utf-8")
+    assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
+    curves = json.loads(output.read_text(encoding="utf-8"))["curves"]
+    assert {(curve["language"], curve["variant"]) for curve in curves} >= {("Python", "broken"), ("JavaScript", "valid")}
+    assert all(curve["fit"] is not None for curve in curves)
+    assert plot.stat().st_size > 0
+
+
+def test_retrain_model_linear_backend_writes_loadable_bundle(tmp_path):
+    command = [
+        "scripts/retrain_model.py", "--backend", "linear", "--n-jobs", "1",
+        "--model-dir", str(tmp_path), "--feature-cache", str(tmp_path / "features"),
+    ]
+    proc = _run(command, encoding="utf-8")
+    assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
+    assert "Fit (s)" in proc.stdout
+    assert "(built in" in proc.stdout
+    for name in ("syntax_error_model.pkl", "label_encoder.pkl", "tfidf_vectorizer.pkl", "numerical_features.pkl"):
+        assert (tmp_path / name).exists(), name
+    metadata = json.loads((tmp_path / "bundle_metadata.json").read_text(encoding="utf-8"))
+    assert metadata["trainer_backend"] == "linear"
+    assert (tmp_path / metadata["compact"] / "manifest.json").exists()
+    assert f"{metadata['compact']}/manifest.json" in metadata["files"]
+
+    rerun = _run(command + ["--no-save"], encoding="utf-8")
+    assert rerun.returncode == 0, rerun.stderr + "\n" + rerun.stdout
+    assert "(cache in" in rerun.stdout
+
+
 def test_cli_smoke_on_java_fixture():
     proc = _run(["cli.py", "tests/Test.java"], encoding="utf-8")
     assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
     assert "Detected" in proc.stdout
 
 
+def test_cli_run_in_process_matches_printed_report():
+    import cli
+
+    result = cli.run_cli(["tests/Test.java"])
+    assert result.exit_code == 0
+    assert result.language == "Java"
+    assert result.predicted_error == result.detection["predicted_error"]
+    assert f"Detected    : {result.predicted_error}" in result.output
+    assert result.quality is not None
+
+    inline = cli.run_cli(["snippet.py"], code="def f()\n    pass\n")
+    assert inline.language == "Python"
+    assert inline.predicted_error != "NoError"
+    assert cli.run_cli(["tests/missing.java"]).exit_code == 1
+
+
+def test_cli_serve_mode_answers_json_lines():
+    proc = subprocess.run(
+        [PYTHON, "cli.py", "--serve"],
+        cwd=ROOT,
+        input='{"path": "tests/Test.java"}\n{"filename": "a.py", "code": "x = 1\\n", "all_errors": true}\n',
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        timeout=180,
+    )
+    assert proc.returncode == 0, proc.stderr
+    lines = [json.loads(line) for line in proc.stdout.splitlines()]
+    assert lines[0] == {"ready": True}
+    assert [line["language"] for line in lines[1:]] == ["Java", "Python"]
+    assert all(line["exit_code"] == 0 and "elapsed_ms" in line for line in lines[1:])
+
+
 def test_cli_smoke_with_warning_propagation():
     """Verify CLI shows warnings and status info when present."""
     proc = _run(["cli.py", "tests/Test.java"], encoding="utf-8")
@@ -127,3 +214,112 @@ def test_cli_all_errors_smoke_on_java_fixture():
     proc = _run(["cli.py", "tests/Test.java", "--all-errors"], encoding="utf-8")
     assert proc.returncode == 0, proc.stderr + "\n" + proc.stdout
     assert "Total Errors" in proc.stdout
+
+
+def _evaluation_samples():
+    from scripts.evaluate_exhaustive_accuracy import curated_invalid_per_label
+
+    return [smp for smp in curated_invalid_per_label(7) if smp.language == "Python"][:6]
+
+
+def test_checkpoint_run_key_changes_with_mode_seed_and_plan():
+    from scripts.evaluate_exhaustive_accuracy import checkpoint_run_key
+
+    plan = [(smp, False, index == 0) for index, smp in enumerate(_evaluation_samples())]
+    key = checkpoint_run_key("available", 1, plan)
+
+    assert key == checkpoint_run_key("available", 1, list(plan))
+    assert key != checkpoint_run_key("forced_unavailable", 1, plan)
+    assert key != checkpoint_run_key("available", 2, plan)
+    assert key != checkpoint_run_key("available", 1, [(plan[0][0], True, True), *plan[1:]])
+    assert key != checkpoint_run_key("available", 1, plan[:-1])
+
+
+def test_load_checkpoint_drops_a_truncated_last_row(tmp_path):
+    from scripts.evaluate_exhaustive_accuracy import load_checkpoint
+
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text(
+        json.dumps({"run_key": "abc", "mode": "available"}) + "\n"
+        + json.dumps({"sample_id": "one", "core_predicted": "NoError"}) + "\n"
+        + '{"sample_id": "two", "core_pre',
+        encoding="utf-8",
+    )
+
+    assert load_checkpoint(path, "abc") == {"one": {"sample_id": "one", "core_predicted": "NoError"}}
+    assert load_checkpoint(path, "other") == {}
+    assert load_checkpoint(tmp_path / "missing.jsonl", "abc") == {}
+
+
+def test_evaluate_samples_checkpoint_and_workers_match_serial(tmp_path, monkeypatch):
+    from scripts.evaluate_exhaustive_accuracy import evaluate_samples
+
+    monkeypatch.setenv("RATE_LIMIT_PER_MINUTE", "0")
+    monkeypatch.setenv("MAX_CODE_SIZE", "200000")
+    samples = _evaluation_samples()
+    checkpoint = tmp_path / "checkpoint.jsonl"
+
+    def run(**kwargs):
+        return evaluate_samples(samples, "available", 2, True, 2, reload_api=False, seed=3, **kwargs)[0]
+
+    serial = run(checkpoint_path=checkpoint)
+    # Header plus one row per sample.
+    assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == len(samples) + 1
+
+    # A rerun without --resume or --fresh must not wipe the rows already evaluated.
+    before = checkpoint.read_text(encoding="utf-8")
+    with pytest.raises(FileExistsError, match="--resume"):
+        run(checkpoint_path=checkpoint)
+    assert checkpoint.read_text(encoding="utf-8") == before
+
+    assert run(checkpoint_path=checkpoint, resume=True).equals(serial)
+    assert run(checkpoint_path=checkpoint, fresh=True).equals(serial)
+    assert run(workers=2, chunk_size=2).equals(serial)
+
+
+def test_parse_mix_defaults_weight_and_rejects_unknown_endpoints():
+    import argparse
+
+    from scripts.e2e_qa_audit import _parse_mix
+
+    assert _parse_mix("check=3, fix") == {"check": 3, "fix": 1}
+    with pytest.raises(argparse.ArgumentTypeError, match="unknown endpoint 'lint'"):
+        _parse_mix("check=3,lint=1")
+
+
+def test_build_load_requests_is_seeded_and_only_sends_supported_fix_types():
+    import api
+    from scripts.e2e_qa_audit import CASES, DEFAULT_LOAD_MIX, build_load_requests
+
+    requests = build_load_requests(CASES, DEFAULT_LOAD_MIX, 300, seed=5)
+
+    assert requests == build_load_requests(CASES, DEFAULT_LOAD_MIX, 300, seed=5)
+    assert requests != build_load_requests(CASES, DEFAULT_LOAD_MIX, 300, seed=6)
+    assert {endpoint for endpoint, _ in requests} == set(DEFAULT_LOAD_MIX)
+    fix_types = {body["error_type"] for endpoint, body in requests if endpoint == "fix"}
+    assert fix_types and all(api._normalize_fix_type(error_type) == error_type for error_type in fix_types)
+    assert {endpoint for endpoint, _ in build_load_requests(CASES, {"check": 1, "fix": 0}, 20, seed=5)} == {"check"}
+
+
+def test_drive_load_reports_percentiles_and_error_rate():
+    import asyncio
+
+    import httpx
+
+    from scripts.e2e_qa_audit import _drive_load
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/quality":
+            await asyncio.sleep(0.05)
+        return httpx.Response(500 if request.url.path == "/fix" else 200, json={})
+
+    requests = [("check", {})] * 8 + [("quality", {}), ("fix", {})]
+    result = asyncio.run(_drive_load("http://test", requests, 2, transport=httpx.MockTransport(handler)))
+
+    assert result["requests"] == 10
+    assert result["status_counts"] == {"200": 9, "500": 1}
+    assert result["errors_by_endpoint"] == {"fix": 1}
+    assert result["error_rate"] == 0.1
+    # The slow /quality call is the maximum, so only the tail percentile reaches it.
+    assert result["p50_latency_ms"] <= result["p95_latency_ms"] <= result["p99_latency_ms"]
+    assert result["p99_latency_ms"] >= 50.0 > result["p50_latency_ms"]
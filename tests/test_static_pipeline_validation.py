@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import ast
+import json
+import time
+
+import pytest
 
 from scripts.production_validation import run
 from src.auto_fix import AutoFixer
 from src.error_engine import detect_errors
-from src.static_pipeline import ExpressionEvaluator, SymbolTable, analyze_source
+from src.static_pipeline import BUILTIN_SCOPES, AnalysisBudget, ExpressionEvaluator, LineIndex, StaticAnalysisEngine, SymbolTable, analyze_source
 
 
 def test_confidence_outputs_are_calibrated_and_not_constant():
@@ -164,3 +168,160 @@ def test_expression_evaluator_guards_unorderable_operands():
     assert evaluator._compare("10", 0, ast.Gt()) is None
     assert evaluator._compare("10", 0, ast.Eq()) is False
     assert evaluator._compare(3, 1, ast.Gt()) is True
+
+
+def test_expression_evaluator_parses_repeated_text_once(monkeypatch):
+    evaluator = ExpressionEvaluator()
+    symbols = SymbolTable("C")
+    parses: list[str] = []
+    real_parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        parses.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    for _ in range(50):
+        assert evaluator.denominator_states("total / (2 - 2);", symbols)[0].state.name == "ZERO"
+        assert evaluator.evaluate("true && !false", symbols).state.name == "NONZERO"
+        assert evaluator.evaluate("int x = ", symbols).state.name == "UNKNOWN"
+
+    assert len(parses) == 3
+
+
+def test_line_index_matches_splitlines_and_source_segments():
+    code = "x = 1\r\ny = 'é' + \"a\"\n\fz = y\n\nif x:\n    total = (x +\n             y)\n"
+    index = LineIndex(code)
+
+    assert index.lines == code.splitlines()
+    assert [index.stripped(n) for n in range(1, len(index) + 1)] == [line.strip() for line in code.splitlines()]
+    assert index.stripped(0) == "" and index.stripped(len(index) + 1) == ""
+    assert index.first_line_of("total") == 7
+    assert index.first_line_of("tot") == 1
+    for node in ast.walk(ast.parse(code)):
+        assert index.segment(node) == ast.get_source_segment(code, node)
+
+
+def test_snippets_come_from_line_index_on_many_issue_files():
+    code = "".join(f"value_{i} = {i}\n" for i in range(300))
+
+    issues = analyze_source(code, "big.py").issues
+
+    assert len(issues) == 300
+    assert all(issue.snippet == f"value_{issue.line - 1} = {issue.line - 1}" for issue in issues)
+
+
+def test_ir_and_issue_records_are_slotted():
+    result = StaticAnalysisEngine().analyze("int main() {\n    int x = 1 / 0;\n    for (int i = 0; i < 3; i++) {}\n}\n", "a.c")
+    program = result["program"]
+
+    assert program.statements and not any(hasattr(stmt, "__dict__") for stmt in program.statements)
+    assert not hasattr(result["issues"][0], "__dict__")
+    assert result["issues"][0].as_dict()["evidence"][0].keys() == {"kind", "strength", "ambiguity"}
+    assert any(stmt.kind == "loop" and stmt.init == "int i = 0" for stmt in program.statements)
+    assert SymbolTable("C").value_of("missing").state.name == "UNKNOWN"
+
+
+def test_builtin_scope_is_shared_and_not_copied_per_analysis():
+    first = StaticAnalysisEngine().analyze("def print():\n    return len([1])\n", "a.py")["symbols"]
+    second = StaticAnalysisEngine().analyze("x = 1\n", "b.py")["symbols"]
+
+    assert first.builtins is second.builtins is BUILTIN_SCOPES["Python"]
+    assert set(first.symbols) == {"print"} and set(second.symbols) == {"x"}
+    assert "len" in first and first.lookup("len").kind == "builtin"
+    assert first.lookup("print").kind == "function"
+    assert second.value_of("len").state.name == "NONZERO"
+
+
+def test_result_views_share_issue_dicts_and_encode_to_json():
+    analysis = analyze_source("def f():\n    a = 1 / 0\n    b = 2 / 0\n", "f.py")
+
+    single = analysis.to_single_result()
+    grouped = analysis.to_grouped_result()
+
+    assert single["rule_based_issues"] is grouped["rule_based_issues"] is analysis.issue_dicts
+    assert grouped["total_errors"] == len(analysis.issues)
+    assert json.loads(analysis.to_json()) == json.loads(json.dumps(single))
+    assert json.loads(analysis.to_json(grouped=True)) == json.loads(json.dumps(grouped))
+
+
+def test_python_source_is_parsed_and_walked_once_per_analysis(monkeypatch):
+    code = "import os\n\ndef f(items: list = []) -> int:\n    total = 0\n    for item in items:\n        total = total + item / 0\n    return 'x'\n"
+    expected = {(issue.type, issue.line) for issue in analyze_source(code, "f.py").issues}
+    module_parses: list[str] = []
+    module_walks: list[ast.AST] = []
+    real_parse, real_walk = ast.parse, ast.walk
+
+    def counting_parse(source, *args, **kwargs):
+        if kwargs.get("mode", "exec") == "exec" and not args:
+            module_parses.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    def counting_walk(node):
+        if isinstance(node, ast.Module):
+            module_walks.append(node)
+        return real_walk(node)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    monkeypatch.setattr(ast, "walk", counting_walk)
+    issues = analyze_source(code, "f.py").issues
+
+    assert {(issue.type, issue.line) for issue in issues} == expected
+    assert {"MutableDefault", "DivisionByZero", "TypeMismatch"} <= {kind for kind, _ in expected}
+    assert len(module_parses) == 1 and len(module_walks) == 1
+
+
+def test_analysis_budget_returns_partial_results_with_truncated_marker():
+    code = "def f(items):\n    total = 0\n    for item in items:\n        total = total + item / 0\n    return total\n"
+    full = analyze_source(code, "f.py")
+    roomy = analyze_source(code, "f.py", budget=AnalysisBudget(max_seconds=60, stage_seconds=60, max_nodes=10_000))
+
+    assert full.truncated is None and roomy.truncated is None
+    assert [issue.as_dict() for issue in roomy.issues] == full.issue_dicts
+    assert roomy.to_single_result()["truncated"] is None
+
+    small = analyze_source(code, "f.py", budget=AnalysisBudget(max_nodes=5))
+    assert small.truncated == {"stage": "Parsing", "reason": "node_budget", "limit": 5}
+    assert small.issues == [] and small.to_grouped_result()["truncated"] == small.truncated
+    assert small.warnings[-1].startswith("Analysis stopped at Parsing")
+
+    # Unclosed strings and brackets are always reported, even when the time budget is spent.
+    broken = analyze_source("int main() {\n    int x = 1 / 0;\n", "m.c", budget=AnalysisBudget(max_seconds=0))
+    assert broken.truncated == {"stage": "Parsing", "reason": "time_budget", "limit": 0}
+    assert {issue.type for issue in broken.issues} == {"UnmatchedBracket"}
+
+
+@pytest.mark.parametrize(
+    ("filename", "function"),
+    [
+        ("big.py", "def f{i}(a):\n    b = a + {i}\n    if b > 3:\n        return b\n    return a\n\n"),
+        ("big.js", "function f{i}(a) {{\n    let b = a + {i};\n    if (b > 3) {{\n        return b;\n    }}\n    return a;\n}}\n\n"),
+        ("big.c", "int f{i}(int a) {{\n    int b = a + {i};\n    if (b > 3) {{\n        return b;\n    }}\n    return a;\n}}\n\n"),
+    ],
+)
+def test_time_budget_interrupts_parsing(filename, function):
+    code = "".join(function.format(i=i) for i in range(2500))
+    started = time.perf_counter()
+    if filename.endswith(".py"):
+        ast.parse(code)  # one C call, so the budget cannot interrupt it
+    uninterruptible = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = analyze_source(code, filename, budget=AnalysisBudget(max_seconds=0.05))
+    elapsed = time.perf_counter() - started
+
+    assert result.truncated == {"stage": "Parsing", "reason": "time_budget", "limit": 0.05}
+    assert elapsed < uninterruptible + 4 * 0.05
+
+
+def test_c_like_loop_and_usage_scans_keep_whole_file_semantics():
+    code = (
+        "int first(void) {\n    int shared = 1;\n    int lonely = 2;\n"
+        "    while (1) {\n        if (shared) { break; }\n    }\n    return 0;\n}\n\n"
+        "int second(void) {\n    int count = shared;\n    while (1) {\n        count = count + 1;\n    }\n    return count;\n}\n"
+    )
+    issues = {(issue.type, issue.line) for issue in analyze_source(code, "m.c").issues}
+
+    # The break only ends the first loop; a name used in a later function still counts as used.
+    assert issues == {("InfiniteLoop", 12), ("UnusedVariable", 3)}
+